@@ -0,0 +1,182 @@
+"""Deterministic stand-ins for the LLMs, embeddings and data vendors.
+
+Used by the offline benchmarks so they measure the framework itself with no
+network access and no model latency:
+
+- ScriptedChatModel: when tools are bound and the conversation has no tool
+  results yet, calls every bound tool once with fixed arguments; otherwise
+  answers with a fixed report ending in a BUY proposal. Token usage is
+  reported in the response metadata (about four characters per token).
+- FakeEmbeddingsClient: hashes text into a fixed-size vector.
+- register_fixture_vendor(): registers a "fixture" vendor serving fixed data
+  for every method of the vendor registry.
+"""
+
+import hashlib
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+FIXTURE_VENDOR = "fixture"
+TICKER = "NVDA"
+TRADE_DATE = "2024-05-10"
+
+REPORT = (
+    "## Analysis\n\n"
+    + "\n".join(
+        f"- Point {i}: momentum, fundamentals and sentiment are consistent with an upward trend."
+        for i in range(1, 13)
+    )
+    + "\n\n| Aspect | View |\n|---|---|\n| Trend | Bullish |\n| Risk | Moderate |\n\n"
+    "FINAL TRANSACTION PROPOSAL: **BUY**"
+)
+
+
+def _tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def _fixture_argument(name: str, spec: Dict[str, Any]) -> Any:
+    """Fixed value for a tool argument, chosen from its name and type."""
+    if "date" in name:
+        return TRADE_DATE
+    if name in ("symbol", "ticker", "query"):
+        return TICKER
+    if name == "indicator":
+        return "rsi"
+    if name == "freq":
+        return "quarterly"
+    if spec.get("type") == "integer":
+        return 7
+    return TICKER
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Chat model with scripted tool calls and reports."""
+
+    model: str = "scripted"
+    tools: List[Dict[str, Any]] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools, **kwargs):
+        specs = [{"name": tool.name, "args": dict(tool.args)} for tool in tools]
+        return self.model_copy(update={"tools": specs})
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        prompt = "".join(str(message.content) for message in messages)
+        has_tool_results = any(isinstance(message, ToolMessage) for message in messages)
+        if self.tools and not has_tool_results:
+            content = ""
+            tool_calls = [
+                {
+                    "name": spec["name"],
+                    "args": {
+                        name: _fixture_argument(name, arg)
+                        for name, arg in spec["args"].items()
+                    },
+                    "id": f"call_{i}_{spec['name']}",
+                }
+                for i, spec in enumerate(self.tools)
+            ]
+        else:
+            content = REPORT
+            tool_calls = []
+
+        usage = {"input_tokens": _tokens(prompt), "output_tokens": _tokens(content) + 10 * len(tool_calls)}
+        usage["total_tokens"] = usage["input_tokens"] + usage["output_tokens"]
+        message = AIMessage(content=content, tool_calls=tool_calls, usage_metadata=usage)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class FakeEmbeddingsClient:
+    """Replacement for the OpenAI client's embeddings API."""
+
+    dimensions = 64
+
+    def __init__(self):
+        self.embeddings = SimpleNamespace(create=self._create)
+
+    def _create(self, model: str, input: str):
+        digest = hashlib.sha512(input.encode()).digest()
+        vector = [b / 255.0 for b in digest[: self.dimensions]]
+        return SimpleNamespace(data=[SimpleNamespace(embedding=vector)])
+
+
+def install_fake_embeddings():
+    """Make every FinancialSituationMemory embed with FakeEmbeddingsClient."""
+    import tradingagents.agents.utils.memory as memory
+
+    client = FakeEmbeddingsClient()
+    memory._get_openai_client = lambda base_url, api_key: client
+
+
+def _price_csv(days: int = 30) -> str:
+    rows = ["Date,Open,High,Low,Close,Volume"]
+    for i in range(days):
+        close = 100 + (i * 7919 % 23) - 11
+        rows.append(f"2024-04-{1 + i % 28:02d},{close - 1:.2f},{close + 2:.2f},{close - 2:.2f},{close:.2f},{1_000_000 + i * 7_919}")
+    return "\n".join(rows)
+
+
+FIXTURES = {
+    "get_stock_data": f"# Stock data for {TICKER}\n# Total records: 30\n\n" + _price_csv(),
+    "get_indicators": "## rsi values:\n\n" + "\n".join(f"2024-05-{d:02d}: {50 + d * 0.7:.2f}" for d in range(10, 3, -1)),
+    "get_fundamentals": "Market Cap: 2.3T\nPE Ratio: 64.2\nGross Margin: 0.76\nRevenue Growth (YoY): 2.62",
+    "get_balance_sheet": "Total Assets,65728000000\nTotal Liabilities,22750000000\nStockholders Equity,42978000000",
+    "get_cashflow": "Operating Cash Flow,28090000000\nCapital Expenditure,-1069000000\nFree Cash Flow,27021000000",
+    "get_income_statement": "Total Revenue,60922000000\nGross Profit,44301000000\nNet Income,29760000000",
+    "get_news": "\n".join(f"### Headline {i}\nDemand for data center GPUs remains strong (source {i})." for i in range(1, 8)),
+    "get_global_news": "\n".join(f"### Macro {i}\nRates and inflation expectations unchanged (source {i})." for i in range(1, 6)),
+    "get_insider_sentiment": "MSPR: 12.5 (2024-04)\nMSPR: -3.1 (2024-03)",
+    "get_insider_transactions": "2024-04-15 Director SELL 10000 @ 880.00\n2024-03-20 CFO SELL 5000 @ 905.00",
+}
+
+
+def _fixture_implementation(method: str):
+    text = FIXTURES.get(method, f"Fixture data for {method}")
+
+    def implementation(*args, **kwargs) -> str:
+        return text
+
+    implementation.__name__ = f"fixture_{method}"
+    return implementation
+
+
+def register_fixture_vendor(registry=None) -> Dict[str, str]:
+    """Register the fixture vendor for every registry method; returns the data_vendors config."""
+    if registry is None:
+        from tradingagents.dataflows.registry import registry
+
+    for category in registry.categories.values():
+        for method in category["tools"]:
+            if not registry.implementations(method, FIXTURE_VENDOR):
+                registry.register(method, FIXTURE_VENDOR, _fixture_implementation(method))
+    return {category: FIXTURE_VENDOR for category in registry.categories}
+
+
+def offline_config(base: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Config running the graph on the scripted model and fixture vendor."""
+    import copy
+
+    from tradingagents.default_config import DEFAULT_CONFIG
+    from tradingagents.graph.trading_graph import CHAT_MODEL_PROVIDERS
+
+    CHAT_MODEL_PROVIDERS.setdefault("scripted", ("fakes", "ScriptedChatModel"))
+    install_fake_embeddings()
+
+    config = copy.deepcopy(base or DEFAULT_CONFIG)
+    config["llm_provider"] = "scripted"
+    config["deep_think_llm"] = "scripted-deep"
+    config["quick_think_llm"] = "scripted-quick"
+    # Keep embeddings off the OpenAI fallback path (they are faked anyway)
+    config["backend_url"] = "http://localhost:11434/v1"
+    config["data_vendors"] = register_fixture_vendor()
+    config["tool_vendors"] = {}
+    config.setdefault("alpaca_paper_trading", {})["enabled"] = False
+    return config
@@ -0,0 +1,227 @@
+"""Offline benchmark of the framework's own overhead.
+
+Runs the full graph on a scripted fake chat model, fake embeddings and a
+fixture data vendor (see fakes.py), so no network is used and model latency
+is zero. Times graph construction and compile, a full run and each node
+within it, tool routing, memory lookups and state logging, and reports the
+median of several runs. Results can be saved as JSON and compared against
+a saved baseline, failing when a timing regresses beyond the tolerance.
+
+    python benchmarks/framework.py
+    python benchmarks/framework.py --runs 7 --json results/bench.json
+    python benchmarks/framework.py --baseline results/bench.json --tolerance 0.25
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import fakes  # noqa: E402
+
+ANALYSTS = ["market", "social", "news", "fundamentals"]
+
+# Timings below this are too noisy to flag as regressions
+MIN_COMPARABLE_MS = 0.05
+
+
+def median_ms(func: Callable[[], object], runs: int) -> float:
+    """Median wall time of ``func`` in milliseconds, after one warm-up call."""
+    func()
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+@contextlib.contextmanager
+def quiet():
+    """Silence prints from the agents and vendors (their cost is still measured)."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def bench_graph(config: Dict, runs: int) -> Dict[str, float]:
+    from tradingagents.dataflows.config import use_config
+    from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+    results = {}
+    graph = TradingAgentsGraph(ANALYSTS, config=config)
+    results["graph.construct"] = median_ms(lambda: TradingAgentsGraph(ANALYSTS, config=config), runs)
+    results["graph.compile"] = median_ms(lambda: graph.graph_setup.setup_graph(ANALYSTS), runs)
+
+    with quiet():
+        results["run.propagate"] = median_ms(
+            lambda: graph.propagate(fakes.TICKER, fakes.TRADE_DATE), runs
+        )
+
+    # Per-node time: interval between consecutive node updates of a run
+    per_node: Dict[str, List[float]] = defaultdict(list)
+    for _ in range(runs):
+        totals: Dict[str, float] = defaultdict(float)
+        state = graph.propagator.create_initial_state(fakes.TICKER, fakes.TRADE_DATE)
+        args = {**graph.propagator.get_graph_args(), "stream_mode": "updates"}
+        with quiet(), use_config(graph.config):
+            last = time.perf_counter()
+            for update in graph.graph.stream(state, **args):
+                now = time.perf_counter()
+                for node in update:
+                    totals[node] += (now - last) * 1000
+                last = now
+        for node, ms in totals.items():
+            per_node[node].append(ms)
+    for node, times in sorted(per_node.items()):
+        results[f"node.{node}"] = statistics.median(times)
+    return results
+
+
+def bench_routing(config: Dict, calls: int, runs: int) -> Dict[str, float]:
+    from tradingagents.dataflows.config import use_config
+    from tradingagents.dataflows.interface import route_to_vendor, route_to_vendor_batch
+
+    direct = fakes._fixture_implementation("get_stock_data")
+    batch = [
+        {"symbol": fakes.TICKER, "start_date": "2024-04-01", "end_date": fakes.TRADE_DATE}
+    ] * calls
+
+    def routed():
+        for _ in range(calls):
+            route_to_vendor("get_stock_data", fakes.TICKER, "2024-04-01", fakes.TRADE_DATE)
+
+    with quiet(), use_config(config):
+        return {
+            "routing.direct_call": median_ms(lambda: [direct() for _ in range(calls)], runs) / calls,
+            "routing.route_to_vendor": median_ms(routed, runs) / calls,
+            "routing.batch_per_call": median_ms(
+                lambda: route_to_vendor_batch("get_stock_data", batch), runs
+            ) / calls,
+        }
+
+
+def bench_memory(config: Dict, situations: int, runs: int) -> Dict[str, float]:
+    from tradingagents.agents.utils.memory import FinancialSituationMemory
+
+    texts = [f"Situation {i}: {fakes.REPORT[: 200 + i % 300]}" for i in range(situations)]
+    counter = iter(range(1_000_000))
+
+    def add():
+        memory = FinancialSituationMemory(f"bench_memory_{next(counter)}", config)
+        memory.add_situations([(text, "Hold through volatility.") for text in texts])
+        return memory
+
+    memory = add()
+    return {
+        "memory.add_per_situation": median_ms(add, runs) / situations,
+        "memory.get_memories": median_ms(
+            lambda: [memory.get_memories(text, n_matches=2) for text in texts[:50]], runs
+        ) / 50,
+    }
+
+
+def bench_state_log(records: int, runs: int) -> Dict[str, float]:
+    from tradingagents.graph.state_log import StateLogWriter
+
+    record = {
+        "company_of_interest": fakes.TICKER,
+        "market_report": fakes.REPORT,
+        "news_report": fakes.REPORT,
+        "investment_debate_state": {"history": fakes.REPORT * 4, "judge_decision": fakes.REPORT},
+        "final_trade_decision": fakes.REPORT,
+    }
+
+    with tempfile.TemporaryDirectory() as root:
+        counter = iter(range(1_000_000))
+
+        def append_and_flush():
+            writer = StateLogWriter(os.path.join(root, str(next(counter))))
+            for i in range(records):
+                writer.append(fakes.TICKER, f"2024-{1 + i // 28 % 12:02d}-{1 + i % 28:02d}-{i}", record)
+            writer.flush()
+            writer.close()
+
+        append_ms = median_ms(append_and_flush, runs)
+        writer = StateLogWriter(os.path.join(root, "lookup"))
+        for i in range(records):
+            writer.append(fakes.TICKER, str(i), record)
+        writer.flush()
+        lookup_ms = median_ms(lambda: [writer.get(fakes.TICKER, str(i)) for i in range(0, records, 10)], runs)
+        writer.close()
+
+    return {
+        "state_log.append_per_record": append_ms / records,
+        "state_log.get": lookup_ms / len(range(0, records, 10)),
+    }
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], tolerance: float) -> List[str]:
+    """Timings slower than the baseline by more than ``tolerance`` (a fraction)."""
+    regressions = []
+    for name, ms in results.items():
+        base = baseline.get(name)
+        if base is None or max(ms, base) < MIN_COMPARABLE_MS:
+            continue
+        if ms > base * (1 + tolerance):
+            regressions.append(f"{name}: {base:.3f} -> {ms:.3f} ms (+{(ms / base - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--calls", type=int, default=200, help="Routed calls per run")
+    parser.add_argument("--situations", type=int, default=100, help="Memory entries per run")
+    parser.add_argument("--records", type=int, default=200, help="State log records per run")
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown vs baseline")
+    args = parser.parse_args(argv)
+
+    # Runs write their state logs under the working directory
+    workdir = tempfile.mkdtemp(prefix="tradingagents-bench-")
+    os.chdir(workdir)
+    config = fakes.offline_config()
+    config["data_cache_dir"] = os.path.join(workdir, "data_cache")
+
+    results: Dict[str, float] = {}
+    results.update(bench_graph(config, args.runs))
+    results.update(bench_routing(config, args.calls, args.runs))
+    results.update(bench_memory(config, args.situations, args.runs))
+    results.update(bench_state_log(args.records, args.runs))
+
+    print(f"Median of {args.runs} runs (ms):")
+    for name, ms in results.items():
+        print(f"  {name:40s} {ms:10.3f}")
+
+    if args.json:
+        path = os.path.join(REPO_ROOT, args.json) if not os.path.isabs(args.json) else args.json
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        path = os.path.join(REPO_ROOT, args.baseline) if not os.path.isabs(args.baseline) else args.baseline
+        with open(path) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+        print(f"\n{'FAIL' if regressions else 'PASS'}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
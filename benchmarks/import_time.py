@@ -0,0 +1,96 @@
+"""Cold-start import benchmark for the tradingagents package.
+
+Imports a module in fresh interpreters under ``python -X importtime`` and
+reports the median total import time, the slowest modules, and any heavy
+optional dependency that was imported eagerly. Exits non-zero when the
+median misses the target or a lazy dependency is imported, so it can gate CI.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --module cli.main --runs 7 --target-ms 2500
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Fast-start target for importing the graph (median of fresh interpreters)
+TARGET_MS = 2000
+
+# Dependencies that must only be imported when a provider or vendor is used
+LAZY_MODULES = [
+    "langchain_openai",
+    "langchain_anthropic",
+    "langchain_google_genai",
+    "chromadb",
+    "openai",
+    "yfinance",
+    "stockstats",
+    "pandas",
+    "bs4",
+    "tqdm",
+]
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(module: str) -> Tuple[float, Dict[str, Tuple[int, int]]]:
+    """Import a module in a fresh interpreter; return total ms and per-module (self, cumulative) us."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr[-2000:]}")
+
+    timings: Dict[str, Tuple[int, int]] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+
+    return timings[module][1] / 1000, timings
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="tradingagents.graph.trading_graph")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--target-ms", type=float, default=TARGET_MS)
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to list")
+    args = parser.parse_args(argv)
+
+    totals = []
+    timings: Dict[str, Tuple[int, int]] = {}
+    for _ in range(args.runs):
+        total_ms, timings = measure(args.module)
+        totals.append(total_ms)
+
+    median_ms = statistics.median(totals)
+    print(f"import {args.module}")
+    print(
+        f"  median {median_ms:.0f} ms over {args.runs} runs "
+        f"(min {min(totals):.0f}, max {max(totals):.0f}), target {args.target_ms:.0f} ms"
+    )
+
+    print(f"\nSlowest modules by self time (last run):")
+    slowest = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)
+    for name, (self_us, cumulative_us) in slowest[: args.top]:
+        print(f"  {self_us / 1000:8.1f} ms self {cumulative_us / 1000:9.1f} ms total  {name}")
+
+    eager = [name for name in LAZY_MODULES if name in timings]
+    if eager:
+        print(f"\nImported eagerly (should be lazy): {', '.join(eager)}")
+
+    ok = median_ms <= args.target_ms and not eager
+    print(f"\n{'PASS' if ok else 'FAIL'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
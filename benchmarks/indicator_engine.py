@@ -0,0 +1,132 @@
+"""Parity check and benchmark of the NumPy indicator engine against stockstats.
+
+Computes every supported indicator with both engines on synthetic daily
+bars (or on cached price history with --cached), checks that they agree
+within the tolerance, and times stockstats, the NumPy engine one symbol at a
+time, and the NumPy engine on all symbols as one 2-D array. Exits non-zero
+when the engines disagree, so it can gate CI.
+
+    python benchmarks/indicator_engine.py
+    python benchmarks/indicator_engine.py --symbols 100 --days 3900 --runs 5
+    python benchmarks/indicator_engine.py --cached
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from tradingagents.dataflows.indicator_engine import (  # noqa: E402
+    INDICATORS,
+    compute_indicators,
+    compute_many,
+)
+
+# Largest difference allowed between the engines, relative to max(1, |value|)
+TOLERANCE = 1e-8
+
+
+def synthetic_prices(symbols: int, days: int, seed: int = 0) -> Dict[str, pd.DataFrame]:
+    """Random-walk daily bars for several symbols over the same business days."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2010-01-04", periods=days)
+    frames = {}
+    for i in range(symbols):
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, days)))
+        frames[f"SYM{i:03d}"] = pd.DataFrame(
+            {
+                "Date": dates,
+                "Open": close * (1 + rng.normal(0, 0.005, days)),
+                "High": close * (1 + rng.random(days) * 0.02),
+                "Low": close * (1 - rng.random(days) * 0.02),
+                "Close": close,
+                "Volume": rng.integers(100_000, 50_000_000, days).astype(float),
+            }
+        )
+    return frames
+
+
+def cached_prices() -> Dict[str, pd.DataFrame]:
+    from tradingagents.dataflows.indicator_panel import cached_symbols
+    from tradingagents.dataflows.price_cache import cached_price_history
+
+    frames = {symbol: cached_price_history(symbol) for symbol in cached_symbols()}
+    return {symbol: data for symbol, data in frames.items() if data is not None and len(data)}
+
+
+def max_difference(frames: Dict[str, pd.DataFrame]) -> Dict[str, float]:
+    """Largest relative difference between the engines, per indicator."""
+    worst = dict.fromkeys(INDICATORS, 0.0)
+    for data in frames.values():
+        fast = compute_indicators(data, engine="numpy")
+        reference = compute_indicators(data, engine="stockstats")
+        for indicator in INDICATORS:
+            a, b = fast[indicator].values, reference[indicator].values
+            if not np.array_equal(np.isnan(a), np.isnan(b)):
+                worst[indicator] = float("inf")
+                continue
+            valid = ~np.isnan(b)
+            if valid.any():
+                diff = np.abs(a[valid] - b[valid]) / np.maximum(1.0, np.abs(b[valid]))
+                worst[indicator] = max(worst[indicator], float(diff.max()))
+    return worst
+
+
+def timed(func: Callable[[], object], runs: int) -> float:
+    """Median wall time of ``func`` in milliseconds."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--days", type=int, default=3900, help="Bars per symbol (about 15 years)")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--cached", action="store_true", help="Use the cached price history")
+    args = parser.parse_args(argv)
+
+    frames = cached_prices() if args.cached else synthetic_prices(args.symbols, args.days)
+    if not frames:
+        print("No price history to benchmark")
+        return 1
+    rows = sum(len(data) for data in frames.values())
+    print(f"{len(frames)} symbols, {rows} bars, {len(INDICATORS)} indicators")
+
+    print("\nParity with stockstats (max relative difference):")
+    worst = max_difference(frames)
+    for indicator, diff in worst.items():
+        print(f"  {indicator:14s} {diff:.2e}")
+    parity = all(diff <= TOLERANCE for diff in worst.values())
+
+    stockstats_ms = timed(
+        lambda: [compute_indicators(data, engine="stockstats") for data in frames.values()], args.runs
+    )
+    numpy_ms = timed(
+        lambda: [compute_indicators(data, engine="numpy") for data in frames.values()], args.runs
+    )
+    batch_ms = timed(lambda: compute_many(frames), args.runs)
+
+    print(f"\nMedian of {args.runs} runs:")
+    print(f"  stockstats        {stockstats_ms:9.1f} ms")
+    print(f"  numpy per symbol  {numpy_ms:9.1f} ms  ({stockstats_ms / numpy_ms:.1f}x)")
+    print(f"  numpy 2-D batch   {batch_ms:9.1f} ms  ({stockstats_ms / batch_ms:.1f}x)")
+
+    print(f"\n{'PASS' if parity else 'FAIL'}")
+    return 0 if parity else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
 from typing import Optional
+import copy
 import datetime
 import typer
 from pathlib import Path
@@ -18,6 +19,7 @@ from rich.text import Text
 from rich.live import Live
 from rich.table import Table
 from collections import deque
+import threading
 import time
 from rich.tree import Tree
 from rich import box
@@ -26,6 +28,9 @@ from rich.rule import Rule
 
 from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.agents.utils.agent_states import render_history
+from tradingagents.graph.progress import ProgressTracker, extract_content_string
+from tradingagents.dataflows.config import use_config
 from cli.models import AnalystType
 from cli.utils import *
 
@@ -38,137 +43,187 @@ app = typer.Typer(
 )
 
 
+# Display refreshes per second; updates between refreshes are coalesced
+REFRESH_PER_SECOND = 4
+
+# Report panel limits: longer reports are cut, the full text is in the reports dir
+REPORT_PANEL_MAX_LINES = 60
+REPORT_PANEL_MAX_CHARS = 6000
+
+# Messages panel: rows shown and characters per row
+MAX_MESSAGE_ROWS = 12
+MAX_TOOL_ARGS_CHARS = 100
+MAX_MESSAGE_CHARS = 200
+
+# Report section -> title in the report panel
+SECTION_TITLES = {
+    "market_report": "Market Analysis",
+    "sentiment_report": "Social Sentiment",
+    "news_report": "News Analysis",
+    "fundamentals_report": "Fundamentals Analysis",
+    "investment_plan": "Research Team Decision",
+    "trader_investment_plan": "Trading Team Plan",
+    "final_trade_decision": "Portfolio Management Decision",
+}
+
+# Sections of the complete report: (heading, sections, show section titles)
+FINAL_REPORT_GROUPS = [
+    ("Analyst Team Reports", ["market_report", "sentiment_report", "news_report", "fundamentals_report"], True),
+    ("Research Team Decision", ["investment_plan"], False),
+    ("Trading Team Plan", ["trader_investment_plan"], False),
+    ("Portfolio Management Decision", ["final_trade_decision"], False),
+]
+
+# Agents of each team, in display order
+TEAMS = {
+    "Analyst Team": [
+        "Market Analyst",
+        "Social Analyst",
+        "News Analyst",
+        "Fundamentals Analyst",
+    ],
+    "Research Team": ["Bull Researcher", "Bear Researcher", "Research Manager"],
+    "Trading Team": ["Trader"],
+    "Risk Management": ["Risky Analyst", "Neutral Analyst", "Safe Analyst"],
+    "Portfolio Management": ["Portfolio Manager"],
+}
+
+STATUS_COLORS = {
+    "pending": "yellow",
+    "completed": "green",
+    "error": "red",
+}
+
+# Panels of the live layout, re-rendered only when their content changed
+PANELS = ("progress", "messages", "analysis", "footer")
+
+
+def _message_text(content) -> str:
+    """One-line display text of a message, truncated for the messages panel."""
+    content = extract_content_string(content)
+    if len(content) > MAX_MESSAGE_CHARS:
+        content = content[:MAX_MESSAGE_CHARS - 3] + "..."
+    return content
+
+
+def truncate_report(markdown: str, max_lines: int = REPORT_PANEL_MAX_LINES, max_chars: int = REPORT_PANEL_MAX_CHARS) -> str:
+    """The head of a report that fits the report panel, noting what was cut."""
+    lines = markdown.splitlines()
+    head = "\n".join(lines[:max_lines])[:max_chars]
+    if len(head) >= len(markdown):
+        return markdown
+    hidden = len(lines) - head.count("\n") - 1
+    cut = f"{hidden} more lines" if hidden else "the rest of the line"
+    return f"{head}\n\n*… {cut} not shown, see the reports directory for the full text*"
+
+
 # Create a deque to store recent messages with a maximum length
 class MessageBuffer:
+    """Messages, agent statuses and report sections shown by the live display.
+
+    Every update marks the panels it affects as dirty; ``take_dirty()``
+    returns and clears them, so the display re-renders only what changed.
+    The complete report is assembled only when asked for. Updates and
+    renders hold ``lock``, as the live display renders on its own thread.
+    """
+
     def __init__(self, max_length=100):
         self.messages = deque(maxlen=max_length)
         self.tool_calls = deque(maxlen=max_length)
+        # Messages panel rows (time, type, text), in arrival order
+        self.rows = deque(maxlen=MAX_MESSAGE_ROWS)
+        self.row_count = 0
+        self.llm_call_count = 0
+        self.tool_call_count = 0
+        self.spinner_text = None
         self.current_report = None
-        self.final_report = None  # Store the complete final report
-        self.agent_status = {
-            # Analyst Team
-            "Market Analyst": "pending",
-            "Social Analyst": "pending",
-            "News Analyst": "pending",
-            "Fundamentals Analyst": "pending",
-            # Research Team
-            "Bull Researcher": "pending",
-            "Bear Researcher": "pending",
-            "Research Manager": "pending",
-            # Trading Team
-            "Trader": "pending",
-            # Risk Management Team
-            "Risky Analyst": "pending",
-            "Neutral Analyst": "pending",
-            "Safe Analyst": "pending",
-            # Portfolio Management Team
-            "Portfolio Manager": "pending",
-        }
+        self.agent_status = {agent: "pending" for agents in TEAMS.values() for agent in agents}
         self.current_agent = None
-        self.report_sections = {
-            "market_report": None,
-            "sentiment_report": None,
-            "news_report": None,
-            "fundamentals_report": None,
-            "investment_plan": None,
-            "trader_investment_plan": None,
-            "final_trade_decision": None,
-        }
+        self.report_sections = {section: None for section in SECTION_TITLES}
+        self._final_report = None
+        self._dirty = set(PANELS)
+        self.lock = threading.RLock()
 
     def add_message(self, message_type, content):
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        self.messages.append((timestamp, message_type, content))
+        with self.lock:
+            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+            self.messages.append((timestamp, message_type, content))
+            self.rows.append((timestamp, message_type, _message_text(content)))
+            self.row_count += 1
+            if message_type == "Reasoning":
+                self.llm_call_count += 1
+            self._dirty.update(("messages", "footer"))
 
     def add_tool_call(self, tool_name, args):
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        self.tool_calls.append((timestamp, tool_name, args))
+        with self.lock:
+            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+            self.tool_calls.append((timestamp, tool_name, args))
+            # Truncate tool call args if too long
+            if isinstance(args, str) and len(args) > MAX_TOOL_ARGS_CHARS:
+                args = args[:MAX_TOOL_ARGS_CHARS - 3] + "..."
+            self.rows.append((timestamp, "Tool", f"{tool_name}: {args}"))
+            self.row_count += 1
+            self.tool_call_count += 1
+            self._dirty.update(("messages", "footer"))
+
+    def set_spinner(self, text):
+        with self.lock:
+            self.spinner_text = text
+            self._dirty.add("messages")
 
     def update_agent_status(self, agent, status):
-        if agent in self.agent_status:
-            self.agent_status[agent] = status
-            self.current_agent = agent
+        with self.lock:
+            if agent in self.agent_status:
+                if self.agent_status[agent] != status:
+                    self._dirty.add("progress")
+                self.agent_status[agent] = status
+                self.current_agent = agent
 
     def update_report_section(self, section_name, content):
-        if section_name in self.report_sections:
-            self.report_sections[section_name] = content
-            self._update_current_report()
-
-    def _update_current_report(self):
-        # For the panel display, only show the most recently updated section
-        latest_section = None
-        latest_content = None
-
-        # Find the most recently updated section
-        for section, content in self.report_sections.items():
-            if content is not None:
-                latest_section = section
-                latest_content = content
-               
-        if latest_section and latest_content:
-            # Format the current section for display
-            section_titles = {
-                "market_report": "Market Analysis",
-                "sentiment_report": "Social Sentiment",
-                "news_report": "News Analysis",
-                "fundamentals_report": "Fundamentals Analysis",
-                "investment_plan": "Research Team Decision",
-                "trader_investment_plan": "Trading Team Plan",
-                "final_trade_decision": "Portfolio Management Decision",
-            }
-            self.current_report = (
-                f"### {section_titles[latest_section]}\n{latest_content}"
-            )
-
-        # Update the final complete report
-        self._update_final_report()
-
-    def _update_final_report(self):
-        report_parts = []
-
-        # Analyst Team Reports
-        if any(
-            self.report_sections[section]
-            for section in [
-                "market_report",
-                "sentiment_report",
-                "news_report",
-                "fundamentals_report",
-            ]
-        ):
-            report_parts.append("## Analyst Team Reports")
-            if self.report_sections["market_report"]:
-                report_parts.append(
-                    f"### Market Analysis\n{self.report_sections['market_report']}"
-                )
-            if self.report_sections["sentiment_report"]:
-                report_parts.append(
-                    f"### Social Sentiment\n{self.report_sections['sentiment_report']}"
-                )
-            if self.report_sections["news_report"]:
-                report_parts.append(
-                    f"### News Analysis\n{self.report_sections['news_report']}"
-                )
-            if self.report_sections["fundamentals_report"]:
-                report_parts.append(
-                    f"### Fundamentals Analysis\n{self.report_sections['fundamentals_report']}"
-                )
-
-        # Research Team Reports
-        if self.report_sections["investment_plan"]:
-            report_parts.append("## Research Team Decision")
-            report_parts.append(f"{self.report_sections['investment_plan']}")
-
-        # Trading Team Reports
-        if self.report_sections["trader_investment_plan"]:
-            report_parts.append("## Trading Team Plan")
-            report_parts.append(f"{self.report_sections['trader_investment_plan']}")
-
-        # Portfolio Management Decision
-        if self.report_sections["final_trade_decision"]:
-            report_parts.append("## Portfolio Management Decision")
-            report_parts.append(f"{self.report_sections['final_trade_decision']}")
-
-        self.final_report = "\n\n".join(report_parts) if report_parts else None
+        with self.lock:
+            if section_name in self.report_sections:
+                if content == self.report_sections[section_name]:
+                    return
+                self.report_sections[section_name] = content
+                self._final_report = None
+                # The report panel shows the most recently updated section
+                if content:
+                    self.current_report = f"### {SECTION_TITLES[section_name]}\n{content}"
+                self._dirty.update(("analysis", "footer"))
+
+    def reset_reports(self):
+        with self.lock:
+            for section in self.report_sections:
+                self.report_sections[section] = None
+            self.current_report = None
+            self._final_report = None
+            self._dirty.update(("analysis", "footer"))
+
+    @property
+    def final_report(self):
+        """The complete report of all sections so far, or None."""
+        with self.lock:
+            if self._final_report is None:
+                report_parts = []
+                for heading, sections, titled in FINAL_REPORT_GROUPS:
+                    contents = [(s, self.report_sections[s]) for s in sections if self.report_sections[s]]
+                    if not contents:
+                        continue
+                    report_parts.append(f"## {heading}")
+                    for section, content in contents:
+                        report_parts.append(f"### {SECTION_TITLES[section]}\n{content}" if titled else content)
+                self._final_report = "\n\n".join(report_parts) if report_parts else None
+            return self._final_report
+
+    @property
+    def reports_count(self):
+        return sum(1 for content in self.report_sections.values() if content is not None)
+
+    def take_dirty(self):
+        """Panels changed since the last call."""
+        with self.lock:
+            dirty, self._dirty = self._dirty, set()
+            return dirty
 
 
 message_buffer = MessageBuffer()
@@ -187,10 +242,6 @@ def create_layout():
     layout["upper"].split_row(
         Layout(name="progress", ratio=2), Layout(name="messages", ratio=3)
     )
-    return layout
-
-
-def update_display(layout, spinner_text=None):
     # Header with welcome message
     layout["header"].update(
         Panel(
@@ -202,8 +253,18 @@ def update_display(layout, spinner_text=None):
             expand=True,
         )
     )
+    return layout
+
 
-    # Progress panel showing agent status
+def _status_cell(status):
+    if status == "in_progress":
+        return Spinner("dots", text="[blue]in_progress[/blue]", style="bold cyan")
+    status_color = STATUS_COLORS.get(status, "white")
+    return f"[{status_color}]{status}[/{status_color}]"
+
+
+def render_progress():
+    """Progress panel showing agent status."""
     progress_table = Table(
         show_header=True,
         header_style="bold magenta",
@@ -217,63 +278,21 @@ def update_display(layout, spinner_text=None):
     progress_table.add_column("Agent", style="green", justify="center", width=20)
     progress_table.add_column("Status", style="yellow", justify="center", width=20)
 
-    # Group agents by team
-    teams = {
-        "Analyst Team": [
-            "Market Analyst",
-            "Social Analyst",
-            "News Analyst",
-            "Fundamentals Analyst",
-        ],
-        "Research Team": ["Bull Researcher", "Bear Researcher", "Research Manager"],
-        "Trading Team": ["Trader"],
-        "Risk Management": ["Risky Analyst", "Neutral Analyst", "Safe Analyst"],
-        "Portfolio Management": ["Portfolio Manager"],
-    }
-
-    for team, agents in teams.items():
-        # Add first agent with team name
-        first_agent = agents[0]
-        status = message_buffer.agent_status[first_agent]
-        if status == "in_progress":
-            spinner = Spinner(
-                "dots", text="[blue]in_progress[/blue]", style="bold cyan"
+    for team, agents in TEAMS.items():
+        # The team name goes on its first agent's row
+        for i, agent in enumerate(agents):
+            progress_table.add_row(
+                team if i == 0 else "", agent, _status_cell(message_buffer.agent_status[agent])
             )
-            status_cell = spinner
-        else:
-            status_color = {
-                "pending": "yellow",
-                "completed": "green",
-                "error": "red",
-            }.get(status, "white")
-            status_cell = f"[{status_color}]{status}[/{status_color}]"
-        progress_table.add_row(team, first_agent, status_cell)
-
-        # Add remaining agents in team
-        for agent in agents[1:]:
-            status = message_buffer.agent_status[agent]
-            if status == "in_progress":
-                spinner = Spinner(
-                    "dots", text="[blue]in_progress[/blue]", style="bold cyan"
-                )
-                status_cell = spinner
-            else:
-                status_color = {
-                    "pending": "yellow",
-                    "completed": "green",
-                    "error": "red",
-                }.get(status, "white")
-                status_cell = f"[{status_color}]{status}[/{status_color}]"
-            progress_table.add_row("", agent, status_cell)
 
         # Add horizontal line after each team
         progress_table.add_row("─" * 20, "─" * 20, "─" * 20, style="dim")
 
-    layout["progress"].update(
-        Panel(progress_table, title="Progress", border_style="cyan", padding=(1, 2))
-    )
+    return Panel(progress_table, title="Progress", border_style="cyan", padding=(1, 2))
+
 
-    # Messages panel showing recent messages and tool calls
+def render_messages():
+    """Messages panel showing recent messages and tool calls."""
     messages_table = Table(
         show_header=True,
         header_style="bold magenta",
@@ -289,110 +308,76 @@ def update_display(layout, spinner_text=None):
         "Content", style="white", no_wrap=False, ratio=1
     )  # Make content column expand
 
-    # Combine tool calls and messages
-    all_messages = []
-
-    # Add tool calls
-    for timestamp, tool_name, args in message_buffer.tool_calls:
-        # Truncate tool call args if too long
-        if isinstance(args, str) and len(args) > 100:
-            args = args[:97] + "..."
-        all_messages.append((timestamp, "Tool", f"{tool_name}: {args}"))
-
-    # Add regular messages
-    for timestamp, msg_type, content in message_buffer.messages:
-        # Convert content to string if it's not already
-        content_str = content
-        if isinstance(content, list):
-            # Handle list of content blocks (Anthropic format)
-            text_parts = []
-            for item in content:
-                if isinstance(item, dict):
-                    if item.get('type') == 'text':
-                        text_parts.append(item.get('text', ''))
-                    elif item.get('type') == 'tool_use':
-                        text_parts.append(f"[Tool: {item.get('name', 'unknown')}]")
-                else:
-                    text_parts.append(str(item))
-            content_str = ' '.join(text_parts)
-        elif not isinstance(content_str, str):
-            content_str = str(content)
-            
-        # Truncate message content if too long
-        if len(content_str) > 200:
-            content_str = content_str[:197] + "..."
-        all_messages.append((timestamp, msg_type, content_str))
-
-    # Sort by timestamp
-    all_messages.sort(key=lambda x: x[0])
-
-    # Calculate how many messages we can show based on available space
-    # Start with a reasonable number and adjust based on content length
-    max_messages = 12  # Increased from 8 to better fill the space
-
-    # Get the last N messages that will fit in the panel
-    recent_messages = all_messages[-max_messages:]
-
-    # Add messages to table
-    for timestamp, msg_type, content in recent_messages:
+    for timestamp, msg_type, content in message_buffer.rows:
         # Format content with word wrapping
-        wrapped_content = Text(content, overflow="fold")
-        messages_table.add_row(timestamp, msg_type, wrapped_content)
+        messages_table.add_row(timestamp, msg_type, Text(content, overflow="fold"))
 
-    if spinner_text:
-        messages_table.add_row("", "Spinner", spinner_text)
+    if message_buffer.spinner_text:
+        messages_table.add_row("", "Spinner", message_buffer.spinner_text)
 
     # Add a footer to indicate if messages were truncated
-    if len(all_messages) > max_messages:
-        messages_table.footer = (
-            f"[dim]Showing last {max_messages} of {len(all_messages)} messages[/dim]"
+    if message_buffer.row_count > MAX_MESSAGE_ROWS:
+        messages_table.caption = (
+            f"[dim]Showing last {MAX_MESSAGE_ROWS} of {message_buffer.row_count} messages[/dim]"
         )
 
-    layout["messages"].update(
-        Panel(
-            messages_table,
-            title="Messages & Tools",
-            border_style="blue",
-            padding=(1, 2),
-        )
+    return Panel(
+        messages_table,
+        title="Messages & Tools",
+        border_style="blue",
+        padding=(1, 2),
     )
 
-    # Analysis panel showing current report
+
+def render_analysis():
+    """Analysis panel showing the current report, cut to the panel's limits."""
     if message_buffer.current_report:
-        layout["analysis"].update(
-            Panel(
-                Markdown(message_buffer.current_report),
-                title="Current Report",
-                border_style="green",
-                padding=(1, 2),
-            )
-        )
+        content = Markdown(truncate_report(message_buffer.current_report))
     else:
-        layout["analysis"].update(
-            Panel(
-                "[italic]Waiting for analysis report...[/italic]",
-                title="Current Report",
-                border_style="green",
-                padding=(1, 2),
-            )
-        )
+        content = "[italic]Waiting for analysis report...[/italic]"
+    return Panel(content, title="Current Report", border_style="green", padding=(1, 2))
 
-    # Footer with statistics
-    tool_calls_count = len(message_buffer.tool_calls)
-    llm_calls_count = sum(
-        1 for _, msg_type, _ in message_buffer.messages if msg_type == "Reasoning"
-    )
-    reports_count = sum(
-        1 for content in message_buffer.report_sections.values() if content is not None
-    )
 
+def render_footer():
+    """Footer with statistics."""
     stats_table = Table(show_header=False, box=None, padding=(0, 2), expand=True)
     stats_table.add_column("Stats", justify="center")
     stats_table.add_row(
-        f"Tool Calls: {tool_calls_count} | LLM Calls: {llm_calls_count} | Generated Reports: {reports_count}"
+        f"Tool Calls: {message_buffer.tool_call_count} | LLM Calls: {message_buffer.llm_call_count} "
+        f"| Generated Reports: {message_buffer.reports_count}"
     )
+    return Panel(stats_table, border_style="grey50")
+
+
+PANEL_RENDERERS = {
+    "progress": render_progress,
+    "messages": render_messages,
+    "analysis": render_analysis,
+    "footer": render_footer,
+}
+
+
+def update_display(layout, spinner_text=None):
+    """Re-render the panels whose content changed since the last update.
+
+    The live display calls this on each refresh (see ``live_layout``), so
+    the updates between two refreshes are rendered together.
+    """
+    if spinner_text is not None:
+        message_buffer.set_spinner(spinner_text)
+    with message_buffer.lock:
+        for panel in message_buffer.take_dirty():
+            layout[panel].update(PANEL_RENDERERS[panel]())
 
-    layout["footer"].update(Panel(stats_table, border_style="grey50"))
+
+def live_layout(layout):
+    """Renderable source for Live that brings the layout up to date first."""
+
+    def get_renderable():
+        update_display(layout)
+        return layout
+
+    return get_renderable
 
 
 def get_user_selections():
@@ -587,10 +572,11 @@ def display_complete_report(final_state):
         debate_state = final_state["investment_debate_state"]
 
         # Bull Researcher Analysis
-        if debate_state.get("bull_history"):
+        bull_history = render_history(final_state.get("investment_debate_history", []), "Bull")
+        if bull_history:
             research_reports.append(
                 Panel(
-                    Markdown(debate_state["bull_history"]),
+                    Markdown(bull_history),
                     title="Bull Researcher",
                     border_style="blue",
                     padding=(1, 2),
@@ -598,10 +584,11 @@ def display_complete_report(final_state):
             )
 
         # Bear Researcher Analysis
-        if debate_state.get("bear_history"):
+        bear_history = render_history(final_state.get("investment_debate_history", []), "Bear")
+        if bear_history:
             research_reports.append(
                 Panel(
-                    Markdown(debate_state["bear_history"]),
+                    Markdown(bear_history),
                     title="Bear Researcher",
                     border_style="blue",
                     padding=(1, 2),
@@ -651,10 +638,11 @@ def display_complete_report(final_state):
         risk_state = final_state["risk_debate_state"]
 
         # Aggressive (Risky) Analyst Analysis
-        if risk_state.get("risky_history"):
+        risky_history = render_history(final_state.get("risk_debate_history", []), "Risky")
+        if risky_history:
             risk_reports.append(
                 Panel(
-                    Markdown(risk_state["risky_history"]),
+                    Markdown(risky_history),
                     title="Aggressive Analyst",
                     border_style="blue",
                     padding=(1, 2),
@@ -662,10 +650,11 @@ def display_complete_report(final_state):
             )
 
         # Conservative (Safe) Analyst Analysis
-        if risk_state.get("safe_history"):
+        safe_history = render_history(final_state.get("risk_debate_history", []), "Safe")
+        if safe_history:
             risk_reports.append(
                 Panel(
-                    Markdown(risk_state["safe_history"]),
+                    Markdown(safe_history),
                     title="Conservative Analyst",
                     border_style="blue",
                     padding=(1, 2),
@@ -673,10 +662,11 @@ def display_complete_report(final_state):
             )
 
         # Neutral Analyst Analysis
-        if risk_state.get("neutral_history"):
+        neutral_history = render_history(final_state.get("risk_debate_history", []), "Neutral")
+        if neutral_history:
             risk_reports.append(
                 Panel(
-                    Markdown(risk_state["neutral_history"]),
+                    Markdown(neutral_history),
                     title="Neutral Analyst",
                     border_style="blue",
                     padding=(1, 2),
@@ -710,38 +700,27 @@ def display_complete_report(final_state):
             )
 
 
-def update_research_team_status(status):
-    """Update status for all research team members and trader."""
-    research_team = ["Bull Researcher", "Bear Researcher", "Research Manager", "Trader"]
-    for agent in research_team:
-        message_buffer.update_agent_status(agent, status)
-
-def extract_content_string(content):
-    """Extract string content from various message formats."""
-    if isinstance(content, str):
-        return content
-    elif isinstance(content, list):
-        # Handle Anthropic's list format
-        text_parts = []
-        for item in content:
-            if isinstance(item, dict):
-                if item.get('type') == 'text':
-                    text_parts.append(item.get('text', ''))
-                elif item.get('type') == 'tool_use':
-                    text_parts.append(f"[Tool: {item.get('name', 'unknown')}]")
-            else:
-                text_parts.append(str(item))
-        return ' '.join(text_parts)
-    else:
-        return str(content)
+# Progress event type (see ProgressTracker) -> message buffer update
+PROGRESS_EVENT_HANDLERS = {
+    "message": lambda event: message_buffer.add_message(event["message_type"], event["content"]),
+    "tool_call": lambda event: message_buffer.add_tool_call(event["name"], event["args"]),
+    "status": lambda event: message_buffer.update_agent_status(event["agent"], event["status"]),
+    "report": lambda event: message_buffer.update_report_section(event["section"], event["content"]),
+}
+
+
+def apply_progress_event(event):
+    """Apply a progress event from the graph stream to the message buffer."""
+    handler = PROGRESS_EVENT_HANDLERS.get(event["type"])
+    if handler is not None:
+        handler(event)
 
 def run_analysis():
     # First get all user selections
     selections = get_user_selections()
 
     # Create config with selected research depth
-    config = DEFAULT_CONFIG.copy()
-    config["alpaca_paper_trading"] = config.get("alpaca_paper_trading", {}).copy()
+    config = copy.deepcopy(DEFAULT_CONFIG)
     config["max_debate_rounds"] = selections["research_depth"]
     config["max_risk_discuss_rounds"] = selections["research_depth"]
     config["quick_think_llm"] = selections["shallow_thinker"]
@@ -804,7 +783,7 @@ def run_analysis():
     # Now start the display layout
     layout = create_layout()
 
-    with Live(layout, refresh_per_second=4) as live:
+    with Live(layout, refresh_per_second=REFRESH_PER_SECOND, get_renderable=live_layout(layout)) as live:
         # Initial display
         update_display(layout)
 
@@ -824,10 +803,7 @@ def run_analysis():
             message_buffer.update_agent_status(agent, "pending")
 
         # Reset report sections
-        for section in message_buffer.report_sections:
-            message_buffer.report_sections[section] = None
-        message_buffer.current_report = None
-        message_buffer.final_report = None
+        message_buffer.reset_reports()
 
         # Update agent status to in_progress for the first analyst
         first_analyst = f"{selections['analysts'][0].value.capitalize()} Analyst"
@@ -846,240 +822,17 @@ def run_analysis():
         )
         args = graph.propagator.get_graph_args()
 
-        # Stream the analysis
-        trace = []
-        for chunk in graph.graph.stream(init_agent_state, **args):
-            if len(chunk["messages"]) > 0:
-                # Get the last message from the chunk
-                last_message = chunk["messages"][-1]
-
-                # Extract message content and type
-                if hasattr(last_message, "content"):
-                    content = extract_content_string(last_message.content)  # Use the helper function
-                    msg_type = "Reasoning"
-                else:
-                    content = str(last_message)
-                    msg_type = "System"
-
-                # Add message to buffer
-                message_buffer.add_message(msg_type, content)                
-
-                # If it's a tool call, add it to tool calls
-                if hasattr(last_message, "tool_calls"):
-                    for tool_call in last_message.tool_calls:
-                        # Handle both dictionary and object tool calls
-                        if isinstance(tool_call, dict):
-                            message_buffer.add_tool_call(
-                                tool_call["name"], tool_call["args"]
-                            )
-                        else:
-                            message_buffer.add_tool_call(tool_call.name, tool_call.args)
-
-                # Update reports and agent status based on chunk content
-                # Analyst Team Reports
-                if "market_report" in chunk and chunk["market_report"]:
-                    message_buffer.update_report_section(
-                        "market_report", chunk["market_report"]
-                    )
-                    message_buffer.update_agent_status("Market Analyst", "completed")
-                    # Set next analyst to in_progress
-                    if "social" in selections["analysts"]:
-                        message_buffer.update_agent_status(
-                            "Social Analyst", "in_progress"
-                        )
-
-                if "sentiment_report" in chunk and chunk["sentiment_report"]:
-                    message_buffer.update_report_section(
-                        "sentiment_report", chunk["sentiment_report"]
-                    )
-                    message_buffer.update_agent_status("Social Analyst", "completed")
-                    # Set next analyst to in_progress
-                    if "news" in selections["analysts"]:
-                        message_buffer.update_agent_status(
-                            "News Analyst", "in_progress"
-                        )
-
-                if "news_report" in chunk and chunk["news_report"]:
-                    message_buffer.update_report_section(
-                        "news_report", chunk["news_report"]
-                    )
-                    message_buffer.update_agent_status("News Analyst", "completed")
-                    # Set next analyst to in_progress
-                    if "fundamentals" in selections["analysts"]:
-                        message_buffer.update_agent_status(
-                            "Fundamentals Analyst", "in_progress"
-                        )
-
-                if "fundamentals_report" in chunk and chunk["fundamentals_report"]:
-                    message_buffer.update_report_section(
-                        "fundamentals_report", chunk["fundamentals_report"]
-                    )
-                    message_buffer.update_agent_status(
-                        "Fundamentals Analyst", "completed"
-                    )
-                    # Set all research team members to in_progress
-                    update_research_team_status("in_progress")
-
-                # Research Team - Handle Investment Debate State
-                if (
-                    "investment_debate_state" in chunk
-                    and chunk["investment_debate_state"]
-                ):
-                    debate_state = chunk["investment_debate_state"]
-
-                    # Update Bull Researcher status and report
-                    if "bull_history" in debate_state and debate_state["bull_history"]:
-                        # Keep all research team members in progress
-                        update_research_team_status("in_progress")
-                        # Extract latest bull response
-                        bull_responses = debate_state["bull_history"].split("\n")
-                        latest_bull = bull_responses[-1] if bull_responses else ""
-                        if latest_bull:
-                            message_buffer.add_message("Reasoning", latest_bull)
-                            # Update research report with bull's latest analysis
-                            message_buffer.update_report_section(
-                                "investment_plan",
-                                f"### Bull Researcher Analysis\n{latest_bull}",
-                            )
-
-                    # Update Bear Researcher status and report
-                    if "bear_history" in debate_state and debate_state["bear_history"]:
-                        # Keep all research team members in progress
-                        update_research_team_status("in_progress")
-                        # Extract latest bear response
-                        bear_responses = debate_state["bear_history"].split("\n")
-                        latest_bear = bear_responses[-1] if bear_responses else ""
-                        if latest_bear:
-                            message_buffer.add_message("Reasoning", latest_bear)
-                            # Update research report with bear's latest analysis
-                            message_buffer.update_report_section(
-                                "investment_plan",
-                                f"{message_buffer.report_sections['investment_plan']}\n\n### Bear Researcher Analysis\n{latest_bear}",
-                            )
-
-                    # Update Research Manager status and final decision
-                    if (
-                        "judge_decision" in debate_state
-                        and debate_state["judge_decision"]
-                    ):
-                        # Keep all research team members in progress until final decision
-                        update_research_team_status("in_progress")
-                        message_buffer.add_message(
-                            "Reasoning",
-                            f"Research Manager: {debate_state['judge_decision']}",
-                        )
-                        # Update research report with final decision
-                        message_buffer.update_report_section(
-                            "investment_plan",
-                            f"{message_buffer.report_sections['investment_plan']}\n\n### Research Manager Decision\n{debate_state['judge_decision']}",
-                        )
-                        # Mark all research team members as completed
-                        update_research_team_status("completed")
-                        # Set first risk analyst to in_progress
-                        message_buffer.update_agent_status(
-                            "Risky Analyst", "in_progress"
-                        )
-
-                # Trading Team
-                if (
-                    "trader_investment_plan" in chunk
-                    and chunk["trader_investment_plan"]
-                ):
-                    message_buffer.update_report_section(
-                        "trader_investment_plan", chunk["trader_investment_plan"]
-                    )
-                    # Set first risk analyst to in_progress
-                    message_buffer.update_agent_status("Risky Analyst", "in_progress")
-
-                # Risk Management Team - Handle Risk Debate State
-                if "risk_debate_state" in chunk and chunk["risk_debate_state"]:
-                    risk_state = chunk["risk_debate_state"]
-
-                    # Update Risky Analyst status and report
-                    if (
-                        "current_risky_response" in risk_state
-                        and risk_state["current_risky_response"]
-                    ):
-                        message_buffer.update_agent_status(
-                            "Risky Analyst", "in_progress"
-                        )
-                        message_buffer.add_message(
-                            "Reasoning",
-                            f"Risky Analyst: {risk_state['current_risky_response']}",
-                        )
-                        # Update risk report with risky analyst's latest analysis only
-                        message_buffer.update_report_section(
-                            "final_trade_decision",
-                            f"### Risky Analyst Analysis\n{risk_state['current_risky_response']}",
-                        )
-
-                    # Update Safe Analyst status and report
-                    if (
-                        "current_safe_response" in risk_state
-                        and risk_state["current_safe_response"]
-                    ):
-                        message_buffer.update_agent_status(
-                            "Safe Analyst", "in_progress"
-                        )
-                        message_buffer.add_message(
-                            "Reasoning",
-                            f"Safe Analyst: {risk_state['current_safe_response']}",
-                        )
-                        # Update risk report with safe analyst's latest analysis only
-                        message_buffer.update_report_section(
-                            "final_trade_decision",
-                            f"### Safe Analyst Analysis\n{risk_state['current_safe_response']}",
-                        )
-
-                    # Update Neutral Analyst status and report
-                    if (
-                        "current_neutral_response" in risk_state
-                        and risk_state["current_neutral_response"]
-                    ):
-                        message_buffer.update_agent_status(
-                            "Neutral Analyst", "in_progress"
-                        )
-                        message_buffer.add_message(
-                            "Reasoning",
-                            f"Neutral Analyst: {risk_state['current_neutral_response']}",
-                        )
-                        # Update risk report with neutral analyst's latest analysis only
-                        message_buffer.update_report_section(
-                            "final_trade_decision",
-                            f"### Neutral Analyst Analysis\n{risk_state['current_neutral_response']}",
-                        )
-
-                    # Update Portfolio Manager status and final decision
-                    if "judge_decision" in risk_state and risk_state["judge_decision"]:
-                        message_buffer.update_agent_status(
-                            "Portfolio Manager", "in_progress"
-                        )
-                        message_buffer.add_message(
-                            "Reasoning",
-                            f"Portfolio Manager: {risk_state['judge_decision']}",
-                        )
-                        # Update risk report with final decision only
-                        message_buffer.update_report_section(
-                            "final_trade_decision",
-                            f"### Portfolio Manager Decision\n{risk_state['judge_decision']}",
-                        )
-                        # Mark risk analysts as completed
-                        message_buffer.update_agent_status("Risky Analyst", "completed")
-                        message_buffer.update_agent_status("Safe Analyst", "completed")
-                        message_buffer.update_agent_status(
-                            "Neutral Analyst", "completed"
-                        )
-                        message_buffer.update_agent_status(
-                            "Portfolio Manager", "completed"
-                        )
-
-                # Update the display
-                update_display(layout)
-
-            trace.append(chunk)
+        # Stream the analysis; only the latest state is kept
+        tracker = ProgressTracker([analyst.value for analyst in selections["analysts"]])
+        final_state = None
+        with use_config(graph.config):
+            for chunk in graph.graph.stream(init_agent_state, **args):
+                # Live renders the changes at its next refresh
+                for event in tracker.update(chunk):
+                    apply_progress_event(event)
+                final_state = chunk
 
         # Get final state and decision
-        final_state = trace[-1]
         decision = graph.process_signal(final_state["final_trade_decision"])
 
         # Update all agent statuses to completed
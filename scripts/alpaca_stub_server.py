@@ -0,0 +1,232 @@
+"""
+Local stand-in for the Alpaca paper-trading API, for testing order execution
+without credentials or network access.
+
+Implements the endpoints the execution client uses: submitting orders (with
+client_order_id deduplication, like Alpaca), looking orders up by id and by
+client_order_id, the account and open positions. Market orders fill at a
+fixed price after a delay. Failures can be injected to exercise retries:
+a share of requests answered with 503, and submissions that are accepted but
+answered too late for the client's timeout.
+
+    python scripts/alpaca_stub_server.py --port 8765 --fill-delay 1 --error-rate 0.2
+    ALPACA_PAPER_BASE_URL=http://127.0.0.1:8765 python scripts/test_alpaca_paper.py
+
+Import ``serve()`` to run it in-process from a test script.
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+class StubBroker:
+    """Orders, positions and cash of the stub account."""
+
+    def __init__(self, cash: float = 100_000.0, price: float = 100.0, fill_delay: float = 0.5):
+        self.cash = cash
+        self.price = price
+        self.prices: Dict[str, float] = {}
+        self.fill_delay = fill_delay
+        self.orders: Dict[str, Dict[str, Any]] = {}
+        self.by_client_id: Dict[str, str] = {}
+        self.positions: Dict[str, float] = {}
+        self.lock = threading.Lock()
+
+    def _price(self, symbol: str) -> float:
+        return self.prices.get(symbol, self.price)
+
+    def submit(self, payload: Dict[str, Any]):
+        """The new order, or None if its client_order_id is already taken."""
+        client_order_id = payload.get("client_order_id") or uuid.uuid4().hex
+        with self.lock:
+            if client_order_id in self.by_client_id:
+                return None
+            order = {
+                "id": uuid.uuid4().hex,
+                "client_order_id": client_order_id,
+                "symbol": payload["symbol"].upper(),
+                "side": payload["side"],
+                "type": payload.get("type", "market"),
+                "time_in_force": payload.get("time_in_force", "day"),
+                "qty": payload.get("qty"),
+                "notional": payload.get("notional"),
+                "limit_price": payload.get("limit_price"),
+                "status": "accepted",
+                "filled_qty": "0",
+                "filled_avg_price": None,
+                "submitted_at": datetime.now(timezone.utc).isoformat(),
+                "_fill_at": time.monotonic() + self.fill_delay,
+            }
+            self.orders[order["id"]] = order
+            self.by_client_id[client_order_id] = order["id"]
+            return self._public(order)
+
+    def _fill_due(self):
+        now = time.monotonic()
+        for order in self.orders.values():
+            if order["status"] != "accepted" or now < order["_fill_at"]:
+                continue
+            price = self._price(order["symbol"])
+            if order["type"] == "limit":
+                limit = float(order["limit_price"])
+                if (order["side"] == "buy" and price > limit) or (order["side"] == "sell" and price < limit):
+                    continue
+            qty = float(order["qty"]) if order["qty"] is not None else float(order["notional"]) / price
+            sign = 1 if order["side"] == "buy" else -1
+            self.positions[order["symbol"]] = self.positions.get(order["symbol"], 0.0) + sign * qty
+            if abs(self.positions[order["symbol"]]) < 1e-9:
+                del self.positions[order["symbol"]]
+            self.cash -= sign * qty * price
+            order.update(status="filled", filled_qty=str(qty), filled_avg_price=str(price))
+
+    @staticmethod
+    def _public(order: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: value for key, value in order.items() if not key.startswith("_")}
+
+    def get(self, order_id: Optional[str] = None, client_order_id: Optional[str] = None):
+        with self.lock:
+            self._fill_due()
+            if client_order_id is not None:
+                order_id = self.by_client_id.get(client_order_id)
+            order = self.orders.get(order_id)
+            return None if order is None else self._public(order)
+
+    def account(self) -> Dict[str, Any]:
+        with self.lock:
+            self._fill_due()
+            equity = self.cash + sum(qty * self._price(symbol) for symbol, qty in self.positions.items())
+            return {
+                "id": "stub-account",
+                "status": "ACTIVE",
+                "currency": "USD",
+                "cash": str(round(self.cash, 2)),
+                "equity": str(round(equity, 2)),
+                "buying_power": str(round(max(self.cash, 0.0) * 2, 2)),
+            }
+
+    def position_list(self):
+        with self.lock:
+            self._fill_due()
+            return [
+                {
+                    "symbol": symbol,
+                    "qty": str(qty),
+                    "side": "long" if qty > 0 else "short",
+                    "current_price": str(self._price(symbol)),
+                    "market_value": str(round(qty * self._price(symbol), 2)),
+                }
+                for symbol, qty in sorted(self.positions.items())
+            ]
+
+
+def make_handler(broker: StubBroker, error_rate: float = 0.0, slow_every: int = 0, slow_s: float = 15.0):
+    """Request handler class serving ``broker``.
+
+    ``error_rate``: share of requests answered with 503. ``slow_every``: every
+    n-th order submission is accepted but answered after ``slow_s`` seconds.
+    """
+    submissions = iter(range(1, 1 << 62))
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status: int, body: Any):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            try:
+                self.end_headers()
+                self.wfile.write(data)
+            except (BrokenPipeError, ConnectionResetError):
+                # The client gave up waiting (a late answer); it retries
+                pass
+
+        def _failed(self) -> bool:
+            if error_rate and random.random() < error_rate:
+                self._send(503, {"message": "service unavailable (injected)"})
+                return True
+            return False
+
+        def do_POST(self):
+            if self._failed():
+                return
+            if urlparse(self.path).path != "/v2/orders":
+                return self._send(404, {"message": "not found"})
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            order = broker.submit(payload)
+            if order is None:
+                return self._send(422, {"code": 40010001, "message": "client_order_id must be unique"})
+            if slow_every and next(submissions) % slow_every == 0:
+                time.sleep(slow_s)
+            self._send(200, order)
+
+        def do_GET(self):
+            if self._failed():
+                return
+            url = urlparse(self.path)
+            if url.path == "/v2/account":
+                return self._send(200, broker.account())
+            if url.path == "/v2/positions":
+                return self._send(200, broker.position_list())
+            if url.path == "/v2/orders:by_client_order_id":
+                client_order_id = parse_qs(url.query).get("client_order_id", [None])[0]
+                order = broker.get(client_order_id=client_order_id)
+            elif url.path.startswith("/v2/orders/"):
+                order = broker.get(order_id=url.path.rsplit("/", 1)[-1])
+            else:
+                return self._send(404, {"message": "not found"})
+            if order is None:
+                return self._send(404, {"message": "order not found"})
+            self._send(200, order)
+
+    return Handler
+
+
+def serve(port: int = 0, broker: Optional[StubBroker] = None, **options):
+    """Start the stub on a background thread; returns (server, broker).
+
+    Port 0 picks a free port (see ``server.server_address``). Stop it with
+    ``server.shutdown()``.
+    """
+    broker = broker or StubBroker()
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(broker, **options))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, broker
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stub of the Alpaca paper-trading API")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--cash", type=float, default=100_000.0)
+    parser.add_argument("--price", type=float, default=100.0, help="Fill price of every symbol")
+    parser.add_argument("--fill-delay", type=float, default=0.5, help="Seconds until an order fills")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 503")
+    parser.add_argument("--slow-every", type=int, default=0, help="Answer every n-th submission late")
+    parser.add_argument("--slow-s", type=float, default=15.0, help="Delay of late answers in seconds")
+    args = parser.parse_args()
+
+    broker = StubBroker(cash=args.cash, price=args.price, fill_delay=args.fill_delay)
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", args.port),
+        make_handler(broker, error_rate=args.error_rate, slow_every=args.slow_every, slow_s=args.slow_s),
+    )
+    print(f"Alpaca stub listening on http://127.0.0.1:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
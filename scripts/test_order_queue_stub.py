@@ -0,0 +1,100 @@
+"""
+Order queue check against the local Alpaca stub (no credentials, network or LLMs).
+
+Queues decisions for many symbols, submits them concurrently through
+OrderQueue.submit() while the stub answers some requests with 503 and some
+submissions too late for the client's timeout, then waits for the fills.
+Checks that every order reached the stub exactly once, that all of them
+filled, and that a later decision for a symbol already submitted is skipped
+rather than sent again.
+
+    python scripts/test_order_queue_stub.py --symbols 30 --error-rate 0.3 --slow-every 4
+
+Exits with status 1 when a check fails.
+"""
+
+import argparse
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+for path in (ROOT, ROOT / "scripts"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from alpaca_stub_server import StubBroker, serve  # noqa: E402
+from tradingagents.execution import AlpacaPaperClient, OrderQueue  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check OrderQueue against the Alpaca stub")
+    parser.add_argument("--symbols", type=int, default=30)
+    parser.add_argument("--error-rate", type=float, default=0.3, help="Share of requests answered with 503")
+    parser.add_argument("--slow-every", type=int, default=4, help="Answer every n-th submission late")
+    parser.add_argument("--slow-s", type=float, default=1.0, help="Delay of late answers in seconds")
+    parser.add_argument("--timeout", type=float, default=0.5, help="Client request timeout in seconds")
+    args = parser.parse_args()
+
+    broker = StubBroker(fill_delay=0.2)
+    server, broker = serve(
+        0, broker, error_rate=args.error_rate, slow_every=args.slow_every, slow_s=args.slow_s
+    )
+    client = AlpacaPaperClient(
+        {
+            "enabled": True,
+            "api_key": "stub",
+            "api_secret": "stub",
+            "base_url": f"http://127.0.0.1:{server.server_address[1]}",
+            "timeout": args.timeout,
+            "max_retries": 6,
+            "backoff_s": 0.05,
+        }
+    )
+    queue = OrderQueue(client)
+    failures = []
+
+    try:
+        decisions = ["BUY", "SELL", "HOLD"]
+        for i in range(args.symbols):
+            queue.add(f"STUB{i}", decisions[i % len(decisions)], qty=1)
+        expected = {order.client_order_id for order in queue.orders.values()}
+
+        started = time.perf_counter()
+        rounds = 0
+        while queue.pending() and rounds < 5:
+            rounds += 1
+            queue.submit()
+        print(f"Submitted {len(expected)} orders in {rounds} round(s), {time.perf_counter() - started:.2f}s")
+
+        orders = queue.wait_for_fills(timeout=30, poll_interval=0.2)
+        print("Order statuses:", dict(Counter(order.status for order in orders)))
+
+        late = queue.add("STUB0", "SELL", qty=1)
+        print("Later decision for a submitted symbol:", late.status, "-", late.error)
+
+        sent = Counter(order["client_order_id"] for order in broker.orders.values())
+        duplicates = sorted(cid for cid, count in sent.items() if count > 1)
+        if duplicates:
+            failures.append(f"duplicated orders: {duplicates}")
+        if set(sent) != expected:
+            failures.append(f"orders missing at the stub: {sorted(expected - set(sent))}")
+        unfilled = [order.symbol for order in orders if order.status != "filled"]
+        if unfilled:
+            failures.append(f"orders not filled: {unfilled}")
+        if late.status != "skipped":
+            failures.append(f"the later decision was {late.status}, not skipped")
+    finally:
+        server.shutdown()
+        client.close()
+
+    for failure in failures:
+        print("FAIL:", failure)
+    if failures:
+        sys.exit(1)
+    print("OK: every order reached the stub once and filled")
+
+
+if __name__ == "__main__":
+    main()
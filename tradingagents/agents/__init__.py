@@ -1,6 +1,8 @@
 from .utils.agent_utils import create_msg_delete
 from .utils.agent_states import AgentState, InvestDebateState, RiskDebateState
 from .utils.memory import FinancialSituationMemory
+from .utils.context_budget import ContextBudget, create_context_budgeter
+from .utils.consensus import create_consensus_gate
 
 from .analysts.fundamentals_analyst import create_fundamentals_analyst
 from .analysts.market_analyst import create_market_analyst
@@ -18,9 +20,13 @@ from .managers.research_manager import create_research_manager
 from .managers.risk_manager import create_risk_manager
 
 from .trader.trader import create_trader
+from .trader.fast_track import create_fast_decider
 
 __all__ = [
     "FinancialSituationMemory",
+    "ContextBudget",
+    "create_context_budgeter",
+    "create_consensus_gate",
     "AgentState",
     "create_msg_delete",
     "InvestDebateState",
@@ -37,4 +43,5 @@ __all__ = [
     "create_safe_debator",
     "create_social_media_analyst",
     "create_trader",
+    "create_fast_decider",
 ]
@@ -1,10 +1,12 @@
 import time
 import json
 
+from tradingagents.agents.utils.agent_states import render_history
 
-def create_research_manager(llm, memory):
+
+def create_research_manager(llm, memory, budget=None):
     def research_manager_node(state) -> dict:
-        history = state["investment_debate_state"].get("history", "")
+        history = state["investment_debate_history"]
         market_research_report = state["market_report"]
         sentiment_report = state["sentiment_report"]
         news_report = state["news_report"]
@@ -19,6 +21,11 @@ def create_research_manager(llm, memory):
         for i, rec in enumerate(past_memories, 1):
             past_memory_str += rec["recommendation"] + "\n\n"
 
+        if budget is not None:
+            prompt_history = budget.window_history(history)
+        else:
+            prompt_history = render_history(history)
+
         prompt = f"""As the portfolio manager and debate facilitator, your role is to critically evaluate this round of debate and make a definitive decision: align with the bear analyst, the bull analyst, or choose Hold only if it is strongly justified based on the arguments presented.
 
 Summarize the key points from both sides concisely, focusing on the most compelling evidence or reasoning. Your recommendation—Buy, Sell, or Hold—must be clear and actionable. Avoid defaulting to Hold simply because both sides have valid points; commit to a stance grounded in the debate's strongest arguments.
@@ -35,16 +42,12 @@ Here are your past reflections on mistakes:
 
 Here is the debate:
 Debate History:
-{history}"""
+{prompt_history}"""
         response = llm.invoke(prompt)
 
         new_investment_debate_state = {
             "judge_decision": response.content,
-            "history": investment_debate_state.get("history", ""),
-            "bear_history": investment_debate_state.get("bear_history", ""),
-            "bull_history": investment_debate_state.get("bull_history", ""),
             "current_response": response.content,
-            "count": investment_debate_state["count"],
         }
 
         return {
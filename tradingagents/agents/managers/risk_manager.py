@@ -1,13 +1,15 @@
 import time
 import json
 
+from tradingagents.agents.utils.agent_states import render_history
 
-def create_risk_manager(llm, memory):
+
+def create_risk_manager(llm, memory, budget=None):
     def risk_manager_node(state) -> dict:
 
         company_name = state["company_of_interest"]
 
-        history = state["risk_debate_state"]["history"]
+        history = state["risk_debate_history"]
         risk_debate_state = state["risk_debate_state"]
         market_research_report = state["market_report"]
         news_report = state["news_report"]
@@ -22,6 +24,11 @@ def create_risk_manager(llm, memory):
         for i, rec in enumerate(past_memories, 1):
             past_memory_str += rec["recommendation"] + "\n\n"
 
+        if budget is not None:
+            prompt_history = budget.window_history(history)
+        else:
+            prompt_history = render_history(history)
+
         prompt = f"""As the Risk Management Judge and Debate Facilitator, your goal is to evaluate the debate between three risk analysts—Risky, Neutral, and Safe/Conservative—and determine the best course of action for the trader. Your decision must result in a clear recommendation: Buy, Sell, or Hold. Choose Hold only if strongly justified by specific arguments, not as a fallback when all sides seem valid. Strive for clarity and decisiveness.
 
 Guidelines for Decision-Making:
@@ -37,7 +44,7 @@ Deliverables:
 ---
 
 **Analysts Debate History:**  
-{history}
+{prompt_history}
 
 ---
 
@@ -47,15 +54,7 @@ Focus on actionable insights and continuous improvement. Build on past lessons,
 
         new_risk_debate_state = {
             "judge_decision": response.content,
-            "history": risk_debate_state["history"],
-            "risky_history": risk_debate_state["risky_history"],
-            "safe_history": risk_debate_state["safe_history"],
-            "neutral_history": risk_debate_state["neutral_history"],
             "latest_speaker": "Judge",
-            "current_risky_response": risk_debate_state["current_risky_response"],
-            "current_safe_response": risk_debate_state["current_safe_response"],
-            "current_neutral_response": risk_debate_state["current_neutral_response"],
-            "count": risk_debate_state["count"],
         }
 
         return {
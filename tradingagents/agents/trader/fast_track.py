@@ -0,0 +1,56 @@
+from tradingagents.agents.utils.context_budget import REPORT_KEYS, REPORT_TITLES
+
+
+def create_fast_decider(llm, memory, budget=None):
+    def fast_decision_node(state) -> dict:
+        company_name = state["company_of_interest"]
+        consensus = state["analyst_consensus"]
+
+        reports = []
+        for key in REPORT_KEYS:
+            report = state.get(key)
+            if not report:
+                continue
+            if budget is not None:
+                report = budget.truncate(report, budget.report_tokens)
+            reports.append(f"{REPORT_TITLES[key].capitalize()}: {report}")
+        reports_str = "\n\n".join(reports)
+
+        curr_situation = "\n\n".join(state.get(key, "") for key in REPORT_KEYS)
+        past_memories = memory.get_memories(curr_situation, n_matches=2)
+
+        past_memory_str = ""
+        for i, rec in enumerate(past_memories, 1):
+            past_memory_str += rec["recommendation"] + "\n\n"
+        if not past_memory_str:
+            past_memory_str = "No past memories found."
+
+        prompt = f"""You are the trader and risk manager for {company_name}. Every analyst on the team independently reached the same {consensus["direction"]} view, so the usual bull/bear and risk debates have been skipped. Your job is to turn this consensus into a final, risk-aware trading decision.
+
+1. **Sanity-check the consensus**: Confirm the analysts' reasoning holds together, and call out any risk the reports overlook.
+2. **Trading plan**: Give a concrete plan: entry, position sizing, and the conditions that would invalidate the view.
+3. **Risk assessment**: Briefly weigh the aggressive, conservative and neutral perspectives on this position.
+4. **Learn from past mistakes**: Use these lessons from similar situations: {past_memory_str}
+
+You may still recommend HOLD or the opposite direction if the reports do not support the consensus. Always conclude your response with 'FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL**'.
+
+Analyst reports:
+{reports_str}"""
+
+        response = llm.invoke(prompt)
+
+        return {
+            "investment_debate_state": {
+                "judge_decision": response.content,
+                "current_response": response.content,
+            },
+            "investment_plan": response.content,
+            "trader_investment_plan": response.content,
+            "risk_debate_state": {
+                "judge_decision": response.content,
+                "latest_speaker": "Judge",
+            },
+            "final_trade_decision": response.content,
+        }
+
+    return fast_decision_node
@@ -1,38 +1,26 @@
-from typing import Annotated, Sequence
+import operator
+from typing import Annotated, List, Sequence
 from datetime import date, timedelta, datetime
 from typing_extensions import TypedDict, Optional
-from langchain_openai import ChatOpenAI
-from tradingagents.agents import *
 from langgraph.prebuilt import ToolNode
 from langgraph.graph import END, StateGraph, START, MessagesState
 
 
-# Researcher team state
+# A single argument made during a debate
+class DebateTurn(TypedDict):
+    speaker: Annotated[str, "Debater that made the argument, e.g. Bull or Risky"]
+    content: Annotated[str, "Argument text"]
+
+
+# Researcher team state (the transcript is AgentState.investment_debate_history)
 class InvestDebateState(TypedDict):
-    bull_history: Annotated[
-        str, "Bullish Conversation history"
-    ]  # Bullish Conversation history
-    bear_history: Annotated[
-        str, "Bearish Conversation history"
-    ]  # Bullish Conversation history
-    history: Annotated[str, "Conversation history"]  # Conversation history
     current_response: Annotated[str, "Latest response"]  # Last response
     judge_decision: Annotated[str, "Final judge decision"]  # Last response
     count: Annotated[int, "Length of the current conversation"]  # Conversation length
 
 
-# Risk management team state
+# Risk management team state (the transcript is AgentState.risk_debate_history)
 class RiskDebateState(TypedDict):
-    risky_history: Annotated[
-        str, "Risky Agent's Conversation history"
-    ]  # Conversation history
-    safe_history: Annotated[
-        str, "Safe Agent's Conversation history"
-    ]  # Conversation history
-    neutral_history: Annotated[
-        str, "Neutral Agent's Conversation history"
-    ]  # Conversation history
-    history: Annotated[str, "Conversation history"]  # Conversation history
     latest_speaker: Annotated[str, "Analyst that spoke last"]
     current_risky_response: Annotated[
         str, "Latest response by the risky analyst"
@@ -47,6 +35,22 @@ class RiskDebateState(TypedDict):
     count: Annotated[int, "Length of the current conversation"]  # Conversation length
 
 
+def merge_debate_state(current: dict, update: dict) -> dict:
+    """Reducer for debate states: overwrite the fields present in the update."""
+    if not current:
+        return dict(update)
+    return {**current, **update}
+
+
+def render_history(turns: List[DebateTurn], speaker: Optional[str] = None) -> str:
+    """Render debate turns as a transcript, optionally for a single speaker."""
+    return "\n".join(
+        f"{turn['speaker']} Analyst: {turn['content']}"
+        for turn in turns
+        if speaker is None or turn["speaker"] == speaker
+    )
+
+
 class AgentState(MessagesState):
     company_of_interest: Annotated[str, "Company that we are interested in trading"]
     trade_date: Annotated[str, "What date we are trading at"]
@@ -60,10 +64,21 @@ class AgentState(MessagesState):
         str, "Report from the News Researcher of current world affairs"
     ]
     fundamentals_report: Annotated[str, "Report from the Fundamentals Researcher"]
+    compressed_reports: Annotated[
+        dict, "Token-budgeted versions of the analyst reports used in debate prompts"
+    ]
+    analyst_consensus: Annotated[
+        dict, "Per-report stances and how strongly the analysts agree"
+    ]
 
     # researcher team discussion step
     investment_debate_state: Annotated[
-        InvestDebateState, "Current state of the debate on if to invest or not"
+        InvestDebateState,
+        "Current state of the debate on if to invest or not",
+        merge_debate_state,
+    ]
+    investment_debate_history: Annotated[
+        List[DebateTurn], "Turns of the investment debate, in order", operator.add
     ]
     investment_plan: Annotated[str, "Plan generated by the Analyst"]
 
@@ -71,6 +86,11 @@ class AgentState(MessagesState):
 
     # risk management team discussion step
     risk_debate_state: Annotated[
-        RiskDebateState, "Current state of the debate on evaluating risk"
+        RiskDebateState,
+        "Current state of the debate on evaluating risk",
+        merge_debate_state,
+    ]
+    risk_debate_history: Annotated[
+        List[DebateTurn], "Turns of the risk debate, in order", operator.add
     ]
     final_trade_decision: Annotated[str, "Final decision made by the Risk Analysts"]
@@ -0,0 +1,72 @@
+import re
+from typing import Dict
+
+from tradingagents.agents.utils.context_budget import REPORT_KEYS
+
+
+BULLISH_TERMS = {
+    "bullish", "buy", "upside", "outperform", "overweight", "uptrend", "upgrade",
+    "accumulate", "breakout", "beat", "beats", "rally", "strong", "strength",
+    "growth", "positive", "optimistic", "momentum", "undervalued", "tailwind",
+    "tailwinds", "golden",
+}
+
+BEARISH_TERMS = {
+    "bearish", "sell", "downside", "underperform", "underweight", "downtrend",
+    "downgrade", "reduce", "breakdown", "miss", "misses", "selloff", "weak",
+    "weakness", "decline", "negative", "pessimistic", "overvalued", "headwind",
+    "headwinds", "death",
+}
+
+_WORD = re.compile(r"[a-z]+")
+_PROPOSAL = re.compile(r"FINAL TRANSACTION PROPOSAL:\s*\**\s*(BUY|SELL|HOLD)", re.I)
+_PROPOSAL_STANCE = {"BUY": 1.0, "SELL": -1.0, "HOLD": 0.0}
+
+
+def score_stance(report: str) -> float:
+    """Score a report from -1 (bearish) to 1 (bullish) using a keyword lexicon.
+
+    An explicit FINAL TRANSACTION PROPOSAL in the report takes precedence.
+    """
+    proposal = _PROPOSAL.search(report or "")
+    if proposal:
+        return _PROPOSAL_STANCE[proposal.group(1).upper()]
+
+    words = _WORD.findall((report or "").lower())
+    bullish = sum(word in BULLISH_TERMS for word in words)
+    bearish = sum(word in BEARISH_TERMS for word in words)
+    if bullish + bearish == 0:
+        return 0.0
+    return (bullish - bearish) / (bullish + bearish)
+
+
+def measure_consensus(state) -> Dict:
+    """Score every available analyst report and measure how much they agree."""
+    stances = {
+        key: score_stance(state[key]) for key in REPORT_KEYS if state.get(key)
+    }
+
+    agreement = 0.0
+    direction = "HOLD"
+    if len(stances) >= 2:
+        values = list(stances.values())
+        if all(value > 0 for value in values):
+            direction = "BUY"
+        elif all(value < 0 for value in values):
+            direction = "SELL"
+        if direction != "HOLD":
+            agreement = min(abs(value) for value in values)
+
+    return {"stances": stances, "direction": direction, "agreement": agreement}
+
+
+def create_consensus_gate(agreement_threshold: float):
+    def consensus_gate_node(state) -> dict:
+        consensus = measure_consensus(state)
+        consensus["unanimous"] = (
+            consensus["direction"] != "HOLD"
+            and consensus["agreement"] >= agreement_threshold
+        )
+        return {"analyst_consensus": consensus}
+
+    return consensus_gate_node
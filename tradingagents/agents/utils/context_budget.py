@@ -0,0 +1,146 @@
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+from tradingagents.agents.utils.agent_states import DebateTurn, render_history
+
+
+REPORT_KEYS = [
+    "market_report",
+    "sentiment_report",
+    "news_report",
+    "fundamentals_report",
+]
+
+REPORT_TITLES = {
+    "market_report": "market research report",
+    "sentiment_report": "social media sentiment report",
+    "news_report": "world affairs news report",
+    "fundamentals_report": "company fundamentals report",
+}
+
+# Rough characters-per-token ratio used by the approximate tokenizer
+_CHARS_PER_TOKEN = 4
+
+# Packages whose exceptions are model or API failures; a report whose
+# compression fails with one is truncated instead
+_PROVIDER_PACKAGES = ("openai", "anthropic", "google", "httpx", "httpcore", "requests", "urllib3")
+
+
+@lru_cache(maxsize=1)
+def _get_tiktoken_encoder():
+    """Load the tiktoken encoder once, or None when it is unavailable."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def get_report(state, key: str) -> str:
+    """Return the budgeted version of an analyst report if one was produced."""
+    compressed = state.get("compressed_reports") or {}
+    return compressed.get(key) or state.get(key, "")
+
+
+class ContextBudget:
+    """Token budget for the prompts sent to a single model."""
+
+    def __init__(self, model_name: str, config: Dict[str, Any]):
+        settings = config.get("context_budget", {})
+        limits = settings.get("model_prompt_tokens", {})
+
+        self.model_name = model_name
+        self.enabled = settings.get("enabled", False)
+        self.tokenizer = settings.get("tokenizer", "approx")
+        self.prompt_tokens = int(limits.get(model_name, limits.get("default", 16000)))
+        self.report_tokens = int(
+            self.prompt_tokens * settings.get("report_share", 0.5) / len(REPORT_KEYS)
+        )
+        self.history_tokens = int(self.prompt_tokens * settings.get("history_share", 0.3))
+
+    def count(self, text: str) -> int:
+        """Count (or approximate) the number of tokens in a text."""
+        if not text:
+            return 0
+        if self.tokenizer == "tiktoken":
+            encoder = _get_tiktoken_encoder()
+            if encoder is not None:
+                return len(encoder.encode(text, disallowed_special=()))
+        return len(text) // _CHARS_PER_TOKEN + 1
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Cut a text down to roughly max_tokens, keeping its beginning."""
+        if self.count(text) <= max_tokens:
+            return text
+        return text[: max_tokens * _CHARS_PER_TOKEN] + "\n[...truncated]"
+
+    def prompt_reports(self, state) -> Tuple[str, str, str, str]:
+        """Reports to inline into a prompt, in market/sentiment/news/fundamentals order."""
+        return tuple(get_report(state, key) for key in REPORT_KEYS)
+
+    def window_history(self, turns: List[DebateTurn]) -> str:
+        """Render only the most recent debate turns that fit in the history budget."""
+        rendered = [render_history([turn]) for turn in turns]
+        if not self.enabled:
+            return "\n".join(rendered)
+
+        kept: List[str] = []
+        used = 0
+        for text in reversed(rendered):
+            cost = self.count(text)
+            if kept and used + cost > self.history_tokens:
+                break
+            kept.append(text)
+            used += cost
+        kept.reverse()
+
+        omitted = len(rendered) - len(kept)
+        if omitted:
+            kept.insert(0, f"[{omitted} earlier turn(s) omitted]")
+        return "\n".join(kept)
+
+
+def _compression_prompt(key: str, report: str, max_tokens: int) -> str:
+    return f"""Condense the following {REPORT_TITLES[key]} so that it fits in about {max_tokens} tokens. Keep every concrete figure, date, indicator reading and the overall conclusion, drop repetition and filler, and keep the key points table in compact form. Output only the condensed report.
+
+{report}"""
+
+
+def _is_provider_error(exc: Exception) -> bool:
+    """Whether an exception comes from the model provider or the network."""
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return True
+    return any(cls.__module__.split(".")[0] in _PROVIDER_PACKAGES for cls in type(exc).__mro__)
+
+
+def create_context_budgeter(llm, budget: ContextBudget):
+    def context_budget_node(state) -> dict:
+        compressed = dict(state.get("compressed_reports") or {})
+
+        # Only summarise reports that overflow their share of the budget
+        pending = {}
+        for key in REPORT_KEYS:
+            report = state.get(key) or ""
+            if key in compressed or budget.count(report) <= budget.report_tokens:
+                continue
+            pending[key] = report
+
+        if pending:
+            prompts = [
+                _compression_prompt(key, report, budget.report_tokens)
+                for key, report in pending.items()
+            ]
+            responses = llm.batch(prompts, return_exceptions=True)
+            for (key, report), response in zip(pending.items(), responses):
+                if isinstance(response, Exception):
+                    # Anything else, e.g. an exhausted run budget, stops the run
+                    if not _is_provider_error(response):
+                        raise response
+                    compressed[key] = budget.truncate(report, budget.report_tokens)
+                else:
+                    compressed[key] = response.content
+
+        return {"compressed_reports": compressed}
+
+    return context_budget_node
@@ -1,6 +1,33 @@
-import chromadb
-from chromadb.config import Settings
-from openai import OpenAI
+import threading
+from functools import lru_cache
+
+# chromadb and openai are imported on first use; both are slow to import
+
+# Graphs built concurrently (backtest workers, webapp jobs) must not race to
+# create the shared Chroma client
+_chroma_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _get_openai_client(base_url, api_key):
+    """Share one embeddings client (and its connection pool) per endpoint."""
+    from openai import OpenAI
+
+    return OpenAI(base_url=base_url, api_key=api_key)
+
+
+def _get_chroma_client():
+    """Share one in-process Chroma client across all memories."""
+    with _chroma_lock:
+        return _create_chroma_client()
+
+
+@lru_cache(maxsize=1)
+def _create_chroma_client():
+    import chromadb
+    from chromadb.config import Settings
+
+    return chromadb.Client(Settings(allow_reset=True))
 
 
 class FinancialSituationMemory:
@@ -10,11 +37,10 @@ class FinancialSituationMemory:
             self.embedding = config.get("embedding_model", "nomic-embed-text")
         else:
             self.embedding = config.get("embedding_model", "text-embedding-3-small")
-        self.client = OpenAI(
-            base_url=embedding_backend,
-            api_key=config.get("embedding_api_key"),
+        self.client = _get_openai_client(
+            embedding_backend, config.get("embedding_api_key")
         )
-        self.chroma_client = chromadb.Client(Settings(allow_reset=True))
+        self.chroma_client = _get_chroma_client()
         # Use get_or_create to avoid errors when the collection already exists (e.g., reused app instances)
         self.situation_collection = self.chroma_client.get_or_create_collection(name=name)
 
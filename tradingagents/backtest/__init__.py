@@ -0,0 +1,4 @@
+from .report import BacktestReport, DayResult
+from .runner import BacktestRunner
+
+__all__ = ["BacktestRunner", "BacktestReport", "DayResult"]
@@ -0,0 +1,60 @@
+import argparse
+import json
+import os
+
+from tradingagents.default_config import DEFAULT_CONFIG
+
+from .runner import BacktestRunner
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tradingagents.backtest",
+        description="Backtest the agents' decisions over a date range.",
+    )
+    parser.add_argument("tickers", nargs="+")
+    parser.add_argument("--start", required=True, help="First trade date, YYYY-mm-dd")
+    parser.add_argument("--end", required=True, help="Last trade date, YYYY-mm-dd")
+    parser.add_argument(
+        "--analysts", default="market,social,news,fundamentals", help="Comma-separated analysts"
+    )
+    parser.add_argument(
+        "--reflect", action="store_true", help="Reflect on each outcome before the next day (sequential)"
+    )
+    parser.add_argument("--horizon", type=int, default=1, help="Trading days to hold each position")
+    parser.add_argument("--notional", type=float, default=10_000.0, help="Position size in USD")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel days without --reflect")
+    parser.add_argument("--checkpoint", help="JSONL file to resume from and append results to")
+    parser.add_argument("--report", help="Write the report as JSON to this path")
+    args = parser.parse_args(argv)
+
+    runner = BacktestRunner(
+        args.tickers,
+        args.start,
+        args.end,
+        config=DEFAULT_CONFIG,
+        selected_analysts=[a.strip() for a in args.analysts.split(",") if a.strip()],
+        reflect=args.reflect,
+        horizon=args.horizon,
+        notional=args.notional,
+        workers=args.workers,
+        checkpoint_path=args.checkpoint,
+    )
+
+    def on_result(result):
+        outcome = result.error or f"{result.decision} pnl={result.pnl:.2f}"
+        print(f"{result.trade_date} {result.ticker}: {outcome} ({result.latency_s:.1f}s)")
+
+    report = runner.run(on_result=on_result)
+    print()
+    print(report.to_text())
+
+    if args.report:
+        os.makedirs(os.path.dirname(os.path.abspath(args.report)), exist_ok=True)
+        with open(args.report, "w") as f:
+            json.dump(report.to_dict(), f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
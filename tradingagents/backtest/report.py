@@ -0,0 +1,112 @@
+import statistics
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+from tradingagents.observability.profiling import aggregate_profiles, format_profile
+
+# Position taken for each processed decision
+POSITIONS = {"BUY": 1, "SELL": -1, "HOLD": 0}
+
+
+@dataclass
+class DayResult:
+    """Outcome of one ticker on one trading day."""
+
+    ticker: str
+    trade_date: str
+    decision: Optional[str] = None
+    # Close on the trade date and on the date ``horizon`` trading days later
+    entry_close: Optional[float] = None
+    exit_date: Optional[str] = None
+    exit_close: Optional[float] = None
+    forward_return: Optional[float] = None
+    position: int = 0
+    pnl: float = 0.0
+    latency_s: float = 0.0
+    error: Optional[str] = None
+    # Per-node profile of the run (see tradingagents/observability/profiling.py)
+    profile: Optional[Dict[str, Any]] = None
+    # Parts of the final state that reflecting on the day reads (reflect mode),
+    # so a resumed sweep can rebuild the agents' memories
+    reflection: Optional[Dict[str, Any]] = None
+
+    @property
+    def key(self):
+        return (self.ticker, self.trade_date)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DayResult":
+        fields = cls.__dataclass_fields__
+        return cls(**{name: value for name, value in data.items() if name in fields})
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+def _summarize(results: List[DayResult]) -> Dict[str, Any]:
+    ok = [r for r in results if r.error is None]
+    trades = [r for r in ok if r.position != 0 and r.forward_return is not None]
+    hits = [r for r in trades if r.position * r.forward_return > 0]
+    latencies = [r.latency_s for r in ok]
+    return {
+        "days": len(results),
+        "errors": len(results) - len(ok),
+        "decisions": {d: sum(r.decision == d for r in ok) for d in POSITIONS},
+        "trades": len(trades),
+        "hit_rate": len(hits) / len(trades) if trades else None,
+        "pnl": sum(r.pnl for r in ok),
+        "total_return": sum((r.position * r.forward_return for r in trades), 0.0),
+        "avg_trade_return": statistics.mean(r.position * r.forward_return for r in trades) if trades else None,
+        "latency_s": {
+            "mean": statistics.mean(latencies) if latencies else 0.0,
+            "p50": _percentile(latencies, 0.5),
+            "p95": _percentile(latencies, 0.95),
+            "max": max(latencies, default=0.0),
+        },
+    }
+
+
+def _fmt_pct(value: Optional[float]) -> str:
+    return "n/a" if value is None else f"{value * 100:.2f}%"
+
+
+class BacktestReport:
+    """PnL, hit-rate and latency summary of a backtest, overall and per ticker."""
+
+    def __init__(self, results: List[DayResult], wall_time_s: float = 0.0):
+        self.results = sorted(results, key=lambda r: (r.trade_date, r.ticker))
+        self.wall_time_s = wall_time_s
+
+    def summary(self) -> Dict[str, Any]:
+        tickers = sorted({r.ticker for r in self.results})
+        return {
+            "overall": _summarize(self.results),
+            "by_ticker": {t: _summarize([r for r in self.results if r.ticker == t]) for t in tickers},
+            "wall_time_s": self.wall_time_s,
+            "profile": aggregate_profiles(r.profile for r in self.results if r.error is None),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**self.summary(), "results": [r.to_dict() for r in self.results]}
+
+    def to_text(self) -> str:
+        summary = self.summary()
+        lines = [f"{'':8} {'days':>5} {'trades':>6} {'hit rate':>9} {'return':>9} {'pnl':>12} {'p50 s':>7} {'p95 s':>7} {'errors':>6}"]
+        rows = list(summary["by_ticker"].items()) + [("TOTAL", summary["overall"])]
+        for name, s in rows:
+            lines.append(
+                f"{name:8} {s['days']:>5} {s['trades']:>6} {_fmt_pct(s['hit_rate']):>9} "
+                f"{_fmt_pct(s['total_return']):>9} {s['pnl']:>12.2f} {s['latency_s']['p50']:>7.1f} "
+                f"{s['latency_s']['p95']:>7.1f} {s['errors']:>6}"
+            )
+        lines.append(f"Wall time: {self.wall_time_s:.1f}s")
+        if summary["profile"]["runs"]:
+            lines += ["", format_profile(summary["profile"])]
+        return "\n".join(lines)
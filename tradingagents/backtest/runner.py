@@ -0,0 +1,284 @@
+# TradingAgents/backtest/runner.py
+
+import copy
+import json
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from tradingagents.dataflows.config import use_config
+from tradingagents.graph.budget import BudgetExceededError, BudgetManager
+from tradingagents.default_config import DEFAULT_CONFIG
+
+from .report import POSITIONS, BacktestReport, DayResult
+
+logger = logging.getLogger(__name__)
+
+# (date, close, date and close ``horizon`` trading days later)
+Day = Tuple[str, float, Optional[str], Optional[float]]
+
+# Final state fields read by reflect_and_remember
+REFLECTION_STATE_KEYS = (
+    "company_of_interest",
+    "trade_date",
+    "market_report",
+    "sentiment_report",
+    "news_report",
+    "fundamentals_report",
+    "investment_debate_state",
+    "investment_debate_history",
+    "trader_investment_plan",
+    "risk_debate_state",
+)
+
+
+class BacktestRunner:
+    """Run the agents over a range of trading days and score their decisions.
+
+    Each (ticker, trading day) is propagated through the graph and scored
+    against the close-to-close return over the next ``horizon`` trading days,
+    taken from the cached price history. Without reflection the days are
+    independent and run in parallel, one graph per worker thread. With
+    reflection they run in date order on a single graph, which reflects on
+    each outcome once the day it was scored on has been reached, so no
+    decision is made with knowledge of prices after its trade date.
+
+    Finished days are appended to a JSONL checkpoint, so an interrupted sweep
+    resumes where it stopped (failed days are retried). With reflection, the
+    checkpoint also keeps what each reflection needs, and a resumed sweep
+    reflects on the finished days again (in date order, before the days
+    they precede) to rebuild the agents' memories. Paper trading is
+    always disabled.
+    """
+
+    def __init__(
+        self,
+        tickers: Iterable[str],
+        start_date: str,
+        end_date: str,
+        config: Dict[str, Any] = None,
+        selected_analysts: List[str] = ("market", "social", "news", "fundamentals"),
+        reflect: bool = False,
+        horizon: int = 1,
+        notional: float = 10_000.0,
+        workers: int = 4,
+        checkpoint_path: Optional[str] = None,
+        graph_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self.tickers = [ticker.upper() for ticker in tickers]
+        self.start_date = start_date
+        self.end_date = end_date
+        self.config = copy.deepcopy(config or DEFAULT_CONFIG)
+        self.config.setdefault("alpaca_paper_trading", {})["enabled"] = False
+        self.selected_analysts = list(selected_analysts)
+        self.reflect = reflect
+        self.horizon = max(1, horizon)
+        self.notional = notional
+        self.workers = 1 if reflect else max(1, workers)
+        self.checkpoint_path = checkpoint_path
+        self.graph_factory = graph_factory or self._build_graph
+
+        # One budget for the whole sweep, shared by every worker's graph
+        self.budget_manager = BudgetManager.from_config(self.config)
+
+        # Reflections waiting for their exit date: (exit date, state, returns)
+        self._pending_reflections: List[Tuple[str, Dict[str, Any], float]] = []
+        self._local = threading.local()
+        self._checkpoint_lock = threading.Lock()
+
+    def _build_graph(self):
+        from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+        return TradingAgentsGraph(
+            self.selected_analysts, config=self.config, budget_manager=self.budget_manager
+        )
+
+    def _graph(self):
+        """Graph of the current worker thread (graphs keep per-run state)."""
+        graph = getattr(self._local, "graph", None)
+        if graph is None:
+            graph = self._local.graph = self.graph_factory()
+        return graph
+
+    def warm_price_data(self):
+        """Fetch the price data of all tickers in one batch before the sweep.
+
+        With the yfinance vendor this fills the price cache with a single
+        download for every ticker instead of one per ticker; failures are left
+        to the per-day runs, which fetch their own data. Other vendors are not
+        called, as their quota is better spent by the runs themselves.
+        """
+        if len(self.tickers) < 2:
+            return
+        from tradingagents.dataflows.interface import get_vendor, route_to_vendor_batch
+
+        calls = [
+            {"symbol": ticker, "start_date": self.start_date, "end_date": self.end_date}
+            for ticker in self.tickers
+        ]
+        with use_config(self.config):
+            if "yfinance" in get_vendor("core_stock_apis", "get_stock_data"):
+                route_to_vendor_batch("get_stock_data", calls)
+
+    def trading_days(self, ticker: str) -> List[Day]:
+        """(date, close, date and close ``horizon`` days later) for each trading day in range."""
+        import pandas as pd
+
+        from tradingagents.dataflows.price_cache import load_price_history
+
+        with use_config(self.config):
+            prices = load_price_history(ticker)
+        dates = prices["Date"].dt.strftime("%Y-%m-%d").tolist()
+        closes = prices["Close"].astype(float).tolist()
+        days = []
+        for i, date in enumerate(dates):
+            if self.start_date <= date <= self.end_date and not pd.isna(closes[i]):
+                exit = i + self.horizon
+                if exit < len(closes):
+                    days.append((date, closes[i], dates[exit], closes[exit]))
+                else:
+                    days.append((date, closes[i], None, None))
+        return days
+
+    def load_checkpoint(self) -> Dict[Tuple[str, str], DayResult]:
+        """Successfully finished days from the checkpoint, by (ticker, date)."""
+        done = {}
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return done
+        with open(self.checkpoint_path) as f:
+            for line in f:
+                try:
+                    result = DayResult.from_dict(json.loads(line))
+                except (ValueError, TypeError):
+                    # A line cut short by an interruption
+                    continue
+                if result.error is None:
+                    done[result.key] = result
+        return done
+
+    def _save(self, result: DayResult):
+        if not self.checkpoint_path:
+            return
+        with self._checkpoint_lock:
+            os.makedirs(os.path.dirname(os.path.abspath(self.checkpoint_path)), exist_ok=True)
+            with open(self.checkpoint_path, "a") as f:
+                f.write(json.dumps(result.to_dict()) + "\n")
+
+    def _run_day(self, ticker: str, day: Day) -> DayResult:
+        trade_date, entry_close, exit_date, exit_close = day
+        result = DayResult(
+            ticker, trade_date, entry_close=entry_close, exit_date=exit_date, exit_close=exit_close
+        )
+        if exit_close is not None and entry_close:
+            result.forward_return = exit_close / entry_close - 1
+
+        graph = self._graph()
+        start = time.perf_counter()
+        try:
+            final_state, decision = graph.propagate(ticker, trade_date)
+            result.profile = final_state.get("run_profile")
+            aborted = (final_state.get("budget") or {}).get("aborted")
+            if aborted:
+                # Retried when the sweep is resumed with more budget
+                raise BudgetExceededError(aborted)
+            match = re.search(r"\b(BUY|SELL|HOLD)\b", str(decision).upper())
+            result.decision = match.group(1) if match else str(decision).strip()
+            result.position = POSITIONS.get(result.decision, 0)
+            if result.forward_return is not None:
+                result.pnl = self.notional * result.position * result.forward_return
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+        result.latency_s = time.perf_counter() - start
+
+        if self.reflect and result.error is None and result.forward_return is not None:
+            # The outcome is only known at the exit date; reflecting now would
+            # let the decisions of the days in between see it
+            result.reflection = {key: final_state.get(key) for key in REFLECTION_STATE_KEYS}
+            self._queue_reflection(result)
+        return result
+
+    def _queue_reflection(self, result: DayResult):
+        self._pending_reflections.append(
+            (result.exit_date, result.reflection, self._reflection_returns(result))
+        )
+
+    def _reflect_until(self, trade_date: str):
+        """Reflect on the outcomes known by ``trade_date``, before deciding on it."""
+        due = [entry for entry in self._pending_reflections if entry[0] <= trade_date]
+        if not due:
+            return
+        self._pending_reflections = [
+            entry for entry in self._pending_reflections if entry[0] > trade_date
+        ]
+        graph = self._graph()
+        for exit_date, state, returns_losses in due:
+            try:
+                graph.reflect_and_remember(returns_losses, state)
+            except Exception as e:
+                logger.warning(
+                    "Reflection on %s %s failed: %s",
+                    state.get("company_of_interest"), state.get("trade_date"), e,
+                )
+
+    def _reflection_returns(self, result: DayResult) -> float:
+        """Profit or loss of the decision; for HOLD, that of holding the stock."""
+        if result.position:
+            return round(result.pnl, 2)
+        return round(self.notional * result.forward_return, 2)
+
+    def run(self, on_result: Optional[Callable[[DayResult], None]] = None) -> BacktestReport:
+        """Run every (ticker, day) not already in the checkpoint and report on all of them."""
+        started = time.perf_counter()
+        done = {
+            key: result
+            for key, result in self.load_checkpoint().items()
+            if key[0] in self.tickers and self.start_date <= key[1] <= self.end_date
+        }
+        self.warm_price_data()
+        self._pending_reflections = []
+        if self.reflect:
+            # Memories live in this process; rebuild those of the finished days
+            replayable = [r for r in done.values() if r.reflection and r.exit_date]
+            for result in sorted(replayable, key=lambda r: (r.trade_date, r.ticker)):
+                self._queue_reflection(result)
+            missing = sum(
+                1 for r in done.values() if r.forward_return is not None and not r.reflection
+            )
+            if missing:
+                logger.warning(
+                    "%d finished day(s) in the checkpoint have no reflection data; "
+                    "the agents will not remember them", missing,
+                )
+        tasks = [
+            (ticker, day)
+            for ticker in self.tickers
+            for day in self.trading_days(ticker)
+            if (ticker, day[0]) not in done
+        ]
+        # Date order, so each day can be preceded by the reflections due by then
+        tasks.sort(key=lambda task: (task[1][0], task[0]))
+
+        results = list(done.values())
+
+        def finish(result: DayResult):
+            self._save(result)
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+
+        if self.workers == 1:
+            for ticker, day in tasks:
+                if self.reflect:
+                    self._reflect_until(day[0])
+                finish(self._run_day(ticker, day))
+        else:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                futures = [pool.submit(self._run_day, ticker, day) for ticker, day in tasks]
+                for future in as_completed(futures):
+                    finish(future.result())
+
+        return BacktestReport(results, time.perf_counter() - started)
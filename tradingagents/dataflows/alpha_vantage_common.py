@@ -5,6 +5,8 @@ import json
 from datetime import datetime
 from io import StringIO
 
+from tradingagents.observability.tracing import SPAN_KIND_CLIENT, span
+
 API_BASE_URL = "https://www.alphavantage.co/query"
 
 def get_api_key() -> str:
@@ -63,8 +65,15 @@ def _make_api_request(function_name: str, params: dict) -> dict | str:
         # Remove entitlement if it's None or empty
         api_params.pop("entitlement", None)
     
-    response = requests.get(API_BASE_URL, params=api_params)
-    response.raise_for_status()
+    with span(
+        "HTTP GET",
+        SPAN_KIND_CLIENT,
+        **{"http.method": "GET", "http.url": API_BASE_URL, "alpha_vantage.function": function_name},
+    ) as request_span:
+        response = requests.get(API_BASE_URL, params=api_params)
+        if request_span is not None:
+            request_span.set_attribute("http.status_code", response.status_code)
+        response.raise_for_status()
 
     response_text = response.text
     
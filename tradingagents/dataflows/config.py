@@ -1,10 +1,15 @@
 import tradingagents.default_config as default_config
-from typing import Dict, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
 
 # Use default config but allow it to be overridden
 _config: Optional[Dict] = None
 DATA_DIR: Optional[str] = None
 
+# Per-run config, scoped with use_config(); takes precedence over _config
+_run_config: ContextVar[Optional[Dict]] = ContextVar("tradingagents_config", default=None)
+
 
 def initialize_config():
     """Initialize the configuration with default values."""
@@ -15,7 +20,10 @@ def initialize_config():
 
 
 def set_config(config: Dict):
-    """Update the configuration with custom values."""
+    """Update the process-wide configuration with custom values.
+
+    Runs scoped with use_config() are not affected.
+    """
     global _config, DATA_DIR
     if _config is None:
         _config = default_config.DEFAULT_CONFIG.copy()
@@ -24,11 +32,35 @@ def set_config(config: Dict):
 
 
 def get_config() -> Dict:
-    """Get the current configuration."""
+    """Get the configuration of the current run, or the process-wide one."""
+    run_config = _run_config.get()
+    if run_config is not None:
+        return run_config.copy()
     if _config is None:
         initialize_config()
     return _config.copy()
 
 
+def get_data_dir() -> str:
+    """Get the local data directory of the current configuration."""
+    return get_config()["data_dir"]
+
+
+@contextmanager
+def use_config(config: Dict) -> Iterator[Dict]:
+    """Scope a configuration to the current context (thread or task).
+
+    The config is layered over the defaults. Threads and tasks started from
+    inside the block with a copied context (as LangGraph does for nodes and
+    tools) see it too, so concurrent runs never see each other's settings.
+    """
+    run_config = {**default_config.DEFAULT_CONFIG, **config}
+    token = _run_config.set(run_config)
+    try:
+        yield run_config
+    finally:
+        _run_config.reset(token)
+
+
 # Initialize with default config
 initialize_config()
@@ -12,6 +12,8 @@ from tenacity import (
     retry_if_result,
 )
 
+from tradingagents.observability.tracing import SPAN_KIND_CLIENT, span
+
 
 def is_rate_limited(response):
     """Check if the response indicates rate limiting (status code 429)"""
@@ -27,7 +29,10 @@ def make_request(url, headers):
     """Make a request with retry logic for rate limiting"""
     # Random delay before each request to avoid detection
     time.sleep(random.uniform(2, 6))
-    response = requests.get(url, headers=headers)
+    with span("HTTP GET", SPAN_KIND_CLIENT, **{"http.method": "GET", "http.url": url}) as request_span:
+        response = requests.get(url, headers=headers)
+        if request_span is not None:
+            request_span.set_attribute("http.status_code", response.status_code)
     return response
 
 
@@ -0,0 +1,264 @@
+"""Vectorized NumPy implementation of the supported technical indicators.
+
+Computes the indicators offered to the market analyst directly on
+contiguous float64 arrays, with the same definitions (windows, smoothing,
+warm-up values) as stockstats, so the two engines agree to floating point
+precision. Inputs may be 1-D (one symbol) or 2-D with one column per
+symbol, to compute many symbols sharing the same dates at once.
+
+The engine used by the indicator tools is chosen with the
+``indicator_engine`` config key ("numpy" or "stockstats").
+"""
+
+import math
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+
+# Indicators offered to the market analyst (see get_stock_stats_indicators_window)
+INDICATORS = [
+    "close_50_sma",
+    "close_200_sma",
+    "close_10_ema",
+    "macd",
+    "macds",
+    "macdh",
+    "rsi",
+    "boll",
+    "boll_ub",
+    "boll_lb",
+    "atr",
+    "vwma",
+    "mfi",
+]
+
+# Default windows, as in stockstats
+MACD_WINDOWS = (12, 26, 9)
+RSI_WINDOW = 14
+BOLL_WINDOW = 20
+BOLL_STD_TIMES = 2
+ATR_WINDOW = 14
+VWMA_WINDOW = 14
+MFI_WINDOW = 14
+
+# Largest weight growth (as a power of e) within one block of _ewm
+_EWM_BLOCK_GROWTH = 300.0
+
+
+def _as_2d(values) -> np.ndarray:
+    arr = np.ascontiguousarray(values, dtype=np.float64)
+    return arr.reshape(len(arr), -1)
+
+
+def _ewm(x: np.ndarray, alpha: float) -> np.ndarray:
+    """Adjusted exponentially weighted mean along axis 0 (pandas ewm(adjust=True)).
+
+    Each output is sum((1-alpha)^i * x[t-i]) / sum((1-alpha)^i). Within a
+    block the weighted sums are cumulative sums of rescaled inputs, and the
+    running sums are carried from block to block, so there is no Python loop
+    over rows and the rescaling factors stay within float64 range.
+    """
+    decay = 1.0 - alpha
+    block = max(1, int(_EWM_BLOCK_GROWTH / -math.log(decay))) if decay > 0 else 1
+    out = np.empty_like(x)
+    num = np.zeros(x.shape[1])
+    den = 0.0
+    for start in range(0, len(x), block):
+        seg = x[start:start + block]
+        k = np.arange(len(seg), dtype=np.float64)
+        grow = decay ** -k
+        shrink = decay ** k
+        carry = decay ** (k + 1)
+        seg_num = np.cumsum(seg * grow[:, None], axis=0) * shrink[:, None] + num * carry[:, None]
+        seg_den = np.cumsum(grow) * shrink + den * carry
+        out[start:start + block] = seg_num / seg_den[:, None]
+        num, den = seg_num[-1], seg_den[-1]
+    return out
+
+
+def ema(x: np.ndarray, window: int) -> np.ndarray:
+    return _ewm(x, 2.0 / (window + 1))
+
+
+def smma(x: np.ndarray, window: int) -> np.ndarray:
+    return _ewm(x, 1.0 / window)
+
+
+def rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """Sum over the last ``window`` rows, over fewer rows at the start."""
+    csum = np.cumsum(x, axis=0)
+    out = csum.copy()
+    out[window:] = csum[window:] - csum[:-window]
+    return out
+
+
+def sma(x: np.ndarray, window: int) -> np.ndarray:
+    """Mean over the last ``window`` rows, over fewer rows at the start."""
+    # Centre on the first row so the running sums stay small
+    base = x[:1]
+    counts = np.minimum(np.arange(1, len(x) + 1), window)[:, None]
+    return rolling_sum(x - base, window) / counts + base
+
+
+def rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    """Sample standard deviation over the last ``window`` rows (NaN for one row)."""
+    out = np.full_like(x, np.nan)
+    for end in range(2, min(window, len(x)) + 1):
+        out[end - 1] = x[:end].std(axis=0, ddof=1)
+    if len(x) >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(x, window, axis=0)
+        out[window - 1:] = windows.std(axis=-1, ddof=1)
+    return out
+
+
+def _diff(x: np.ndarray) -> np.ndarray:
+    out = np.zeros_like(x)
+    out[1:] = np.diff(x, axis=0)
+    return out
+
+
+def macd(close: np.ndarray, windows=MACD_WINDOWS) -> Dict[str, np.ndarray]:
+    short_window, long_window, signal_window = windows
+    line = ema(close, short_window) - ema(close, long_window)
+    signal = ema(line, signal_window)
+    return {"macd": line, "macds": signal, "macdh": line - signal}
+
+
+def rsi(close: np.ndarray, window: int = RSI_WINDOW) -> np.ndarray:
+    diff = _diff(close)
+    up = smma(np.where(diff > 0, diff, 0.0), window)
+    down = smma(np.where(diff < 0, -diff, 0.0), window)
+    total = up + down
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(total != 0, 100 * up / total, 50.0)
+    out[0] = 50.0
+    return out
+
+
+def bollinger(close: np.ndarray, window: int = BOLL_WINDOW) -> Dict[str, np.ndarray]:
+    middle = sma(close, window)
+    width = BOLL_STD_TIMES * rolling_std(close, window)
+    return {"boll": middle, "boll_ub": middle + width, "boll_lb": middle - width}
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, window: int = ATR_WINDOW) -> np.ndarray:
+    prev_close = np.empty_like(close)
+    prev_close[0] = close[0]
+    prev_close[1:] = close[:-1]
+    true_range = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+    return smma(np.nan_to_num(true_range), window)
+
+
+def _typical_price(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    return (close + high + low) / 3.0
+
+
+def vwma(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray, window: int = VWMA_WINDOW
+) -> np.ndarray:
+    tpv = rolling_sum(volume * _typical_price(high, low, close), window)
+    vol = rolling_sum(volume, window)
+    return np.divide(tpv, vol, out=np.zeros_like(tpv), where=vol != 0)
+
+
+def mfi(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray, window: int = MFI_WINDOW
+) -> np.ndarray:
+    tp = _typical_price(high, low, close)
+    money_flow = tp * volume
+    tp_diff = _diff(tp)
+    positive = rolling_sum(np.where(tp_diff > 0, money_flow, 0.0), window)
+    negative = rolling_sum(np.where(tp_diff < 0, money_flow, 0.0), window)
+    total = positive + negative
+    out = np.divide(positive, total, out=np.full_like(positive, 0.5), where=total > 0)
+    out[:window] = 0.5
+    return out
+
+
+def compute_arrays(
+    high, low, close, volume, indicators: List[str] = INDICATORS
+) -> Dict[str, np.ndarray]:
+    """Compute indicators from price arrays of shape (dates,) or (dates, symbols).
+
+    Returns one array per indicator, shaped like the inputs.
+    """
+    shape = np.shape(close)
+    high, low, close, volume = (_as_2d(a) for a in (high, low, close, volume))
+    unknown = set(indicators) - set(INDICATORS)
+    if unknown:
+        raise ValueError(f"Unsupported indicators: {sorted(unknown)}")
+
+    wanted = set(indicators)
+    out: Dict[str, np.ndarray] = {}
+    if "close_50_sma" in wanted:
+        out["close_50_sma"] = sma(close, 50)
+    if "close_200_sma" in wanted:
+        out["close_200_sma"] = sma(close, 200)
+    if "close_10_ema" in wanted:
+        out["close_10_ema"] = ema(close, 10)
+    if wanted & {"macd", "macds", "macdh"}:
+        out.update(macd(close))
+    if "rsi" in wanted:
+        out["rsi"] = rsi(close)
+    if wanted & {"boll", "boll_ub", "boll_lb"}:
+        out.update(bollinger(close))
+    if "atr" in wanted:
+        out["atr"] = atr(high, low, close)
+    if "vwma" in wanted:
+        out["vwma"] = vwma(high, low, close, volume)
+    if "mfi" in wanted:
+        out["mfi"] = mfi(high, low, close, volume)
+    return {indicator: out[indicator].reshape(shape) for indicator in indicators}
+
+
+def _stockstats_indicators(data: pd.DataFrame, indicators: List[str]) -> Dict[str, np.ndarray]:
+    from stockstats import wrap
+
+    df = wrap(data.copy())
+    return {indicator: np.asarray(df[indicator], dtype=np.float64) for indicator in indicators}
+
+
+def compute_indicators(
+    data: pd.DataFrame, indicators: List[str] = INDICATORS, engine: Optional[str] = None
+) -> pd.DataFrame:
+    """Indicator columns (float64) for a price frame, indexed by its dates."""
+    engine = engine or get_config().get("indicator_engine", "numpy")
+    if engine == "numpy":
+        values = compute_arrays(
+            data["High"].values, data["Low"].values, data["Close"].values, data["Volume"].values, indicators
+        )
+    elif engine == "stockstats":
+        values = _stockstats_indicators(data, indicators)
+    else:
+        raise ValueError(f"Unknown indicator engine '{engine}'")
+
+    index = pd.DatetimeIndex(data["Date"].values, name="Date")
+    return pd.DataFrame(values, index=index, columns=indicators)
+
+
+def compute_many(
+    frames: Dict[str, pd.DataFrame], indicators: List[str] = INDICATORS
+) -> Dict[str, pd.DataFrame]:
+    """Indicators for many symbols, computing symbols with the same dates as one 2-D array."""
+    groups: Dict[bytes, List[str]] = {}
+    for symbol, data in frames.items():
+        key = pd.DatetimeIndex(data["Date"]).asi8.tobytes()
+        groups.setdefault(key, []).append(symbol)
+
+    results = {}
+    for symbols in groups.values():
+        first = frames[symbols[0]]
+        columns = {
+            name: np.column_stack([frames[symbol][name].values for symbol in symbols])
+            for name in ("High", "Low", "Close", "Volume")
+        }
+        values = compute_arrays(columns["High"], columns["Low"], columns["Close"], columns["Volume"], indicators)
+        index = pd.DatetimeIndex(first["Date"].values, name="Date")
+        for i, symbol in enumerate(symbols):
+            results[symbol] = pd.DataFrame(
+                {indicator: values[indicator][:, i] for indicator in indicators}, index=index
+            )
+    return {symbol: results[symbol] for symbol in frames}
@@ -0,0 +1,185 @@
+"""Precomputed technical indicators for the cached price history.
+
+The panel holds every supported indicator for a symbol as one column per
+indicator over the dates of its price history (symbol x date x indicator),
+stored as a pickle per symbol in ``{data_cache_dir}/indicators``. When the
+price cache gains new bars, only those rows are computed, from a warm-up
+window of earlier bars; when the price history was re-adjusted the symbol
+is recomputed in full. Indicator tool calls are then slices of the panel.
+
+Panels are built on first use, or ahead of a run for every cached symbol:
+
+    python -m tradingagents.dataflows.indicator_panel
+    python -m tradingagents.dataflows.indicator_panel --prefetch AAPL MSFT NVDA
+"""
+
+import argparse
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from tradingagents.observability.profiling import record_cache_hit
+
+from .config import get_config
+from .indicator_engine import INDICATORS, compute_indicators
+from .price_cache import (
+    cached_price_history,
+    history_cache_path,
+    load_price_history,
+    prefetch_price_history,
+)
+
+# Bars before the first new row used to compute an incremental update; long
+# enough for the 200-day SMA and for the exponential averages to settle
+WARMUP_ROWS = 500
+
+# Panels kept in memory, in symbols
+MEMORY_CACHE_SIZE = 64
+
+# Keyed by panel file path
+_panels: "OrderedDict[str, Dict]" = OrderedDict()
+_symbol_locks: Dict[str, threading.Lock] = {}
+_lock = threading.Lock()
+
+
+def panel_path(symbol: str) -> str:
+    return os.path.join(get_config()["data_cache_dir"], "indicators", f"{symbol.upper()}.pkl")
+
+
+def _symbol_lock(path: str) -> threading.Lock:
+    with _lock:
+        return _symbol_locks.setdefault(path, threading.Lock())
+
+
+def _remember(path: str, entry: Dict):
+    with _lock:
+        _panels[path] = entry
+        _panels.move_to_end(path)
+        while len(_panels) > MEMORY_CACHE_SIZE:
+            _panels.popitem(last=False)
+
+
+def _read(path: str) -> Optional[Dict]:
+    with _lock:
+        entry = _panels.get(path)
+        if entry is not None:
+            _panels.move_to_end(path)
+            return entry
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            entry = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    _remember(path, entry)
+    return entry
+
+
+def _write(path: str, panel: pd.DataFrame, prices: pd.DataFrame):
+    # Closing price of the last bar, to detect a re-adjusted price history
+    entry = {"panel": panel, "last_close": float(prices["Close"].iloc[-1]) if len(prices) else None}
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + ".tmp", "wb") as f:
+        pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(path + ".tmp", path)
+    _remember(path, entry)
+
+
+def _is_current(entry: Dict, prices: pd.DataFrame) -> bool:
+    """Whether the panel was computed from this price history, up to some row."""
+    panel = entry["panel"]
+    if panel.empty or list(panel.columns) != INDICATORS:
+        return False
+    dates = prices["Date"]
+    last = panel.index[-1]
+    row = np.searchsorted(dates.values, last.to_datetime64())
+    if row >= len(dates) or dates.iloc[row] != last or dates.iloc[0] != panel.index[0]:
+        return False
+    return np.isclose(prices["Close"].iloc[row], entry["last_close"], rtol=1e-9)
+
+
+def update_panel(symbol: str, prices: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """Bring a symbol's panel up to date with its price history and return it."""
+    symbol = symbol.upper()
+    path = panel_path(symbol)
+    if prices is None:
+        prices = load_price_history(symbol)
+    if prices.empty:
+        return pd.DataFrame(columns=INDICATORS, index=pd.DatetimeIndex([], name="Date"), dtype=np.float64)
+
+    with _symbol_lock(path):
+        entry = _read(path)
+        if entry is not None and _is_current(entry, prices):
+            panel = entry["panel"]
+            start = np.searchsorted(prices["Date"].values, panel.index[-1].to_datetime64(), side="right")
+            if start >= len(prices):
+                record_cache_hit()
+                return panel
+            warmup_start = max(0, start - WARMUP_ROWS)
+            new_rows = compute_indicators(prices.iloc[warmup_start:]).iloc[start - warmup_start:]
+            panel = pd.concat([panel, new_rows])
+        else:
+            panel = compute_indicators(prices)
+        _write(path, panel, prices)
+        return panel
+
+
+def indicator_window(symbol: str, indicator: str, start_date: str, end_date: str) -> Dict[str, str]:
+    """Indicator values for the trading days in [start_date, end_date], by date.
+
+    Missing values (the warm-up of an indicator) are reported as "N/A".
+    """
+    if indicator not in INDICATORS:
+        raise ValueError(f"Indicator {indicator} is not in the panel")
+    panel = update_panel(symbol)
+    values = panel.loc[start_date:end_date, indicator]
+    return {
+        date.strftime("%Y-%m-%d"): "N/A" if pd.isna(value) else str(value)
+        for date, value in values.items()
+    }
+
+
+def cached_symbols() -> List[str]:
+    """Symbols with a price history in the cache."""
+    cache_dir = os.path.dirname(history_cache_path("_"))
+    if not os.path.isdir(cache_dir):
+        return []
+    suffix = "-YFin-data.csv"
+    return sorted(name[: -len(suffix)] for name in os.listdir(cache_dir) if name.endswith(suffix))
+
+
+def update_panels(symbols: Optional[List[str]] = None, prefetch: bool = False) -> Dict[str, int]:
+    """Update the panels of many symbols (default: every cached symbol); rows per symbol."""
+    symbols = [symbol.upper() for symbol in symbols] if symbols else cached_symbols()
+    if prefetch:
+        prefetch_price_history(symbols)
+    rows = {}
+    for symbol in symbols:
+        prices = cached_price_history(symbol) if not prefetch else None
+        rows[symbol] = len(update_panel(symbol, prices))
+    return rows
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Update the precomputed indicator panels.")
+    parser.add_argument("symbols", nargs="*", help="Symbols to update (default: every cached symbol)")
+    parser.add_argument(
+        "--prefetch", action="store_true", help="Download missing price history first"
+    )
+    args = parser.parse_args(argv)
+
+    rows = update_panels(args.symbols, prefetch=args.prefetch)
+    for symbol, count in rows.items():
+        print(f"{symbol}: {count} rows")
+    print(f"Updated {len(rows)} panel(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
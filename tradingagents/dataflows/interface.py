@@ -1,58 +1,21 @@
-from typing import Annotated
-
-# Import from vendor-specific modules
-from .local import get_YFin_data, get_finnhub_news, get_finnhub_company_insider_sentiment, get_finnhub_company_insider_transactions, get_simfin_balance_sheet, get_simfin_cashflow, get_simfin_income_statements, get_reddit_global_news, get_reddit_company_news
-from .y_finance import get_YFin_data_online, get_stock_stats_indicators_window, get_balance_sheet as get_yfinance_balance_sheet, get_cashflow as get_yfinance_cashflow, get_income_statement as get_yfinance_income_statement, get_insider_transactions as get_yfinance_insider_transactions
-from .google import get_google_news
-from .openai import get_stock_news_openai, get_global_news_openai, get_fundamentals_openai
-from .alpha_vantage import (
-    get_stock as get_alpha_vantage_stock,
-    get_indicator as get_alpha_vantage_indicator,
-    get_fundamentals as get_alpha_vantage_fundamentals,
-    get_balance_sheet as get_alpha_vantage_balance_sheet,
-    get_cashflow as get_alpha_vantage_cashflow,
-    get_income_statement as get_alpha_vantage_income_statement,
-    get_insider_transactions as get_alpha_vantage_insider_transactions,
-    get_news as get_alpha_vantage_news
-)
-from .alpha_vantage_common import AlphaVantageRateLimitError
+import asyncio
+import contextvars
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Any, Dict, List
+
+from tradingagents.observability.tracing import span
 
 # Configuration and routing logic
 from .config import get_config
+from .prefetch import current_tool_cache
+from .registry import VendorImpl, registry
+
+logger = logging.getLogger(__name__)
 
-# Tools organized by category
-TOOLS_CATEGORIES = {
-    "core_stock_apis": {
-        "description": "OHLCV stock price data",
-        "tools": [
-            "get_stock_data"
-        ]
-    },
-    "technical_indicators": {
-        "description": "Technical analysis indicators",
-        "tools": [
-            "get_indicators"
-        ]
-    },
-    "fundamental_data": {
-        "description": "Company fundamentals",
-        "tools": [
-            "get_fundamentals",
-            "get_balance_sheet",
-            "get_cashflow",
-            "get_income_statement"
-        ]
-    },
-    "news_data": {
-        "description": "News (public/insiders, original/processed)",
-        "tools": [
-            "get_news",
-            "get_global_news",
-            "get_insider_sentiment",
-            "get_insider_transactions",
-        ]
-    }
-}
+# Tools organized by category (declared in the vendor registry)
+TOOLS_CATEGORIES = registry.categories
 
 VENDOR_LIST = [
     "local",
@@ -61,67 +24,9 @@ VENDOR_LIST = [
     "google"
 ]
 
-# Mapping of methods to their vendor-specific implementations
-VENDOR_METHODS = {
-    # core_stock_apis
-    "get_stock_data": {
-        "alpha_vantage": get_alpha_vantage_stock,
-        "yfinance": get_YFin_data_online,
-        "local": get_YFin_data,
-    },
-    # technical_indicators
-    "get_indicators": {
-        "alpha_vantage": get_alpha_vantage_indicator,
-        "yfinance": get_stock_stats_indicators_window,
-        "local": get_stock_stats_indicators_window
-    },
-    # fundamental_data
-    "get_fundamentals": {
-        "alpha_vantage": get_alpha_vantage_fundamentals,
-        "openai": get_fundamentals_openai,
-    },
-    "get_balance_sheet": {
-        "alpha_vantage": get_alpha_vantage_balance_sheet,
-        "yfinance": get_yfinance_balance_sheet,
-        "local": get_simfin_balance_sheet,
-    },
-    "get_cashflow": {
-        "alpha_vantage": get_alpha_vantage_cashflow,
-        "yfinance": get_yfinance_cashflow,
-        "local": get_simfin_cashflow,
-    },
-    "get_income_statement": {
-        "alpha_vantage": get_alpha_vantage_income_statement,
-        "yfinance": get_yfinance_income_statement,
-        "local": get_simfin_income_statements,
-    },
-    # news_data
-    "get_news": {
-        "alpha_vantage": get_alpha_vantage_news,
-        "openai": get_stock_news_openai,
-        "google": get_google_news,
-        "local": [get_finnhub_news, get_reddit_company_news, get_google_news],
-    },
-    "get_global_news": {
-        "openai": get_global_news_openai,
-        "local": get_reddit_global_news
-    },
-    "get_insider_sentiment": {
-        "local": get_finnhub_company_insider_sentiment
-    },
-    "get_insider_transactions": {
-        "alpha_vantage": get_alpha_vantage_insider_transactions,
-        "yfinance": get_yfinance_insider_transactions,
-        "local": get_finnhub_company_insider_transactions,
-    },
-}
-
 def get_category_for_method(method: str) -> str:
     """Get the category that contains the specified method."""
-    for category, info in TOOLS_CATEGORIES.items():
-        if method in info["tools"]:
-            return category
-    raise ValueError(f"Method '{method}' not found in any category")
+    return registry.category_for(method)
 
 def get_vendor(category: str, method: str = None) -> str:
     """Get the configured vendor for a data category or specific tool method.
@@ -138,107 +43,206 @@ def get_vendor(category: str, method: str = None) -> str:
     # Fall back to category-level configuration
     return config.get("data_vendors", {}).get(category, "default")
 
-def route_to_vendor(method: str, *args, **kwargs):
-    """Route method calls to appropriate vendor implementation with fallback support."""
+def _is_rate_limit_error(exc: Exception) -> bool:
+    """Check for an Alpha Vantage rate limit without importing that vendor."""
+    # Only Alpha Vantage raises it, so its module is loaded whenever it matters
+    common = sys.modules.get(f"{__package__}.alpha_vantage_common")
+    return common is not None and isinstance(exc, common.AlphaVantageRateLimitError)
+
+def _pace(vendor: str):
+    """Wait for the vendor's rate limit (configurable via vendor_rate_limits)."""
+    limiter = registry.limiter(vendor, get_config().get("vendor_rate_limits", {}).get(vendor))
+    if limiter is not None:
+        limiter.acquire()
+
+def _call_impl(impl: VendorImpl, *args, **kwargs):
+    """Call a vendor implementation, running coroutine implementations to completion."""
+    func = impl.load()
+    _pace(impl.vendor)
+    if impl.supports_async:
+        return asyncio.run(func(*args, **kwargs))
+    return func(*args, **kwargs)
+
+def _fallback_order(method: str):
+    """Primary vendors from the config, followed by every other registered vendor."""
     category = get_category_for_method(method)
     vendor_config = get_vendor(category, method)
 
     # Handle comma-separated vendors
     primary_vendors = [v.strip() for v in vendor_config.split(',')]
 
-    if method not in VENDOR_METHODS:
-        raise ValueError(f"Method '{method}' not supported")
-
-    # Get all available vendors for this method for fallback
-    all_available_vendors = list(VENDOR_METHODS[method].keys())
-    
     # Create fallback vendor list: primary vendors first, then remaining vendors as fallbacks
     fallback_vendors = primary_vendors.copy()
-    for vendor in all_available_vendors:
+    for vendor in registry.vendors_for(method):
         if vendor not in fallback_vendors:
             fallback_vendors.append(vendor)
+    return primary_vendors, fallback_vendors
 
-    # Debug: Print fallback ordering
-    primary_str = " → ".join(primary_vendors)
-    fallback_str = " → ".join(fallback_vendors)
-    print(f"DEBUG: {method} - Primary: [{primary_str}] | Full fallback order: [{fallback_str}]")
-
-    # Track results and execution state
-    results = []
-    vendor_attempt_count = 0
-    any_primary_vendor_attempted = False
-    successful_vendor = None
-
-    for vendor in fallback_vendors:
-        if vendor not in VENDOR_METHODS[method]:
-            if vendor in primary_vendors:
-                print(f"INFO: Vendor '{vendor}' not supported for method '{method}', falling back to next vendor")
-            continue
-
-        vendor_impl = VENDOR_METHODS[method][vendor]
-        is_primary_vendor = vendor in primary_vendors
-        vendor_attempt_count += 1
-
-        # Track if we attempted any primary vendor
-        if is_primary_vendor:
-            any_primary_vendor_attempted = True
-
-        # Debug: Print current attempt
-        vendor_type = "PRIMARY" if is_primary_vendor else "FALLBACK"
-        print(f"DEBUG: Attempting {vendor_type} vendor '{vendor}' for {method} (attempt #{vendor_attempt_count})")
-
-        # Handle list of methods for a vendor
-        if isinstance(vendor_impl, list):
-            vendor_methods = [(impl, vendor) for impl in vendor_impl]
-            print(f"DEBUG: Vendor '{vendor}' has multiple implementations: {len(vendor_methods)} functions")
-        else:
-            vendor_methods = [(vendor_impl, vendor)]
-
-        # Run methods for this vendor
-        vendor_results = []
-        for impl_func, vendor_name in vendor_methods:
-            try:
-                print(f"DEBUG: Calling {impl_func.__name__} from vendor '{vendor_name}'...")
-                result = impl_func(*args, **kwargs)
-                vendor_results.append(result)
-                print(f"SUCCESS: {impl_func.__name__} from vendor '{vendor_name}' completed successfully")
-                    
-            except AlphaVantageRateLimitError as e:
-                if vendor == "alpha_vantage":
-                    print(f"RATE_LIMIT: Alpha Vantage rate limit exceeded, falling back to next available vendor")
-                    print(f"DEBUG: Rate limit details: {e}")
-                # Continue to next vendor for fallback
-                continue
-            except Exception as e:
-                # Log error but continue with other implementations
-                print(f"FAILED: {impl_func.__name__} from vendor '{vendor_name}' failed: {e}")
+def route_to_vendor(method: str, *args, **kwargs):
+    """Route method calls to appropriate vendor implementation with fallback support.
+
+    Inside a run with prefetch enabled, results come from the run's tool
+    cache when the same call was already made or prefetched.
+    """
+    cache = current_tool_cache()
+    if cache is not None:
+        return cache.get_or_call(method, args, kwargs, _route_to_vendor)
+    return _route_to_vendor(method, *args, **kwargs)
+
+def _route_to_vendor(method: str, *args, **kwargs):
+    primary_vendors, fallback_vendors = _fallback_order(method)
+    logger.debug(
+        "%s - Primary: [%s] | Full fallback order: [%s]",
+        method, " → ".join(primary_vendors), " → ".join(fallback_vendors),
+    )
+
+    with span(
+        f"route_to_vendor {method}",
+        method=method,
+        arguments=[str(arg) for arg in args] + [f"{k}={v}" for k, v in kwargs.items()],
+        primary_vendors=primary_vendors,
+        fallback_order=fallback_vendors,
+    ) as route_span:
+        # Track results and execution state
+        results = []
+        vendor_attempt_count = 0
+        attempted_vendors = []
+        successful_vendor = None
+
+        for vendor in fallback_vendors:
+            vendor_impls = registry.implementations(method, vendor)
+            if not vendor_impls:
+                if vendor in primary_vendors:
+                    logger.info("Vendor '%s' not supported for method '%s', falling back to next vendor", vendor, method)
                 continue
 
-        # Add this vendor's results
-        if vendor_results:
-            results.extend(vendor_results)
-            successful_vendor = vendor
-            result_summary = f"Got {len(vendor_results)} result(s)"
-            print(f"SUCCESS: Vendor '{vendor}' succeeded - {result_summary}")
-            
-            # Stopping logic: Stop after first successful vendor for single-vendor configs
-            # Multiple vendor configs (comma-separated) may want to collect from multiple sources
-            if len(primary_vendors) == 1:
-                print(f"DEBUG: Stopping after successful vendor '{vendor}' (single-vendor config)")
-                break
-        else:
-            print(f"FAILED: Vendor '{vendor}' produced no results")
-
-    # Final result summary
-    if not results:
-        print(f"FAILURE: All {vendor_attempt_count} vendor attempts failed for method '{method}'")
-        raise RuntimeError(f"All vendor implementations failed for method '{method}'")
-    else:
-        print(f"FINAL: Method '{method}' completed with {len(results)} result(s) from {vendor_attempt_count} vendor attempt(s)")
+            is_primary_vendor = vendor in primary_vendors
+            vendor_attempt_count += 1
+            attempted_vendors.append(vendor)
+
+            vendor_type = "PRIMARY" if is_primary_vendor else "FALLBACK"
+            logger.debug("Attempting %s vendor '%s' for %s (attempt #%d)", vendor_type, vendor, method, vendor_attempt_count)
+
+            # Handle vendors with multiple implementations
+            if len(vendor_impls) > 1:
+                logger.debug("Vendor '%s' has multiple implementations: %d functions", vendor, len(vendor_impls))
+
+            # Run methods for this vendor
+            vendor_results = []
+            for impl in vendor_impls:
+                with span(
+                    f"vendor {vendor}",
+                    vendor=vendor,
+                    implementation=impl.name,
+                    attempt=vendor_attempt_count,
+                    fallback=not is_primary_vendor,
+                ) as attempt_span:
+                    try:
+                        logger.debug("Calling %s from vendor '%s'...", impl.name, vendor)
+                        result = _call_impl(impl, *args, **kwargs)
+                        vendor_results.append(result)
+                        logger.debug("%s from vendor '%s' completed successfully", impl.name, vendor)
+
+                    except Exception as e:
+                        if attempt_span is not None:
+                            attempt_span.set_error(e)
+                        if _is_rate_limit_error(e):
+                            if vendor == "alpha_vantage":
+                                logger.warning("Alpha Vantage rate limit exceeded, falling back to next available vendor: %s", e)
+                            # Continue to next vendor for fallback
+                            continue
+                        # Log error but continue with other implementations
+                        logger.warning("%s from vendor '%s' failed: %s", impl.name, vendor, e)
+                        continue
+
+            # Add this vendor's results
+            if vendor_results:
+                results.extend(vendor_results)
+                successful_vendor = vendor
+                logger.debug("Vendor '%s' succeeded - Got %d result(s)", vendor, len(vendor_results))
+
+                # Stopping logic: Stop after first successful vendor for single-vendor configs
+                # Multiple vendor configs (comma-separated) may want to collect from multiple sources
+                if len(primary_vendors) == 1:
+                    logger.debug("Stopping after successful vendor '%s' (single-vendor config)", vendor)
+                    break
+            else:
+                logger.warning("Vendor '%s' produced no results for method '%s'", vendor, method)
+
+        if route_span is not None:
+            route_span.set_attribute("vendor", successful_vendor)
+            route_span.set_attribute("fallback_path", attempted_vendors)
+            route_span.set_attribute("attempts", vendor_attempt_count)
+
+        # Final result summary
+        if not results:
+            logger.error("All %d vendor attempts failed for method '%s'", vendor_attempt_count, method)
+            raise RuntimeError(f"All vendor implementations failed for method '{method}'")
+        logger.debug(
+            "Method '%s' completed with %d result(s) from %d vendor attempt(s)",
+            method, len(results), vendor_attempt_count,
+        )
 
     # Return single result if only one, otherwise concatenate as string
     if len(results) == 1:
         return results[0]
     else:
         # Convert all results to strings and concatenate
-        return '\n'.join(str(result) for result in results)
\ No newline at end of file
+        return '\n'.join(str(result) for result in results)
+
+def route_to_vendor_batch(
+    method: str, calls: List[Dict[str, Any]], max_workers: int = 8
+) -> List[Any]:
+    """Serve several keyword-argument calls of one method at once.
+
+    Uses the primary vendor's batch implementation or async implementation
+    when it has one; otherwise (and for any call those paths fail) the calls
+    go through route_to_vendor concurrently on a thread pool. Returns the
+    results in call order, with exceptions in place of failed calls.
+    """
+    results: List[Any] = [None] * len(calls)
+    pending = list(range(len(calls)))
+
+    primary_vendors, _ = _fallback_order(method)
+    impls = registry.implementations(method, primary_vendors[0])
+    # Multi-source and chained configurations keep the per-call path
+    if len(primary_vendors) == 1 and len(impls) == 1 and calls:
+        impl = impls[0]
+        try:
+            if impl.supports_batch:
+                logger.debug("Batching %d %s call(s) through vendor '%s'", len(calls), method, impl.vendor)
+                _pace(impl.vendor)
+                for i, result in enumerate(impl.load_batch()(calls)):
+                    results[i] = result
+                pending = []
+            elif impl.supports_async:
+                logger.debug("Running %d %s call(s) concurrently through vendor '%s'", len(calls), method, impl.vendor)
+                func = impl.load()
+
+                async def gather():
+                    return await asyncio.gather(
+                        *(func(**call) for call in calls), return_exceptions=True
+                    )
+
+                _pace(impl.vendor)
+                for i, result in enumerate(asyncio.run(gather())):
+                    results[i] = result
+                pending = [i for i, result in enumerate(results) if isinstance(result, Exception)]
+        except Exception as e:
+            logger.warning("Batch path for %s via vendor '%s' failed: %s", method, impl.vendor, e)
+            pending = list(range(len(calls)))
+
+    if pending:
+        # Each worker runs in a copy of this context so the run's config applies
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as pool:
+            futures = {
+                i: pool.submit(contextvars.copy_context().run, route_to_vendor, method, **calls[i])
+                for i in pending
+            }
+            for i, future in futures.items():
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    results[i] = e
+
+    return results
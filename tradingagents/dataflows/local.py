@@ -1,7 +1,7 @@
 from typing import Annotated
 import pandas as pd
 import os
-from .config import DATA_DIR
+from .config import get_data_dir
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 import json
@@ -21,7 +21,7 @@ def get_YFin_data_window(
     # read in data
     data = pd.read_csv(
         os.path.join(
-            DATA_DIR,
+            get_data_dir(),
             f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
         )
     )
@@ -56,7 +56,7 @@ def get_YFin_data(
     # read in data
     data = pd.read_csv(
         os.path.join(
-            DATA_DIR,
+            get_data_dir(),
             f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
         )
     )
@@ -99,7 +99,7 @@ def get_finnhub_news(
 
     """
 
-    result = get_data_in_range(query, start_date, end_date, "news_data", DATA_DIR)
+    result = get_data_in_range(query, start_date, end_date, "news_data", get_data_dir())
 
     if len(result) == 0:
         return ""
@@ -134,7 +134,7 @@ def get_finnhub_company_insider_sentiment(
     before = date_obj - relativedelta(days=15)  # Default 15 days lookback
     before = before.strftime("%Y-%m-%d")
 
-    data = get_data_in_range(ticker, before, curr_date, "insider_senti", DATA_DIR)
+    data = get_data_in_range(ticker, before, curr_date, "insider_senti", get_data_dir())
 
     if len(data) == 0:
         return ""
@@ -171,7 +171,7 @@ def get_finnhub_company_insider_transactions(
     before = date_obj - relativedelta(days=15)  # Default 15 days lookback
     before = before.strftime("%Y-%m-%d")
 
-    data = get_data_in_range(ticker, before, curr_date, "insider_trans", DATA_DIR)
+    data = get_data_in_range(ticker, before, curr_date, "insider_trans", get_data_dir())
 
     if len(data) == 0:
         return ""
@@ -233,7 +233,7 @@ def get_simfin_balance_sheet(
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
     data_path = os.path.join(
-        DATA_DIR,
+        get_data_dir(),
         "fundamental_data",
         "simfin_data_all",
         "balance_sheet",
@@ -280,7 +280,7 @@ def get_simfin_cashflow(
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
     data_path = os.path.join(
-        DATA_DIR,
+        get_data_dir(),
         "fundamental_data",
         "simfin_data_all",
         "cash_flow",
@@ -327,7 +327,7 @@ def get_simfin_income_statements(
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
     data_path = os.path.join(
-        DATA_DIR,
+        get_data_dir(),
         "fundamental_data",
         "simfin_data_all",
         "income_statements",
@@ -397,7 +397,7 @@ def get_reddit_global_news(
             "global_news",
             curr_date_str,
             limit,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
+            data_path=os.path.join(get_data_dir(), "reddit_data"),
         )
         posts.extend(fetch_result)
         curr_iter_date += relativedelta(days=1)
@@ -453,7 +453,7 @@ def get_reddit_company_news(
             curr_date_str,
             10,  # max limit per day
             query,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
+            data_path=os.path.join(get_data_dir(), "reddit_data"),
         )
         posts.extend(fetch_result)
         curr_date += relativedelta(days=1)
@@ -0,0 +1,205 @@
+"""Per-run tool result cache with speculative prefetch.
+
+The first turn of each analyst is predictable: the fundamentals analyst asks
+for the company's statements, the news analysts for the past week of news,
+and the market analyst for price data and indicators. When a run starts,
+``prefetch_run`` issues those calls on a thread pool while the first LLM
+turns are in flight and keeps the results in a cache that route_to_vendor
+consults, so the tool calls that match are served from memory. A call made
+while the same call is still being prefetched waits for it instead of going
+to the vendor twice.
+
+Price data and indicators take LLM-chosen date ranges that cannot be
+predicted exactly; for them the symbol's price history and indicator panel
+are brought up to date instead, which any date range is then served from.
+
+Only calls whose configured vendors are free to call are prefetched
+(``config["prefetch"]["vendors"]``, by default yfinance and local data): a
+prediction the analysts do not follow would otherwise spend the quota of a
+metered API such as Alpha Vantage.
+"""
+
+import contextlib
+import contextvars
+import json
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from tradingagents.observability.profiling import record_cache_hit
+from tradingagents.observability.tracing import span
+
+logger = logging.getLogger(__name__)
+
+# Vendors whose calls cost no API quota, the only ones prefetched by default
+FREE_VENDORS = ("yfinance", "local")
+
+_current_cache: ContextVar[Optional["ToolResultCache"]] = ContextVar("tool_result_cache", default=None)
+
+
+def _key(method: str, args: Tuple, kwargs: Dict[str, Any]) -> str:
+    return json.dumps([method, list(args), kwargs], sort_keys=True, default=str)
+
+
+class ToolResultCache:
+    """Results of the vendor calls of one run, by method and arguments.
+
+    A call waits at most ``wait_s`` seconds for an identical call in flight
+    before making the call itself.
+    """
+
+    def __init__(self, wait_s: Optional[float] = None):
+        self.wait_s = wait_s
+        self._entries: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def get_or_call(self, method: str, args: Tuple, kwargs: Dict[str, Any], call: Callable):
+        """The cached result of ``call(method, *args, **kwargs)``, calling it on a miss.
+
+        Failed calls are not cached: the next identical call tries again.
+        """
+        key = _key(method, args, kwargs)
+        with self._lock:
+            future = self._entries.get(key)
+            owner = future is None
+            if owner:
+                future = self._entries[key] = Future()
+
+        if not owner:
+            try:
+                result = future.result(timeout=self.wait_s)
+            except FutureTimeoutError:
+                logger.debug("%s%s still in flight after %ss; calling it directly", method, args, self.wait_s)
+                return call(method, *args, **kwargs)
+            except Exception:
+                # The call being waited on failed; make it again
+                return call(method, *args, **kwargs)
+            record_cache_hit()
+            return result
+
+        try:
+            result = call(method, *args, **kwargs)
+        except BaseException as e:
+            with self._lock:
+                self._entries.pop(key, None)
+            future.set_exception(e)
+            raise
+        future.set_result(result)
+        return result
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def current_tool_cache() -> Optional[ToolResultCache]:
+    return _current_cache.get()
+
+
+def predicted_calls(
+    ticker: str, trade_date: str, selected_analysts: Iterable[str], news_look_back_days: int = 7
+) -> List[Tuple[str, Tuple]]:
+    """Vendor calls (method, positional arguments) the analysts' first turns will make."""
+    week_start = (
+        datetime.strptime(trade_date, "%Y-%m-%d") - timedelta(days=news_look_back_days)
+    ).strftime("%Y-%m-%d")
+    calls_by_analyst = {
+        "social": [("get_news", (ticker, week_start, trade_date))],
+        "news": [
+            ("get_news", (ticker, week_start, trade_date)),
+            ("get_global_news", (trade_date, 7, 5)),
+        ],
+        "fundamentals": [
+            ("get_fundamentals", (ticker, trade_date)),
+            ("get_balance_sheet", (ticker, "quarterly", trade_date)),
+            ("get_cashflow", (ticker, "quarterly", trade_date)),
+            ("get_income_statement", (ticker, "quarterly", trade_date)),
+        ],
+    }
+    calls = []
+    for analyst in selected_analysts:
+        for call in calls_by_analyst.get(analyst, []):
+            if call not in calls:
+                calls.append(call)
+    return calls
+
+
+def _free_to_call(method: str, vendors: Iterable[str]) -> bool:
+    """Whether every vendor configured for the method is one of ``vendors``."""
+    from .interface import _fallback_order
+
+    primary_vendors, _ = _fallback_order(method)
+    return all(vendor in vendors for vendor in primary_vendors)
+
+
+def _prefetch_call(cache: ToolResultCache, method: str, args: Tuple):
+    from .interface import _route_to_vendor
+
+    with span(f"prefetch {method}", method=method):
+        try:
+            cache.get_or_call(method, args, {}, _route_to_vendor)
+        except Exception as e:
+            logger.debug("Prefetch of %s%s failed: %s", method, args, e)
+
+
+def _warm_price_data(ticker: str):
+    """Bring the symbol's cached price history and indicator panel up to date."""
+    from .config import get_config
+    from .interface import get_vendor
+
+    config = get_config()
+    if "yfinance" not in get_vendor("core_stock_apis", "get_stock_data"):
+        return
+    with span("prefetch price history", symbol=ticker):
+        try:
+            from .price_cache import load_price_history
+
+            prices = load_price_history(ticker)
+            if config.get("indicator_panel", True) and "yfinance" in get_vendor(
+                "technical_indicators", "get_indicators"
+            ):
+                from .indicator_panel import update_panel
+
+                update_panel(ticker, prices)
+        except Exception as e:
+            logger.debug("Prefetch of the price data of %s failed: %s", ticker, e)
+
+
+@contextlib.contextmanager
+def prefetch_run(ticker: str, trade_date: str, selected_analysts: Iterable[str], config: Dict[str, Any]):
+    """Serve the enclosed run's vendor calls from a cache warmed in the background.
+
+    Yields the cache, or None when ``config["prefetch"]`` is disabled. Enter
+    it after the run's config is in place: the prefetch threads run in a copy
+    of the current context, and the configured vendors decide which predicted
+    calls are made.
+    """
+    settings = config.get("prefetch") or {}
+    if not settings.get("enabled"):
+        yield None
+        return
+
+    cache = ToolResultCache(settings.get("wait_s"))
+    vendors = settings.get("vendors", FREE_VENDORS)
+    token = _current_cache.set(cache)
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, settings.get("workers", 4)), thread_name_prefix="prefetch"
+    )
+    try:
+        ticker = ticker.upper()
+        executor.submit(contextvars.copy_context().run, _warm_price_data, ticker)
+        for method, args in predicted_calls(
+            ticker, str(trade_date), selected_analysts, settings.get("news_look_back_days", 7)
+        ):
+            if _free_to_call(method, vendors):
+                executor.submit(contextvars.copy_context().run, _prefetch_call, cache, method, args)
+            else:
+                logger.debug("Not prefetching %s: its vendor is not in %s", method, vendors)
+        yield cache
+    finally:
+        _current_cache.reset(token)
+        # Prefetches still running when the run ends are not waited for
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,332 @@
+"""Cache of daily Yahoo Finance price history shared by the yfinance tools.
+
+Each symbol's auto-adjusted daily bars (with dividends and splits) live in
+one CSV per symbol in ``data_cache_dir``, next to a small JSON file recording
+the dates it covers, and are kept in memory. The cache is updated
+incrementally: once a day the missing tail is downloaded with a few days of
+overlap. Because prices are back-adjusted, a new split or dividend changes
+the whole history; when the tail contains one, or the overlapping bars no
+longer match the cached ones, the symbol is downloaded again in full.
+
+``prefetch_price_history`` fills or updates the cache for a whole ticker
+list with multi-symbol downloads:
+
+    from tradingagents.dataflows.price_cache import prefetch_price_history
+
+    prefetch_price_history(["AAPL", "MSFT", "NVDA"])
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from tradingagents.observability.profiling import record_cache_hit
+from tradingagents.observability.tracing import SPAN_KIND_CLIENT, span
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Years of history downloaded for a new symbol
+HISTORY_YEARS = 15
+
+# Trading days re-downloaded before the last cached bar to detect adjustments
+OVERLAP_DAYS = 5
+
+# Relative price difference on the overlap that triggers a full re-download
+ADJUSTMENT_TOLERANCE = 1e-6
+
+# Price history kept in memory, in symbols (the CSV files hold the rest)
+MEMORY_CACHE_SIZE = 64
+
+# Files of the previous date-stamped cache: {symbol}-YFin-data-{start}-{end}.csv
+_LEGACY_FILE = re.compile(r"^(.+)-YFin-data-(\d{4}-\d{2}-\d{2})-(\d{4}-\d{2}-\d{2})\.csv$")
+
+# Keyed by cache file path: (date the data was last updated to, frame)
+_frames: "OrderedDict[str, Tuple[str, pd.DataFrame]]" = OrderedDict()
+_symbol_locks: Dict[str, threading.Lock] = {}
+_collected_dirs = set()
+_lock = threading.Lock()
+
+
+def _today() -> str:
+    return pd.Timestamp.today().strftime("%Y-%m-%d")
+
+
+def history_cache_path(symbol: str) -> str:
+    return os.path.join(get_config()["data_cache_dir"], f"{symbol.upper()}-YFin-data.csv")
+
+
+def _meta_path(path: str) -> str:
+    return path[: -len(".csv")] + ".meta.json"
+
+
+def _symbol_lock(path: str) -> threading.Lock:
+    with _lock:
+        return _symbol_locks.setdefault(path, threading.Lock())
+
+
+def _remember(path: str, end: str, data: pd.DataFrame):
+    with _lock:
+        _frames[path] = (end, data)
+        _frames.move_to_end(path)
+        while len(_frames) > MEMORY_CACHE_SIZE:
+            _frames.popitem(last=False)
+
+
+def _read(path: str) -> Tuple[Optional[pd.DataFrame], Dict]:
+    """Cached frame and metadata of a symbol (memory, then disk)."""
+    with _lock:
+        entry = _frames.get(path)
+        if entry is not None:
+            _frames.move_to_end(path)
+            return entry[1], {"end": entry[0]}
+
+    if not os.path.exists(path):
+        return None, {}
+    try:
+        with open(_meta_path(path)) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        # Without metadata the tail is checked again on next use
+        meta = {}
+    data = pd.read_csv(path)
+    data["Date"] = pd.to_datetime(data["Date"])
+    _remember(path, meta.get("end", ""), data)
+    return data, meta
+
+
+def _write(path: str, data: pd.DataFrame, end: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    meta = {
+        "start": data["Date"].iloc[0].strftime("%Y-%m-%d") if not data.empty else None,
+        "last_date": data["Date"].iloc[-1].strftime("%Y-%m-%d") if not data.empty else None,
+        "end": end,
+    }
+    # Write temporary files first so readers never see a partial cache
+    data.to_csv(path + ".tmp", index=False)
+    with open(_meta_path(path) + ".tmp", "w") as f:
+        json.dump(meta, f)
+    os.replace(path + ".tmp", path)
+    os.replace(_meta_path(path) + ".tmp", _meta_path(path))
+    _remember(path, end, data)
+
+
+def _download(
+    symbols: List[str], start: str, end: str, threads: bool = True
+) -> Dict[str, pd.DataFrame]:
+    """Download daily bars for several symbols in one request, split per symbol."""
+    with span("yfinance download", SPAN_KIND_CLIENT, symbols=symbols, start=start, end=end):
+        data = yf.download(
+            symbols,
+            start=start,
+            end=end,
+            group_by="ticker",
+            threads=threads,
+            progress=False,
+            auto_adjust=True,
+            actions=True,
+        )
+    if data is None or data.empty:
+        return {}
+
+    frames = {}
+    for symbol in symbols:
+        if isinstance(data.columns, pd.MultiIndex):
+            if symbol not in data.columns.get_level_values(0):
+                continue
+            frame = data[symbol]
+        else:
+            frame = data
+        frame = frame.dropna(how="all").reset_index()
+        if frame.empty:
+            continue
+        frame.columns.name = None
+        frame["Date"] = pd.to_datetime(frame["Date"]).dt.tz_localize(None)
+        frames[symbol] = frame
+    return frames
+
+
+def _history_start() -> str:
+    start = pd.Timestamp.today() - pd.DateOffset(years=HISTORY_YEARS)
+    return start.strftime("%Y-%m-%d")
+
+
+def _tail_start(cached: pd.DataFrame) -> str:
+    return cached["Date"].iloc[-min(OVERLAP_DAYS, len(cached))].strftime("%Y-%m-%d")
+
+
+def _merge_tail(cached: pd.DataFrame, tail: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """Append new bars to the cached history, or None if it must be re-downloaded.
+
+    That is the case when the overlapping bars no longer match (an adjustment
+    happened since the last update) or when the new bars include a split or
+    dividend, which changes all earlier adjusted prices.
+    """
+    overlap = cached.merge(tail, on="Date", suffixes=("", "_new"))
+    if overlap.empty:
+        return None
+    for column in ("Open", "High", "Low", "Close"):
+        if not np.allclose(
+            overlap[column], overlap[f"{column}_new"], rtol=ADJUSTMENT_TOLERANCE, equal_nan=True
+        ):
+            return None
+
+    new_rows = tail[tail["Date"] > cached["Date"].iloc[-1]]
+    for column in ("Dividends", "Stock Splits"):
+        if column in new_rows and (new_rows[column].fillna(0) != 0).any():
+            return None
+
+    if new_rows.empty:
+        return cached
+    return pd.concat([cached, new_rows.reindex(columns=cached.columns)], ignore_index=True)
+
+
+def _update(path: str, cached: pd.DataFrame, tail: Optional[pd.DataFrame], end: str) -> bool:
+    """Merge a downloaded tail into the cache; False if a full download is needed."""
+    merged = None if tail is None else _merge_tail(cached, tail)
+    if merged is None:
+        return False
+    _write(path, merged, end)
+    return True
+
+
+def cached_price_history(symbol: str) -> Optional[pd.DataFrame]:
+    """History of a symbol as last cached, or None, without downloading."""
+    data, _ = _read(history_cache_path(symbol))
+    return None if data is None else data.copy()
+
+
+def load_price_history(symbol: str) -> pd.DataFrame:
+    """Daily history of a symbol, downloading only what the cache is missing."""
+    symbol = symbol.upper()
+    path = history_cache_path(symbol)
+    gc_legacy_cache_files(os.path.dirname(path))
+    end = _today()
+
+    with _symbol_lock(path):
+        cached, meta = _read(path)
+        if cached is not None and not cached.empty:
+            if meta.get("end") == end:
+                record_cache_hit()
+                return cached.copy()
+            try:
+                tail = _download([symbol], _tail_start(cached), end).get(symbol)
+            except Exception as e:
+                logger.warning("Updating the price history of %s failed: %s", symbol, e)
+                tail = None
+            if tail is None and meta.get("end"):
+                # The tail overlaps cached bars, so a successful download is
+                # never empty (days without new bars are handled by _update):
+                # serve the cache and try again on next use
+                return cached.copy()
+            if _update(path, cached, tail, end):
+                return _read(path)[0].copy()
+
+        data = _download([symbol], _history_start(), end).get(symbol)
+        if data is None and cached is not None and not cached.empty:
+            # Keep the adjusted history rather than replace it with nothing
+            return cached.copy()
+        if data is None:
+            data = pd.DataFrame({"Date": pd.to_datetime([])})
+            for column in ("Open", "High", "Low", "Close", "Volume", "Dividends", "Stock Splits"):
+                data[column] = pd.Series(dtype=float)
+        _write(path, data, end)
+        return data.copy()
+
+
+def prefetch_price_history(
+    symbols: Iterable[str], threads: bool = True, refresh: bool = False
+) -> Dict[str, int]:
+    """Fill or update the cache for many symbols with multi-symbol downloads.
+
+    Cached symbols get their missing tails in one request; new symbols, and
+    symbols whose history was adjusted since, get their full history in
+    another. ``refresh`` ignores the cached data. Later price and indicator
+    tool calls for these symbols are cache hits. Returns the number of rows
+    cached per symbol (0 when Yahoo Finance returned no data).
+    """
+    symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+    end = _today()
+    paths = {symbol: history_cache_path(symbol) for symbol in symbols}
+    for directory in {os.path.dirname(path) for path in paths.values()}:
+        gc_legacy_cache_files(directory)
+
+    rows: Dict[str, int] = {}
+    stale: Dict[str, pd.DataFrame] = {}
+    missing: List[str] = []
+    for symbol in symbols:
+        cached, meta = (None, {}) if refresh else _read(paths[symbol])
+        if cached is None or cached.empty:
+            missing.append(symbol)
+        elif meta.get("end") == end:
+            rows[symbol] = len(cached)
+        else:
+            stale[symbol] = cached
+
+    if stale:
+        start = min(_tail_start(cached) for cached in stale.values())
+        tails = _download(list(stale), start, end, threads)
+        for symbol, cached in stale.items():
+            with _symbol_lock(paths[symbol]):
+                if _update(paths[symbol], cached, tails.get(symbol), end):
+                    rows[symbol] = len(_read(paths[symbol])[0])
+                else:
+                    missing.append(symbol)
+
+    if missing:
+        frames = _download(missing, _history_start(), end, threads)
+        for symbol in missing:
+            frame = frames.get(symbol)
+            if frame is None:
+                rows[symbol] = 0
+                continue
+            with _symbol_lock(paths[symbol]):
+                _write(paths[symbol], frame, end)
+            rows[symbol] = len(frame)
+
+    return {symbol: rows[symbol] for symbol in symbols}
+
+
+def gc_legacy_cache_files(cache_dir: Optional[str] = None, force: bool = False) -> List[str]:
+    """Delete the date-stamped files of the previous cache layout, once per directory.
+
+    Only files named like the old 15-year online cache are removed; other
+    CSVs in the directory are left alone. Returns the deleted paths.
+    """
+    cache_dir = cache_dir or get_config()["data_cache_dir"]
+    with _lock:
+        if cache_dir in _collected_dirs and not force:
+            return []
+        _collected_dirs.add(cache_dir)
+
+    removed = []
+    if not os.path.isdir(cache_dir):
+        return removed
+    for name in os.listdir(cache_dir):
+        match = _LEGACY_FILE.match(name)
+        if not match:
+            continue
+        start, end = pd.Timestamp(match.group(2)), pd.Timestamp(match.group(3))
+        if start != end - pd.DateOffset(years=HISTORY_YEARS):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            os.remove(path)
+            removed.append(path)
+        except OSError:
+            pass
+    return removed
+
+
+def clear_memory_cache():
+    with _lock:
+        _frames.clear()
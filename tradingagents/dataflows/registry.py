@@ -0,0 +1,287 @@
+"""Registry of data vendors and the methods they implement.
+
+Vendors register implementations either as "module:function" paths, which
+are imported on first use, or with the ``vendor_method`` decorator. Third-party
+packages can add vendors through the ``tradingagents.vendors`` entry point
+group, whose entries are callables taking the registry.
+
+    from tradingagents.dataflows.registry import vendor_method
+
+    @vendor_method("get_news", "my_vendor")
+    def get_news(query, start_date, end_date):
+        ...
+
+Implementations can also declare that they are coroutines (supports_async)
+or come with a batch variant (batch_target), and vendors can declare a rate
+limit with set_rate_limit(); the router uses these to run calls concurrently
+or in one batch and to pace requests.
+"""
+
+import importlib
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from importlib import metadata
+from typing import Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "tradingagents.vendors"
+
+
+@dataclass
+class VendorImpl:
+    """One vendor implementation of a tool method, plus its capabilities."""
+
+    method: str
+    vendor: str
+    target: Union[str, Callable]
+    # The implementation is a coroutine function
+    supports_async: bool = False
+    # Optional implementation taking a list of kwargs dicts and returning a
+    # list of results, used to serve several calls at once
+    batch_target: Optional[Union[str, Callable]] = None
+    _func: Optional[Callable] = field(default=None, repr=False)
+    _batch_func: Optional[Callable] = field(default=None, repr=False)
+
+    @property
+    def name(self) -> str:
+        if callable(self.target):
+            return self.target.__name__
+        return self.target.split(":")[-1]
+
+    @property
+    def supports_batch(self) -> bool:
+        return self.batch_target is not None
+
+    def load(self) -> Callable:
+        """Import (once) and return the implementation."""
+        if self._func is None:
+            self._func = _resolve(self.target)
+        return self._func
+
+    def load_batch(self) -> Callable:
+        if self._batch_func is None:
+            self._batch_func = _resolve(self.batch_target)
+        return self._batch_func
+
+
+def _resolve(target: Union[str, Callable]) -> Callable:
+    """Resolve a "module:function" path; modules without a dot live in this package."""
+    if callable(target):
+        return target
+    module_name, func_name = target.split(":")
+    if "." not in module_name:
+        module_name = f"{__package__}.{module_name}"
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+class RateLimiter:
+    """Thread-safe limiter allowing at most ``per_minute`` calls per rolling minute."""
+
+    def __init__(self, per_minute: float):
+        self.interval = 60.0 / per_minute
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the next call is allowed."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class VendorRegistry:
+    """Maps tool methods to categories and to their vendor implementations."""
+
+    def __init__(self):
+        self.categories: Dict[str, Dict] = {}
+        self._method_categories: Dict[str, str] = {}
+        # method -> vendor -> implementations (some vendors chain several)
+        self._impls: Dict[str, Dict[str, List[VendorImpl]]] = {}
+        self._rate_limits: Dict[str, float] = {}
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._lock = threading.Lock()
+        self._entry_points_loaded = False
+
+    def add_category(self, category: str, description: str, methods: List[str]):
+        """Declare a category of tool methods that share a vendor setting."""
+        self.categories[category] = {"description": description, "tools": list(methods)}
+        for method in methods:
+            self._method_categories[method] = category
+            self._impls.setdefault(method, {})
+
+    def register(
+        self,
+        method: str,
+        vendor: str,
+        target: Union[str, Callable],
+        supports_async: bool = False,
+        batch_target: Optional[Union[str, Callable]] = None,
+    ) -> VendorImpl:
+        """Register an implementation; registering a vendor twice chains both."""
+        if method not in self._method_categories:
+            raise ValueError(f"Method '{method}' not found in any category")
+        impl = VendorImpl(method, vendor, target, supports_async, batch_target)
+        self._impls[method].setdefault(vendor, []).append(impl)
+        return impl
+
+    def vendor_method(self, method: str, vendor: str, **capabilities):
+        """Decorator form of register()."""
+
+        def decorator(func: Callable) -> Callable:
+            self.register(method, vendor, func, **capabilities)
+            return func
+
+        return decorator
+
+    def set_rate_limit(self, vendor: str, per_minute: Optional[float]):
+        """Declare how many calls per minute a vendor allows (None for unlimited)."""
+        with self._lock:
+            if per_minute:
+                self._rate_limits[vendor] = per_minute
+            else:
+                self._rate_limits.pop(vendor, None)
+            self._limiters.pop(vendor, None)
+
+    def rate_limit(self, vendor: str) -> Optional[float]:
+        return self._rate_limits.get(vendor)
+
+    def limiter(self, vendor: str, per_minute: Optional[float] = None) -> Optional[RateLimiter]:
+        """Shared limiter for a vendor, or None when it is not rate limited."""
+        per_minute = per_minute or self._rate_limits.get(vendor)
+        if not per_minute:
+            return None
+        with self._lock:
+            limiter = self._limiters.get(vendor)
+            if limiter is None or limiter.interval != 60.0 / per_minute:
+                limiter = self._limiters[vendor] = RateLimiter(per_minute)
+            return limiter
+
+    def category_for(self, method: str) -> str:
+        try:
+            return self._method_categories[method]
+        except KeyError:
+            raise ValueError(f"Method '{method}' not found in any category") from None
+
+    def vendors_for(self, method: str) -> List[str]:
+        """Vendors implementing a method, in registration order."""
+        self.load_entry_points()
+        if method not in self._impls:
+            raise ValueError(f"Method '{method}' not supported")
+        return list(self._impls[method])
+
+    def implementations(self, method: str, vendor: str) -> List[VendorImpl]:
+        self.load_entry_points()
+        return self._impls.get(method, {}).get(vendor, [])
+
+    def load_entry_points(self):
+        """Let installed packages register their vendors (once per process)."""
+        if self._entry_points_loaded:
+            return
+        with self._lock:
+            if self._entry_points_loaded:
+                return
+            self._entry_points_loaded = True
+        for entry_point in metadata.entry_points(group=ENTRY_POINT_GROUP):
+            try:
+                entry_point.load()(self)
+            except Exception as e:
+                logger.warning("Failed to load vendor plugin '%s': %s", entry_point.name, e)
+
+
+def _register_builtin_vendors(registry: VendorRegistry):
+    # Tools organized by category
+    registry.add_category(
+        "core_stock_apis", "OHLCV stock price data", ["get_stock_data"]
+    )
+    registry.add_category(
+        "technical_indicators", "Technical analysis indicators", ["get_indicators"]
+    )
+    registry.add_category(
+        "fundamental_data",
+        "Company fundamentals",
+        ["get_fundamentals", "get_balance_sheet", "get_cashflow", "get_income_statement"],
+    )
+    registry.add_category(
+        "news_data",
+        "News (public/insiders, original/processed)",
+        ["get_news", "get_global_news", "get_insider_sentiment", "get_insider_transactions"],
+    )
+
+    builtin = {
+        # core_stock_apis
+        "get_stock_data": {
+            "alpha_vantage": "alpha_vantage:get_stock",
+            "yfinance": "y_finance:get_YFin_data_online",
+            "local": "local:get_YFin_data",
+        },
+        # technical_indicators
+        "get_indicators": {
+            "alpha_vantage": "alpha_vantage:get_indicator",
+            "yfinance": "y_finance:get_stock_stats_indicators_window",
+            "local": "y_finance:get_stock_stats_indicators_window",
+        },
+        # fundamental_data
+        "get_fundamentals": {
+            "alpha_vantage": "alpha_vantage:get_fundamentals",
+            "openai": "openai:get_fundamentals_openai",
+        },
+        "get_balance_sheet": {
+            "alpha_vantage": "alpha_vantage:get_balance_sheet",
+            "yfinance": "y_finance:get_balance_sheet",
+            "local": "local:get_simfin_balance_sheet",
+        },
+        "get_cashflow": {
+            "alpha_vantage": "alpha_vantage:get_cashflow",
+            "yfinance": "y_finance:get_cashflow",
+            "local": "local:get_simfin_cashflow",
+        },
+        "get_income_statement": {
+            "alpha_vantage": "alpha_vantage:get_income_statement",
+            "yfinance": "y_finance:get_income_statement",
+            "local": "local:get_simfin_income_statements",
+        },
+        # news_data
+        "get_news": {
+            "alpha_vantage": "alpha_vantage:get_news",
+            "openai": "openai:get_stock_news_openai",
+            "google": "google:get_google_news",
+            "local": ["local:get_finnhub_news", "local:get_reddit_company_news", "google:get_google_news"],
+        },
+        "get_global_news": {
+            "openai": "openai:get_global_news_openai",
+            "local": "local:get_reddit_global_news",
+        },
+        "get_insider_sentiment": {
+            "local": "local:get_finnhub_company_insider_sentiment",
+        },
+        "get_insider_transactions": {
+            "alpha_vantage": "alpha_vantage:get_insider_transactions",
+            "yfinance": "y_finance:get_insider_transactions",
+            "local": "local:get_finnhub_company_insider_transactions",
+        },
+    }
+    # Implementations that can serve several calls at once
+    batch_targets = {
+        ("get_stock_data", "yfinance"): "y_finance:get_YFin_data_online_batch",
+    }
+    for method, vendors in builtin.items():
+        for vendor, targets in vendors.items():
+            for target in targets if isinstance(targets, list) else [targets]:
+                registry.register(
+                    method, vendor, target, batch_target=batch_targets.get((method, vendor))
+                )
+
+    # Alpha Vantage premium starts at 75 requests per minute
+    registry.set_rate_limit("alpha_vantage", 75)
+
+
+# Registry used by route_to_vendor
+registry = VendorRegistry()
+_register_builtin_vendors(registry)
+vendor_method = registry.vendor_method
@@ -1,8 +1,12 @@
-from typing import Annotated
+from typing import Annotated, Dict, List
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
+import pandas as pd
 import yfinance as yf
 import os
+from .indicator_engine import INDICATORS, compute_indicators
+from .indicator_panel import indicator_window
+from .price_cache import cached_price_history, load_price_history, prefetch_price_history
 from .stockstats_utils import StockstatsUtils
 
 def get_YFin_data_online(
@@ -14,11 +18,15 @@ def get_YFin_data_online(
     datetime.strptime(start_date, "%Y-%m-%d")
     datetime.strptime(end_date, "%Y-%m-%d")
 
-    # Create ticker object
-    ticker = yf.Ticker(symbol.upper())
+    # Serve from the price history cache when the symbol was prefetched
+    data = _cached_history_range(symbol, start_date, end_date)
 
-    # Fetch historical data for the specified date range
-    data = ticker.history(start=start_date, end=end_date)
+    if data is None:
+        # Create ticker object
+        ticker = yf.Ticker(symbol.upper())
+
+        # Fetch historical data for the specified date range
+        data = ticker.history(start=start_date, end=end_date)
 
     # Check if data is empty
     if data.empty:
@@ -46,6 +54,24 @@ def get_YFin_data_online(
 
     return header + csv_string
 
+
+def _cached_history_range(symbol: str, start_date: str, end_date: str):
+    """Rows of the cached price history in [start_date, end_date), or None if not cached."""
+    data = cached_price_history(symbol)
+    if data is None or data.empty or data["Date"].iloc[0] > pd.Timestamp(start_date):
+        return None
+    # Bring the cached history up to date (at most a tail download per day)
+    data = load_price_history(symbol)
+    data = data.set_index("Date")
+    return data[(data.index >= start_date) & (data.index < end_date)]
+
+
+def get_YFin_data_online_batch(calls: List[Dict]) -> List[str]:
+    """Batch variant of get_YFin_data_online: one download for all symbols."""
+    prefetch_price_history([call["symbol"] for call in calls])
+    return [get_YFin_data_online(**call) for call in calls]
+
+
 def get_stock_stats_indicators_window(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to get the analysis and report of"],
@@ -139,7 +165,13 @@ def get_stock_stats_indicators_window(
 
     # Optimized: Get stock data once and calculate indicators for all dates
     try:
-        indicator_data = _get_stock_stats_bulk(symbol, indicator, curr_date)
+        if _use_indicator_panel():
+            # Slice of the precomputed indicator panel
+            indicator_data = indicator_window(
+                symbol, indicator, before.strftime("%Y-%m-%d"), end_date
+            )
+        else:
+            indicator_data = _get_stock_stats_bulk(symbol, indicator, curr_date)
         
         # Generate the date range we need
         current_dt = curr_date_dt
@@ -184,6 +216,15 @@ def get_stock_stats_indicators_window(
     return result_str
 
 
+def _use_indicator_panel() -> bool:
+    from .config import get_config
+    from .interface import get_vendor
+
+    # The tool-level vendor override takes precedence, as in routing
+    vendor = get_vendor("technical_indicators", "get_indicators")
+    return get_config().get("indicator_panel", True) and vendor != "local"
+
+
 def _get_stock_stats_bulk(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to calculate"],
@@ -215,49 +256,21 @@ def _get_stock_stats_bulk(
         except FileNotFoundError:
             raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
     else:
-        # Online data fetching with caching
-        today_date = pd.Timestamp.today()
-        curr_date_dt = pd.to_datetime(curr_date)
-        
-        end_date = today_date
-        start_date = today_date - pd.DateOffset(years=15)
-        start_date_str = start_date.strftime("%Y-%m-%d")
-        end_date_str = end_date.strftime("%Y-%m-%d")
-        
-        os.makedirs(config["data_cache_dir"], exist_ok=True)
-        
-        data_file = os.path.join(
-            config["data_cache_dir"],
-            f"{symbol}-YFin-data-{start_date_str}-{end_date_str}.csv",
-        )
-        
-        if os.path.exists(data_file):
-            data = pd.read_csv(data_file)
-            data["Date"] = pd.to_datetime(data["Date"])
-        else:
-            data = yf.download(
-                symbol,
-                start=start_date_str,
-                end=end_date_str,
-                multi_level_index=False,
-                progress=False,
-                auto_adjust=True,
-            )
-            data = data.reset_index()
-            data.to_csv(data_file, index=False)
-        
+        # Online data, shared with the price tools through the price cache
+        data = load_price_history(symbol)
         df = wrap(data)
         df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
     
     # Calculate the indicator for all rows at once
-    df[indicator]  # This triggers stockstats to calculate the indicator
+    if indicator in INDICATORS and config.get("indicator_engine", "numpy") == "numpy":
+        values = compute_indicators(data, [indicator], engine="numpy")[indicator].values
+    else:
+        df[indicator]  # This triggers stockstats to calculate the indicator
+        values = df[indicator].values
     
     # Create a dictionary mapping date strings to indicator values
     result_dict = {}
-    for _, row in df.iterrows():
-        date_str = row["Date"]
-        indicator_value = row[indicator]
-        
+    for date_str, indicator_value in zip(df["Date"], values):
         # Handle NaN/None values
         if pd.isna(indicator_value):
             result_dict[date_str] = "N/A"
@@ -16,7 +16,60 @@ DEFAULT_CONFIG = {
     # Debate and discussion settings
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
+    # End a debate early once every side restates its previous argument
+    # (word-overlap similarity between consecutive turns; None disables)
+    "debate_convergence_threshold": 0.6,
     "max_recur_limit": 100,
+    # Record per-node wall time, LLM calls, tokens, tool calls and cache hits
+    # of each run in final_state["run_profile"] and the state log
+    "profile_runs": True,
+    # Model per node by tier (see tradingagents/graph/model_routing.py):
+    # analysts pick tools with "fast" and write reports with "mid", judges
+    # use "deep" (deep_think_llm). Compare tiers with the per-model latency
+    # in run profiles and the per-model cost in budgets
+    "model_routing": {
+        "enabled": False,
+        "models": {"fast": None, "mid": None},  # None: the provider's suggestion, else quick_think_llm
+        "providers": {},   # Per provider tiers, e.g. {"openai": {"fast": "gpt-4.1-nano"}}
+        "tool_turns": "fast",
+        "nodes": {},       # Tier per node name, e.g. {"Trader": "deep"}
+        "max_tokens": {"fast": None, "mid": None, "deep": None},  # Completion cap per tier
+    },
+    # Token and cost limits (prices per model in tradingagents/graph/budget.py).
+    # Past soft_fraction of a limit, debates end early and deep-thinking calls
+    # use the quick model; at the limit the run aborts with a HOLD decision
+    "budget": {
+        "enabled": False,
+        "run_usd": 0.50,       # Per propagate (None: no limit)
+        "run_tokens": None,
+        "batch_usd": None,     # Across all runs of a graph or backtest
+        "batch_tokens": None,
+        "soft_fraction": 0.8,
+        "prices": {},          # USD per 1M tokens, e.g. {"my-model": {"input": 0.5, "output": 1.5}}
+    },
+    # Nested spans per run (run -> node -> LLM/tool call -> vendor routing ->
+    # vendor attempt -> HTTP request), appended to a file as OTLP JSON
+    "tracing": {
+        "enabled": False,
+        "path": None,  # Default: {results_dir}/traces.jsonl
+        "service_name": "tradingagents",
+    },
+    # Skip the debates and decide in a single call when all analysts agree
+    "fast_path": {
+        "enabled": False,
+        "agreement_threshold": 0.6,  # Minimum stance strength every report must reach (0-1)
+    },
+    # Prompt budgeting for the debate stage: reports over their share are
+    # condensed by one extra (lossy) LLM call, and the history is windowed
+    "context_budget": {
+        "enabled": False,
+        "tokenizer": "approx",  # Options: approx, tiktoken
+        "model_prompt_tokens": {  # Prompt token budget per model name
+            "default": 16000,
+        },
+        "report_share": 0.5,   # Share of the budget for the four analyst reports
+        "history_share": 0.3,  # Share of the budget for the debate history window
+    },
     # Data vendor configuration
     # Category-level configuration (default for all tools in category)
     "data_vendors": {
@@ -30,6 +83,30 @@ DEFAULT_CONFIG = {
         # Example: "get_stock_data": "alpha_vantage",  # Override category default
         # Example: "get_news": "openai",               # Override category default
     },
+    # Serve yfinance indicators from precomputed panels in data_cache_dir
+    # (see tradingagents/dataflows/indicator_panel.py)
+    "indicator_panel": True,
+    # At the start of each run, fetch the tool data the analysts' first turns
+    # ask for (statements, the week's news, price history and indicators) in
+    # the background, and serve repeated tool calls of the run from memory
+    # (see tradingagents/dataflows/prefetch.py). Predicted calls are only made
+    # when their configured vendors are listed in "vendors": adding a metered
+    # vendor such as alpha_vantage costs up to 6 API calls per run, some of
+    # which the analysts may never use
+    "prefetch": {
+        "enabled": True,
+        "workers": 4,
+        "news_look_back_days": 7,  # Window of the predicted get_news calls
+        "vendors": ["yfinance", "local"],
+        "wait_s": 30,  # Longest wait for a call in flight before calling directly
+    },
+    # Indicator implementation: "numpy" (vectorized, see
+    # tradingagents/dataflows/indicator_engine.py) or "stockstats"
+    "indicator_engine": "numpy",
+    # Requests per minute per vendor (overrides the limit a vendor declares)
+    "vendor_rate_limits": {
+        # Example: "alpha_vantage": 5,  # Free tier
+    },
     # Optional paper-trading integration (Alpaca)
     "alpaca_paper_trading": {
         "enabled": True,  # Set True to place paper trades, otherwise False
@@ -40,5 +117,20 @@ DEFAULT_CONFIG = {
         "order_qty": float(os.getenv("ALPACA_ORDER_QTY", "1")),  # Share quantity per order
         "time_in_force": os.getenv("ALPACA_TIME_IN_FORCE", "day"),
         "extended_hours": os.getenv("ALPACA_EXTENDED_HOURS", "false").lower() == "true",
+        "timeout": 10,        # Seconds per request
+        "max_retries": 3,     # Retries of timeouts, connection errors, 429 and 5xx
+        "backoff_s": 0.5,     # First retry delay, doubled on each retry
+        "pool_size": 10,      # Pooled connections (concurrent submissions)
+        # Size orders from the account's positions instead of a fixed order_qty
+        # (see tradingagents/execution/planner.py)
+        "position_aware": True,
+        "sizing": {
+            "max_notional": None,   # USD per position (None: order_notional)
+            "risk_usd": None,       # Loss at atr_multiple x ATR per position (None: notional only)
+            "atr_multiple": 2.0,
+            "allow_short": False,   # SELL closes longs; True also opens shorts
+            "whole_shares": True,
+            "min_notional": 1.0,    # Smaller orders are dropped
+        },
     },
 }
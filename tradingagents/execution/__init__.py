@@ -1,3 +1,12 @@
 from .alpaca_client import AlpacaPaperClient
+from .order_queue import OrderQueue, QueuedOrder
+from .planner import AccountSnapshot, ExecutionPlanner, PlannedOrder
 
-__all__ = ["AlpacaPaperClient"]
+__all__ = [
+    "AccountSnapshot",
+    "AlpacaPaperClient",
+    "ExecutionPlanner",
+    "OrderQueue",
+    "PlannedOrder",
+    "QueuedOrder",
+]
@@ -1,12 +1,34 @@
 import json
 import logging
-from typing import Any, Dict, Optional
+import time
+import uuid
+from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Responses worth retrying: rate limited or a transient server error
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Order statuses after which an order no longer changes
+TERMINAL_ORDER_STATUSES = {"filled", "canceled", "expired", "rejected", "replaced"}
+
+
+def new_client_order_id(prefix: str = "ta") -> str:
+    """A unique client order id (Alpaca allows up to 128 characters)."""
+    return f"{prefix}-{uuid.uuid4().hex}"
 
 
 class AlpacaPaperClient:
-    """Lightweight Alpaca paper-trading client for submitting market orders."""
+    """Lightweight Alpaca paper-trading client for submitting market orders.
+
+    Requests share one pooled session and are retried with exponential
+    backoff on timeouts, connection errors, 429 and 5xx responses. Every
+    order carries a client_order_id, so retrying a submission whose response
+    was lost cannot place the order twice.
+    """
 
     def __init__(self, config: Dict[str, Any]):
         self.enabled = config.get("enabled", False)
@@ -19,6 +41,11 @@ class AlpacaPaperClient:
         self.time_in_force = config.get("time_in_force", "day")
         self.order_qty = config.get("order_qty")
         self.extended_hours = bool(config.get("extended_hours", False))
+        self.timeout = config.get("timeout", 10)
+        self.max_retries = config.get("max_retries", 3)
+        self.backoff_s = config.get("backoff_s", 0.5)
+        self.pool_size = config.get("pool_size", 10)
+        self._session: Optional[requests.Session] = None
 
     def is_ready(self) -> bool:
         """Return True only when enabled and keys are present."""
@@ -35,6 +62,49 @@ class AlpacaPaperClient:
             url = url[:-3]
         return url
 
+    @property
+    def session(self) -> requests.Session:
+        """Session shared by all requests, with a connection pool per host."""
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(
+                {
+                    "APCA-API-KEY-ID": self.api_key or "",
+                    "APCA-API-SECRET-KEY": self.api_secret or "",
+                    "Content-Type": "application/json",
+                }
+            )
+            self._session = session
+        return self._session
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Send a request, retrying transient failures with exponential backoff."""
+        url = f"{self.base_url}{path}"
+        for attempt in range(self.max_retries + 1):
+            delay = self.backoff_s * 2 ** attempt
+            try:
+                resp = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            except (requests.Timeout, requests.ConnectionError) as exc:
+                if attempt == self.max_retries:
+                    raise
+                logger.warning("%s %s failed (%s), retrying in %.1fs", method, path, exc, delay)
+            else:
+                if resp.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                    return resp
+                retry_after = resp.headers.get("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    delay = max(delay, float(retry_after))
+                logger.warning("%s %s returned %d, retrying in %.1fs", method, path, resp.status_code, delay)
+            time.sleep(delay)
+
     def submit_order(
         self,
         symbol: str,
@@ -43,8 +113,13 @@ class AlpacaPaperClient:
         qty: Optional[float] = None,
         order_type: str = "market",
         limit_price: Optional[float] = None,
+        client_order_id: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Submit a simple order. Market supports notional; limit requires qty."""
+        """Submit a simple order. Market supports notional; limit requires qty.
+
+        ``client_order_id`` identifies the order across retries (a new one is
+        generated when omitted); pass the same id to resubmit safely.
+        """
         side = side.lower()
         order_type = order_type.lower()
 
@@ -53,6 +128,7 @@ class AlpacaPaperClient:
             "side": side,
             "type": order_type,
             "time_in_force": self.time_in_force,
+            "client_order_id": client_order_id or new_client_order_id(),
         }
 
         if order_type == "market":
@@ -77,15 +153,14 @@ class AlpacaPaperClient:
         if self.extended_hours:
             payload["extended_hours"] = True
 
-        url = f"{self.base_url}/v2/orders"
-        headers = {
-            "APCA-API-KEY-ID": self.api_key,
-            "APCA-API-SECRET-KEY": self.api_secret,
-            "Content-Type": "application/json",
-        }
-
+        resp = None
         try:
-            resp = requests.post(url, headers=headers, data=json.dumps(payload), timeout=10)
+            resp = self._request("POST", "/v2/orders", data=json.dumps(payload))
+            if resp.status_code == 422 and "client_order_id" in resp.text:
+                # An earlier attempt was accepted but its response was lost
+                existing = self.get_order_by_client_id(payload["client_order_id"])
+                if existing is not None:
+                    return {"status": "submitted", "order": existing}
             resp.raise_for_status()
             return {"status": "submitted", "order": resp.json()}
         except requests.HTTPError as exc:  # pragma: no cover - simple logging path
@@ -94,13 +169,52 @@ class AlpacaPaperClient:
                 body = resp.text
             except Exception:
                 pass
-            logging.error("Failed to place Alpaca order: %s | body=%s", exc, body)
+            logger.error("Failed to place Alpaca order: %s | body=%s", exc, body)
             return {
                 "status": "error",
                 "error": str(exc),
                 "status_code": getattr(exc.response, "status_code", None),
                 "body": body,
+                "client_order_id": payload["client_order_id"],
             }
         except Exception as exc:  # pragma: no cover - simple logging path
-            logging.error("Failed to place Alpaca order: %s", exc)
-            return {"status": "error", "error": str(exc)}
+            logger.error("Failed to place Alpaca order: %s", exc)
+            return {"status": "error", "error": str(exc), "client_order_id": payload["client_order_id"]}
+
+    def get_account(self) -> Dict[str, Any]:
+        resp = self._request("GET", "/v2/account")
+        resp.raise_for_status()
+        return resp.json()
+
+    def get_positions(self) -> List[Dict[str, Any]]:
+        """All open positions of the account."""
+        resp = self._request("GET", "/v2/positions")
+        resp.raise_for_status()
+        return resp.json()
+
+    def get_order(self, order_id: str) -> Dict[str, Any]:
+        resp = self._request("GET", f"/v2/orders/{order_id}")
+        resp.raise_for_status()
+        return resp.json()
+
+    def get_order_by_client_id(self, client_order_id: str) -> Optional[Dict[str, Any]]:
+        """The order with this client_order_id, or None if there is none."""
+        resp = self._request(
+            "GET", "/v2/orders:by_client_order_id", params={"client_order_id": client_order_id}
+        )
+        if resp.status_code == 404:
+            return None
+        resp.raise_for_status()
+        return resp.json()
+
+    def wait_for_fill(self, order_id: str, timeout: float = 60, poll_interval: float = 1.0) -> Dict[str, Any]:
+        """Poll an order until it reaches a terminal status or ``timeout`` seconds pass.
+
+        Returns the last order seen; check its "status" for the outcome.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            order = self.get_order(order_id)
+            if order.get("status") in TERMINAL_ORDER_STATUSES or time.monotonic() >= deadline:
+                return order
+            time.sleep(poll_interval)
@@ -0,0 +1,241 @@
+# TradingAgents/execution/order_queue.py
+
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .alpaca_client import TERMINAL_ORDER_STATUSES, AlpacaPaperClient
+from .planner import ExecutionPlanner
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueuedOrder:
+    """An order collected from a decision, and what became of it."""
+
+    symbol: str
+    side: str
+    client_order_id: str
+    qty: Optional[float] = None
+    notional: Optional[float] = None
+    trade_date: Optional[str] = None
+    # "queued", then "submitted", "error" or "skipped" (nothing to trade),
+    # then the order's final status
+    status: str = "queued"
+    order_id: Optional[str] = None
+    filled_qty: Optional[float] = None
+    filled_avg_price: Optional[float] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class OrderQueue:
+    """Collects the orders of many runs and submits them together.
+
+    Graphs given the queue (``TradingAgentsGraph(order_queue=...)``) add their
+    BUY/SELL decisions instead of posting an order per run; ``submit()`` then
+    sends all of them concurrently over the client's pooled session, and
+    ``wait_for_fills()`` polls them until they are done. A symbol's later
+    decision replaces its earlier one while that is still queued or failed;
+    once it was submitted (or skipped by the planner), later decisions for
+    the symbol are skipped until the next batch. Client order ids are fixed
+    when an order is queued, so submitting again after a failure never
+    duplicates an order Alpaca already accepted. A failed order is looked up
+    by its client order id before it is replaced or sized again, as its
+    submission may have reached Alpaca with only the response lost.
+
+    With a planner, orders are sized at submission from the account's
+    positions and all the decisions queued for each symbol, and sells are
+    submitted before buys.
+    """
+
+    def __init__(
+        self,
+        client: AlpacaPaperClient,
+        workers: int = 8,
+        batch_id: Optional[str] = None,
+        planner: Optional[ExecutionPlanner] = None,
+    ):
+        self.client = client
+        self.workers = max(1, workers)
+        self.batch_id = batch_id or uuid.uuid4().hex[:12]
+        self.planner = planner
+        self.orders: Dict[str, QueuedOrder] = {}
+        # Every actionable decision, in order, for the planner to net
+        self.decisions: List[Tuple[str, str, Optional[str]]] = []
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        symbol: str,
+        decision: str,
+        qty: Optional[float] = None,
+        notional: Optional[float] = None,
+        trade_date: Optional[str] = None,
+    ) -> Optional[QueuedOrder]:
+        """Queue the order for a processed decision; None for non-actionable ones.
+
+        When the symbol's order was already handled in this batch, the
+        returned order is not queued: its status is "skipped" and its error
+        says why.
+        """
+        side = decision.strip().lower()
+        if side not in ("buy", "sell"):
+            return None
+        symbol = symbol.upper()
+        order = QueuedOrder(
+            symbol=symbol,
+            side=side,
+            client_order_id=f"ta-{self.batch_id}-{symbol}-{side}",
+            qty=qty,
+            notional=notional,
+            trade_date=None if trade_date is None else str(trade_date),
+        )
+        with self._lock:
+            previous = self.orders.get(symbol)
+        # A failed order may have reached Alpaca after all; it is only replaced
+        # once Alpaca confirms it never saw it (a replacement with the other
+        # side has another client order id, so both would be live)
+        if previous is not None and previous.status == "error" and not self._reconcile(previous):
+            if previous.status == "error":
+                return self._skip(order, f"The failed order {previous.client_order_id} could not be looked up")
+        with self._lock:
+            if previous is not None and previous.status not in ("queued", "error"):
+                return self._skip(
+                    order, f"The order for {symbol} in batch {self.batch_id} is already {previous.status}"
+                )
+            self.orders[symbol] = order
+            self.decisions.append((symbol, decision, order.trade_date))
+        return order
+
+    @staticmethod
+    def _skip(order: QueuedOrder, reason: str) -> QueuedOrder:
+        order.status = "skipped"
+        order.error = reason
+        logger.warning("Not queuing %s %s: %s", order.side, order.symbol, reason)
+        return order
+
+    def _reconcile(self, order: QueuedOrder) -> bool:
+        """Whether a failed order is known not to have reached Alpaca.
+
+        If it did, the order is marked submitted with Alpaca's view of it.
+        """
+        try:
+            data = self.client.get_order_by_client_id(order.client_order_id)
+        except Exception as exc:
+            logger.warning("Looking up order %s for %s failed: %s", order.client_order_id, order.symbol, exc)
+            return False
+        if data is None:
+            return True
+        order.status = "submitted"
+        order.error = None
+        self._update(order, data)
+        return False
+
+    def pending(self) -> List[QueuedOrder]:
+        with self._lock:
+            return [order for order in self.orders.values() if order.status in ("queued", "error")]
+
+    def _submit(self, order: QueuedOrder):
+        result = self.client.submit_order(
+            order.symbol,
+            order.side,
+            qty=order.qty,
+            notional=order.notional,
+            client_order_id=order.client_order_id,
+        )
+        if result.get("status") == "submitted":
+            self._update(order, result["order"])
+            order.status = "submitted"
+            order.error = None
+        else:
+            order.status = "error"
+            order.error = result.get("error")
+            logger.error("Order %s for %s failed: %s", order.client_order_id, order.symbol, order.error)
+
+    @staticmethod
+    def _update(order: QueuedOrder, data: Dict[str, Any]):
+        order.order_id = data.get("id") or order.order_id
+        if data.get("status") in TERMINAL_ORDER_STATUSES:
+            order.status = data["status"]
+        for field in ("filled_qty", "filled_avg_price"):
+            if data.get(field) is not None:
+                setattr(order, field, float(data[field]))
+
+    def _plan(self, orders: List[QueuedOrder]):
+        """Size the queued orders with the planner; skip those with nothing to trade."""
+        queued = {order.symbol for order in orders if order.status == "queued"}
+        if not queued:
+            return
+        with self._lock:
+            decisions = [decision for decision in self.decisions if decision[0] in queued]
+        planned = {order.symbol: order for order in self.planner.plan(decisions)}
+        for order in orders:
+            if order.status != "queued":
+                continue
+            plan = planned.get(order.symbol)
+            if plan is None or plan.side != order.side:
+                order.status = "skipped"
+            else:
+                order.qty, order.notional = plan.qty, None
+
+    def submit(self) -> List[QueuedOrder]:
+        """Submit every queued (or previously failed) order concurrently, sells first.
+
+        Failed orders are looked up first: those Alpaca accepted after all are
+        marked submitted, those it never saw are sized and sent again like
+        queued ones, and those that cannot be looked up wait for the next call.
+        """
+        orders = []
+        for order in self.pending():
+            if order.status == "error":
+                if not self._reconcile(order):
+                    continue
+                order.status = "queued"
+            orders.append(order)
+        if self.planner is not None:
+            self._plan(orders)
+        orders = [order for order in orders if order.status != "skipped"]
+        if not orders:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(orders))) as pool:
+            for side in ("sell", "buy"):
+                list(pool.map(self._submit, [order for order in orders if order.side == side]))
+        return orders
+
+    def _poll(self, order: QueuedOrder) -> Optional[Dict[str, Any]]:
+        try:
+            return self.client.get_order(order.order_id)
+        except Exception as exc:
+            logger.warning("Polling order %s for %s failed: %s", order.order_id, order.symbol, exc)
+            return None
+
+    def wait_for_fills(self, timeout: float = 60, poll_interval: float = 1.0) -> List[QueuedOrder]:
+        """Poll the submitted orders until all are done or ``timeout`` seconds pass."""
+        deadline = time.monotonic() + timeout
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while True:
+                with self._lock:
+                    open_orders = [order for order in self.orders.values() if order.status == "submitted"]
+                if not open_orders or time.monotonic() >= deadline:
+                    break
+                for order, data in zip(open_orders, pool.map(self._poll, open_orders)):
+                    if data is not None:
+                        self._update(order, data)
+                if any(order.status == "submitted" for order in open_orders):
+                    time.sleep(poll_interval)
+        return list(self.orders.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "batch_id": self.batch_id,
+                "orders": [order.to_dict() for order in self.orders.values()],
+            }
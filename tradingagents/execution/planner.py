@@ -0,0 +1,207 @@
+# TradingAgents/execution/planner.py
+
+import logging
+import math
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .alpaca_client import AlpacaPaperClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AccountSnapshot:
+    """Cash and positions of the account, fetched for each plan."""
+
+    cash: float = 0.0
+    equity: float = 0.0
+    buying_power: float = 0.0
+    # Signed share quantity (negative for shorts) and last price per symbol
+    positions: Dict[str, float] = field(default_factory=dict)
+    prices: Dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def fetch(cls, client: AlpacaPaperClient) -> "AccountSnapshot":
+        account = client.get_account()
+        snapshot = cls(
+            cash=float(account.get("cash") or 0),
+            equity=float(account.get("equity") or 0),
+            buying_power=float(account.get("buying_power") or 0),
+        )
+        for position in client.get_positions():
+            symbol = position["symbol"].upper()
+            qty = float(position.get("qty") or 0)
+            if position.get("side") == "short" and qty > 0:
+                qty = -qty
+            snapshot.positions[symbol] = qty
+            if position.get("current_price") is not None:
+                snapshot.prices[symbol] = float(position["current_price"])
+        return snapshot
+
+
+@dataclass
+class PlannedOrder:
+    """Order that moves a symbol's position from current_qty to target_qty."""
+
+    symbol: str
+    side: str
+    qty: float
+    current_qty: float
+    target_qty: float
+    price: Optional[float] = None
+    atr: Optional[float] = None
+
+    @property
+    def notional(self) -> float:
+        return self.qty * (self.price or 0.0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class ExecutionPlanner:
+    """Turns decisions into orders against the account's current positions.
+
+    BUY raises a symbol's position to a long target and SELL lowers it to
+    flat (or to a short target when ``allow_short``); decisions never add to
+    a position already at its target, so repeated SELLs cannot pile into a
+    short. The target is ``max_notional`` worth of shares or, when
+    ``risk_usd`` is set, the shares whose ``atr_multiple`` x ATR move risks
+    ``risk_usd``, whichever is smaller. Prices and ATR come from the price
+    cache and indicator panel, as of the trade date.
+
+    A batch's decisions for the same symbol net into one order. Sells come
+    first in a plan, and buys are scaled down to fit the buying power left
+    after them. Each plan starts from a freshly fetched account snapshot, as
+    the account changes between plans (orders fill, graphs are reused).
+    """
+
+    def __init__(
+        self,
+        client: AlpacaPaperClient,
+        max_notional: float = 1000.0,
+        risk_usd: Optional[float] = None,
+        atr_multiple: float = 2.0,
+        allow_short: bool = False,
+        whole_shares: bool = True,
+        min_notional: float = 1.0,
+    ):
+        self.client = client
+        self.max_notional = max_notional
+        self.risk_usd = risk_usd
+        self.atr_multiple = atr_multiple
+        self.allow_short = allow_short
+        self.whole_shares = whole_shares
+        self.min_notional = min_notional
+        self._snapshot: Optional[AccountSnapshot] = None
+
+    @classmethod
+    def from_config(cls, client: AlpacaPaperClient, config: Dict[str, Any]) -> "ExecutionPlanner":
+        """Planner for ``config["alpaca_paper_trading"]``."""
+        settings = config.get("alpaca_paper_trading") or {}
+        sizing = settings.get("sizing") or {}
+        return cls(
+            client,
+            max_notional=sizing.get("max_notional") or settings.get("order_notional", 1000.0),
+            risk_usd=sizing.get("risk_usd"),
+            atr_multiple=sizing.get("atr_multiple", 2.0),
+            allow_short=sizing.get("allow_short", False),
+            whole_shares=sizing.get("whole_shares", True),
+            min_notional=sizing.get("min_notional", 1.0),
+        )
+
+    def snapshot(self) -> AccountSnapshot:
+        if self._snapshot is None:
+            self._snapshot = AccountSnapshot.fetch(self.client)
+        return self._snapshot
+
+    def refresh(self) -> AccountSnapshot:
+        self._snapshot = None
+        return self.snapshot()
+
+    def market_data(self, symbol: str, trade_date: Optional[str] = None) -> Tuple[Optional[float], Optional[float]]:
+        """Close and ATR of a symbol on (or last before) the trade date."""
+        price = atr = None
+        try:
+            from tradingagents.dataflows.indicator_panel import update_panel
+            from tradingagents.dataflows.price_cache import load_price_history
+
+            prices = load_price_history(symbol)
+            if trade_date is not None:
+                prices = prices[prices["Date"] <= str(trade_date)]
+            if not prices.empty:
+                price = float(prices["Close"].iloc[-1])
+                panel = update_panel(symbol)
+                if trade_date is not None:
+                    panel = panel.loc[: str(trade_date)]
+                if not panel.empty and not math.isnan(panel["atr"].iloc[-1]):
+                    atr = float(panel["atr"].iloc[-1])
+        except Exception as e:
+            logger.warning("No price data for %s from the price cache: %s", symbol, e)
+        if price is None:
+            price = self.snapshot().prices.get(symbol)
+        return price, atr
+
+    def position_size(self, price: float, atr: Optional[float]) -> float:
+        """Shares of a full position at this price and ATR."""
+        qty = self.max_notional / price
+        if self.risk_usd is not None and atr:
+            qty = min(qty, self.risk_usd / (self.atr_multiple * atr))
+        return float(math.floor(qty)) if self.whole_shares else round(qty, 6)
+
+    def plan(self, decisions: Iterable[Tuple[str, str, Optional[str]]]) -> List[PlannedOrder]:
+        """Orders for (symbol, decision, trade_date) triples, taken in order."""
+        snapshot = self.refresh()
+        targets: Dict[str, float] = {}
+        market: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
+        for symbol, decision, trade_date in decisions:
+            symbol = symbol.upper()
+            decision = decision.strip().upper()
+            if decision not in ("BUY", "SELL"):
+                continue
+            if symbol not in market:
+                market[symbol] = self.market_data(symbol, trade_date)
+            price, atr = market[symbol]
+            current = targets.get(symbol, snapshot.positions.get(symbol, 0.0))
+            if decision == "BUY":
+                if price is None:
+                    logger.warning("Skipping BUY of %s: no price to size it", symbol)
+                    continue
+                targets[symbol] = max(current, self.position_size(price, atr))
+            else:
+                floor = -self.position_size(price, atr) if self.allow_short and price else 0.0
+                targets[symbol] = min(current, floor)
+
+        sells, buys = [], []
+        for symbol, target in targets.items():
+            current = snapshot.positions.get(symbol, 0.0)
+            delta = target - current
+            price, atr = market[symbol]
+            order = PlannedOrder(
+                symbol=symbol,
+                side="buy" if delta > 0 else "sell",
+                qty=round(abs(delta), 6),
+                current_qty=current,
+                target_qty=target,
+                price=price,
+                atr=atr,
+            )
+            if order.qty <= 0 or (price is not None and order.notional < self.min_notional):
+                continue
+            (buys if delta > 0 else sells).append(order)
+
+        # Buys spend what is left after the sells (only closing longs frees cash)
+        available = snapshot.buying_power + sum(
+            min(order.qty, max(order.current_qty, 0.0)) * (order.price or 0.0) for order in sells
+        )
+        spend = sum(order.notional for order in buys)
+        if buys and spend > available:
+            scale = max(available, 0.0) / spend
+            for order in buys:
+                qty = order.qty * scale
+                order.qty = float(math.floor(qty)) if self.whole_shares else round(qty, 6)
+                order.target_qty = order.current_qty + order.qty
+            buys = [order for order in buys if order.qty > 0]
+            logger.info("Scaled buys by %.2f to fit buying power of %.2f", scale, available)
+        return sells + buys
@@ -0,0 +1,269 @@
+# TradingAgents/graph/budget.py
+
+import contextlib
+import threading
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from tradingagents.observability.profiling import model_name, token_usage
+
+# USD per million tokens; the "budget.prices" config extends and overrides it.
+# Models are matched by name, then by the longest matching name prefix.
+MODEL_PRICES = {
+    "deepseek-chat": {"input": 0.27, "output": 1.10},
+    "deepseek-reasoner": {"input": 0.55, "output": 2.19},
+    "gpt-4o-mini": {"input": 0.15, "output": 0.60},
+    "gpt-4o": {"input": 2.50, "output": 10.00},
+    "gpt-4.1-mini": {"input": 0.40, "output": 1.60},
+    "gpt-4.1-nano": {"input": 0.10, "output": 0.40},
+    "gpt-4.1": {"input": 2.00, "output": 8.00},
+    "o4-mini": {"input": 1.10, "output": 4.40},
+    "o3": {"input": 2.00, "output": 8.00},
+    "claude-3-5-haiku": {"input": 0.80, "output": 4.00},
+    "claude-3-5-sonnet": {"input": 3.00, "output": 15.00},
+    "claude-3-7-sonnet": {"input": 3.00, "output": 15.00},
+    "claude-sonnet-4": {"input": 3.00, "output": 15.00},
+    "claude-opus-4": {"input": 15.00, "output": 75.00},
+    "gemini-2.0-flash": {"input": 0.10, "output": 0.40},
+    "gemini-2.5-flash": {"input": 0.30, "output": 2.50},
+    "gemini-2.5-pro": {"input": 1.25, "output": 10.00},
+}
+
+_current_budget: ContextVar[Optional["RunBudget"]] = ContextVar("run_budget", default=None)
+
+
+class BudgetExceededError(RuntimeError):
+    """Raised when a run or batch has spent its hard token or cost limit."""
+
+
+def model_price(model: Optional[str], prices: Dict[str, Dict[str, float]]) -> Optional[Dict[str, float]]:
+    """Price of a model by exact name, else by the longest prefix of its name."""
+    if not model:
+        return None
+    if model in prices:
+        return prices[model]
+    matches = [name for name in prices if model.startswith(name)]
+    return prices[max(matches, key=len)] if matches else None
+
+
+def _new_spend() -> Dict[str, Any]:
+    return {"prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0}
+
+
+def _rounded(spend: Dict[str, Any]) -> Dict[str, Any]:
+    return {**spend, "cost_usd": round(spend["cost_usd"], 6)}
+
+
+def _add_spend(spend: Dict[str, Any], prompt: int, completion: int, cost: float):
+    spend["prompt_tokens"] += prompt
+    spend["completion_tokens"] += completion
+    spend["cost_usd"] += cost
+
+
+def _used_fraction(spend: Dict[str, Any], max_usd: Optional[float], max_tokens: Optional[int]) -> float:
+    fractions = [0.0]
+    if max_usd:
+        fractions.append(spend["cost_usd"] / max_usd)
+    if max_tokens:
+        fractions.append((spend["prompt_tokens"] + spend["completion_tokens"]) / max_tokens)
+    return max(fractions)
+
+
+class BudgetManager:
+    """Token and cost limits per run and for a whole batch of runs.
+
+    One manager is shared by every run of a batch (all propagate calls of a
+    graph, or of all the graphs of a backtest); each run gets its own
+    RunBudget from ``start_run``.
+    """
+
+    def __init__(
+        self,
+        run_usd: Optional[float] = None,
+        run_tokens: Optional[int] = None,
+        batch_usd: Optional[float] = None,
+        batch_tokens: Optional[int] = None,
+        soft_fraction: float = 0.8,
+        prices: Optional[Dict[str, Dict[str, float]]] = None,
+    ):
+        self.run_usd = run_usd
+        self.run_tokens = run_tokens
+        self.batch_usd = batch_usd
+        self.batch_tokens = batch_tokens
+        self.soft_fraction = soft_fraction
+        self.prices = {**MODEL_PRICES, **(prices or {})}
+        self.spend = _new_spend()
+        self.runs = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["BudgetManager"]:
+        """The manager configured by ``config["budget"]``, or None when disabled."""
+        settings = config.get("budget") or {}
+        if not settings.get("enabled"):
+            return None
+        return cls(
+            run_usd=settings.get("run_usd"),
+            run_tokens=settings.get("run_tokens"),
+            batch_usd=settings.get("batch_usd"),
+            batch_tokens=settings.get("batch_tokens"),
+            soft_fraction=settings.get("soft_fraction", 0.8),
+            prices=settings.get("prices"),
+        )
+
+    def start_run(self) -> "RunBudget":
+        with self._lock:
+            self.runs += 1
+        return RunBudget(self)
+
+    def cost(self, model: Optional[str], prompt_tokens: int, completion_tokens: int) -> Optional[float]:
+        """Cost in USD of a call, or None when the model has no price."""
+        price = model_price(model, self.prices)
+        if price is None:
+            return None
+        return (prompt_tokens * price["input"] + completion_tokens * price["output"]) / 1_000_000
+
+    def _charge(self, prompt: int, completion: int, cost: float):
+        with self._lock:
+            _add_spend(self.spend, prompt, completion, cost)
+
+    def used_fraction(self) -> float:
+        """Largest share of a batch limit spent so far."""
+        with self._lock:
+            return _used_fraction(self.spend, self.batch_usd, self.batch_tokens)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**_rounded(self.spend), "runs": self.runs, "max_usd": self.batch_usd, "max_tokens": self.batch_tokens}
+
+
+class RunBudget(BaseCallbackHandler):
+    """Spend of one run, charged from the responses of its LLM calls.
+
+    Pass it as a callback of the graph run and activate it with
+    ``budget.activate()``. Once the run or its batch has spent
+    ``soft_fraction`` of a limit, ``soft_limit_reached()`` is true and the
+    graph degrades (shorter debates, quick model for deep-thinking calls);
+    at the limit itself, the next LLM call raises BudgetExceededError.
+    """
+
+    # Let BudgetExceededError propagate out of the callback and abort the run
+    raise_error = True
+
+    def __init__(self, manager: BudgetManager):
+        self.manager = manager
+        self.spend = _new_spend()
+        self.by_model: Dict[str, Dict[str, Any]] = {}
+        self.unpriced_models: List[str] = []
+        self.degradations: List[str] = []
+        self.aborted: Optional[str] = None
+        self._models: Dict[Any, Optional[str]] = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def activate(self):
+        """Make this the budget of the enclosed run."""
+        token = _current_budget.set(self)
+        try:
+            yield self
+        finally:
+            _current_budget.reset(token)
+
+    def used_fraction(self) -> float:
+        """Largest share of a run or batch limit spent so far."""
+        manager = self.manager
+        with self._lock:
+            run = _used_fraction(self.spend, manager.run_usd, manager.run_tokens)
+        return max(run, manager.used_fraction())
+
+    def soft_limit_reached(self) -> bool:
+        return self.used_fraction() >= self.manager.soft_fraction
+
+    def degrade(self, action: str):
+        """Record a degradation taken to stay within the budget."""
+        with self._lock:
+            self.degradations.append(action)
+
+    def check(self):
+        """Raise BudgetExceededError if a limit has been spent."""
+        if self.used_fraction() >= 1.0:
+            with self._lock:
+                self.aborted = (
+                    f"Budget exceeded after ${self.spend['cost_usd']:.4f} and "
+                    f"{self.spend['prompt_tokens'] + self.spend['completion_tokens']} tokens"
+                )
+            raise BudgetExceededError(self.aborted)
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, metadata=None, invocation_params=None, **kwargs):
+        self.check()
+        with self._lock:
+            self._models[run_id] = model_name(metadata, invocation_params)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, metadata=None, invocation_params=None, **kwargs):
+        self.check()
+        with self._lock:
+            self._models[run_id] = model_name(metadata, invocation_params)
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        usage = token_usage(response)
+        prompt, completion = usage["prompt_tokens"], usage["completion_tokens"]
+        with self._lock:
+            model = self._models.pop(run_id, None) or "unknown"
+        cost = self.manager.cost(model, prompt, completion)
+        with self._lock:
+            if cost is None and model not in self.unpriced_models:
+                self.unpriced_models.append(model)
+            cost = cost or 0.0
+            _add_spend(self.spend, prompt, completion, cost)
+            _add_spend(self.by_model.setdefault(model, _new_spend()), prompt, completion, cost)
+        self.manager._charge(prompt, completion, cost)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **_rounded(self.spend),
+                "max_usd": self.manager.run_usd,
+                "max_tokens": self.manager.run_tokens,
+                "by_model": {model: _rounded(spend) for model, spend in self.by_model.items()},
+                "unpriced_models": list(self.unpriced_models),
+                "degradations": sorted(set(self.degradations)),
+                "aborted": self.aborted,
+                "batch": self.manager.to_dict(),
+            }
+
+
+def current_budget() -> Optional[RunBudget]:
+    return _current_budget.get()
+
+
+def budget_soft_limit_reached() -> bool:
+    """Whether the running graph should degrade to save tokens."""
+    budget = _current_budget.get()
+    return budget is not None and budget.soft_limit_reached()
+
+
+class BudgetedChatModel:
+    """Deep-thinking model that hands its calls to the quick-thinking model
+    once the run's budget reaches its soft limit."""
+
+    def __init__(self, deep_llm, quick_llm):
+        self.deep_llm = deep_llm
+        self.quick_llm = quick_llm
+
+    def _active(self):
+        budget = _current_budget.get()
+        if budget is not None and budget.soft_limit_reached():
+            budget.degrade("deep_to_quick")
+            return self.quick_llm
+        return self.deep_llm
+
+    def invoke(self, *args, **kwargs):
+        return self._active().invoke(*args, **kwargs)
+
+    def batch(self, *args, **kwargs):
+        return self._active().batch(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.deep_llm, name)
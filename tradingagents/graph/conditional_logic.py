@@ -1,15 +1,56 @@
 # TradingAgents/graph/conditional_logic.py
 
+import re
+
 from tradingagents.agents.utils.agent_states import AgentState
 
+from .budget import budget_soft_limit_reached, current_budget
+
+_WORD = re.compile(r"[a-z0-9][a-z0-9.%$-]{3,}")
+
+
+def _turn_similarity(a: str, b: str) -> float:
+    """Jaccard overlap of the content words of two arguments."""
+    words_a = set(_WORD.findall(a.lower()))
+    words_b = set(_WORD.findall(b.lower()))
+    if not words_a or not words_b:
+        return 0.0
+    return len(words_a & words_b) / len(words_a | words_b)
+
 
 class ConditionalLogic:
     """Handles conditional logic for determining graph flow."""
 
-    def __init__(self, max_debate_rounds=1, max_risk_discuss_rounds=1):
+    def __init__(
+        self,
+        max_debate_rounds=1,
+        max_risk_discuss_rounds=1,
+        convergence_threshold=None,
+    ):
         """Initialize with configuration parameters."""
         self.max_debate_rounds = max_debate_rounds
         self.max_risk_discuss_rounds = max_risk_discuss_rounds
+        self.convergence_threshold = convergence_threshold
+
+    def _has_converged(self, turns, speakers) -> bool:
+        """Check whether every speaker's latest turn mostly restates their previous one."""
+        if not self.convergence_threshold:
+            return False
+        for speaker in speakers:
+            own_turns = [turn["content"] for turn in turns if turn["speaker"] == speaker]
+            if len(own_turns) < 2:
+                return False
+            if _turn_similarity(own_turns[-1], own_turns[-2]) < self.convergence_threshold:
+                return False
+        return True
+
+    @staticmethod
+    def _cut_for_budget() -> bool:
+        """End a debate early when the run's budget is nearly spent."""
+        if not budget_soft_limit_reached():
+            return False
+        current_budget().degrade("debate_cut")
+        return True
 
     def should_continue_market(self, state: AgentState):
         """Determine if market analysis should continue."""
@@ -43,23 +84,44 @@ class ConditionalLogic:
             return "tools_fundamentals"
         return "Msg Clear Fundamentals"
 
+    def should_fast_path(self, state: AgentState) -> str:
+        """Determine if the analysts agree strongly enough to skip the debates."""
+        if state["analyst_consensus"].get("unanimous"):
+            return "Fast Decision"
+        return "Debate"
+
     def should_continue_debate(self, state: AgentState) -> str:
         """Determine if debate should continue."""
+        debate_state = state["investment_debate_state"]
 
         if (
-            state["investment_debate_state"]["count"] >= 2 * self.max_debate_rounds
+            debate_state["count"] >= 2 * self.max_debate_rounds
         ):  # 3 rounds of back-and-forth between 2 agents
             return "Research Manager"
+        if debate_state["count"] % 2 == 0 and self._has_converged(
+            state["investment_debate_history"], ("Bull", "Bear")
+        ):  # Both sides are restating their positions
+            return "Research Manager"
+        if self._cut_for_budget():
+            return "Research Manager"
         if state["investment_debate_state"]["current_response"].startswith("Bull"):
             return "Bear Researcher"
         return "Bull Researcher"
 
     def should_continue_risk_analysis(self, state: AgentState) -> str:
         """Determine if risk analysis should continue."""
+        risk_state = state["risk_debate_state"]
+
         if (
-            state["risk_debate_state"]["count"] >= 3 * self.max_risk_discuss_rounds
+            risk_state["count"] >= 3 * self.max_risk_discuss_rounds
         ):  # 3 rounds of back-and-forth between 3 agents
             return "Risk Judge"
+        if risk_state["count"] % 3 == 0 and self._has_converged(
+            state["risk_debate_history"], ("Risky", "Safe", "Neutral")
+        ):  # All three analysts are restating their positions
+            return "Risk Judge"
+        if self._cut_for_budget():
+            return "Risk Judge"
         if state["risk_debate_state"]["latest_speaker"].startswith("Risky"):
             return "Safe Analyst"
         if state["risk_debate_state"]["latest_speaker"].startswith("Safe"):
@@ -0,0 +1,137 @@
+# TradingAgents/graph/model_routing.py
+
+from typing import Any, Callable, Dict, Optional
+
+from langchain_core.runnables import RunnableLambda
+
+TIERS = ("fast", "mid", "deep")
+
+# Tier of each node's LLM calls; analysts use it for their report and the
+# "tool_turns" tier for the turns that pick tools. The "nodes" routing config
+# overrides entries.
+DEFAULT_NODE_TIERS = {
+    "Market Analyst": "mid",
+    "Social Analyst": "mid",
+    "News Analyst": "mid",
+    "Fundamentals Analyst": "mid",
+    "Context Budget": "fast",
+    "Bull Researcher": "mid",
+    "Bear Researcher": "mid",
+    "Research Manager": "deep",
+    "Trader": "mid",
+    "Risky Analyst": "mid",
+    "Safe Analyst": "mid",
+    "Neutral Analyst": "mid",
+    "Risk Judge": "deep",
+    "Fast Decision": "deep",
+    "Signal Processor": "fast",
+    "Reflector": "mid",
+}
+
+# Nodes that call tools, whose tool-picking turns use the "tool_turns" tier
+TOOL_USING_NODES = {"Market Analyst", "Social Analyst", "News Analyst", "Fundamentals Analyst"}
+
+# Suggested fast and mid models per provider, used when the routing config
+# names none; providers not listed use quick_think_llm for both
+PROVIDER_TIERS = {
+    "openai": {"fast": "gpt-4.1-nano", "mid": "gpt-4.1-mini"},
+    "anthropic": {"fast": "claude-3-5-haiku-latest", "mid": "claude-sonnet-4-0"},
+    "google": {"fast": "gemini-2.0-flash", "mid": "gemini-2.5-flash"},
+    "deepseek": {"fast": "deepseek-chat", "mid": "deepseek-chat"},
+}
+
+
+def tier_models(config: Dict[str, Any]) -> Dict[str, str]:
+    """Model name of each tier for the configured provider."""
+    routing = config.get("model_routing") or {}
+    provider = config["llm_provider"]
+    suggested = {
+        **PROVIDER_TIERS.get(provider, {}),
+        **(routing.get("providers") or {}).get(provider, {}),
+    }
+    models = routing.get("models") or {}
+    return {
+        "fast": models.get("fast") or suggested.get("fast") or config["quick_think_llm"],
+        "mid": models.get("mid") or suggested.get("mid") or config["quick_think_llm"],
+        "deep": config["deep_think_llm"],
+    }
+
+
+def build_tier_llms(
+    config: Dict[str, Any],
+    make_llm: Callable[[str, Optional[int]], Any],
+    quick_llm: Any,
+    deep_llm: Any,
+) -> Optional[Dict[str, Any]]:
+    """The chat model of each tier, or None when routing is disabled.
+
+    ``make_llm(model, max_tokens)`` creates a model; the graph's quick and
+    deep models are reused where a tier asks for the same model without a
+    token cap.
+    """
+    routing = config.get("model_routing") or {}
+    if not routing.get("enabled"):
+        return None
+    max_tokens = routing.get("max_tokens") or {}
+    existing = {config["quick_think_llm"]: quick_llm, config["deep_think_llm"]: deep_llm}
+    llms: Dict[str, Any] = {}
+    created: Dict[tuple, Any] = {}
+    for tier, model in tier_models(config).items():
+        cap = max_tokens.get(tier)
+        if cap is None and model in existing:
+            llms[tier] = existing[model]
+        else:
+            if (model, cap) not in created:
+                created[(model, cap)] = make_llm(model, cap)
+            llms[tier] = created[(model, cap)]
+    return llms
+
+
+class ToolTurnRouter:
+    """Analyst model that picks tools with one model and writes the report
+    with another.
+
+    Whether a turn picks tools is only known from its answer, so every turn
+    goes to the tool model first. Its answer is kept when it calls tools;
+    otherwise the turn would end the analyst's work with the tool model's
+    report, and the same prompt is asked of the report model instead.
+    """
+
+    def __init__(self, tool_llm, report_llm):
+        self.tool_llm = tool_llm
+        self.report_llm = report_llm
+
+    def bind_tools(self, tools, **kwargs):
+        tool_llm = self.tool_llm.bind_tools(tools, **kwargs)
+        report_llm = self.report_llm.bind_tools(tools, **kwargs)
+
+        def route(prompt, config):
+            if self.tool_llm is not self.report_llm:
+                response = tool_llm.invoke(prompt, config)
+                if getattr(response, "tool_calls", None):
+                    return response
+            return report_llm.invoke(prompt, config)
+
+        return RunnableLambda(route, name="ToolTurnRouter")
+
+    def invoke(self, *args, **kwargs):
+        return self.report_llm.invoke(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.report_llm, name)
+
+
+def route_nodes(config: Dict[str, Any], tier_llms: Dict[str, Any]) -> Dict[str, Any]:
+    """Chat model of each node under the routing policy."""
+    routing = config.get("model_routing") or {}
+    policy = {**DEFAULT_NODE_TIERS, **(routing.get("nodes") or {})}
+    tool_tier = routing.get("tool_turns", "fast")
+    node_llms = {}
+    for node, tier in policy.items():
+        if tier not in TIERS:
+            raise ValueError(f"Unknown model tier '{tier}' for node '{node}' (expected one of {TIERS})")
+        llm = tier_llms[tier]
+        if node in TOOL_USING_NODES:
+            llm = ToolTurnRouter(tier_llms[tool_tier], llm)
+        node_llms[node] = llm
+    return node_llms
@@ -0,0 +1,206 @@
+# TradingAgents/graph/progress.py
+
+from typing import Any, Dict, List
+
+from tradingagents.agents.utils.agent_states import render_history
+
+# Analyst type -> (report section, agent display name)
+ANALYST_REPORTS = {
+    "market": ("market_report", "Market Analyst"),
+    "social": ("sentiment_report", "Social Analyst"),
+    "news": ("news_report", "News Analyst"),
+    "fundamentals": ("fundamentals_report", "Fundamentals Analyst"),
+}
+
+RESEARCH_TEAM = ["Bull Researcher", "Bear Researcher", "Research Manager", "Trader"]
+RISK_TEAM = ["Risky Analyst", "Safe Analyst", "Neutral Analyst"]
+
+
+def extract_content_string(content) -> str:
+    """Extract string content from various message formats."""
+    if isinstance(content, str):
+        return content
+    elif isinstance(content, list):
+        # Handle Anthropic's list format
+        text_parts = []
+        for item in content:
+            if isinstance(item, dict):
+                if item.get("type") == "text":
+                    text_parts.append(item.get("text", ""))
+                elif item.get("type") == "tool_use":
+                    text_parts.append(f"[Tool: {item.get('name', 'unknown')}]")
+            else:
+                text_parts.append(str(item))
+        return " ".join(text_parts)
+    else:
+        return str(content)
+
+
+class ProgressTracker:
+    """Turns streamed graph states into agent progress events.
+
+    Feed it every chunk from ``graph.stream(..., stream_mode="values")``. It
+    remembers what it has already reported, so each call returns only new
+    events. Events are plain dicts with a ``type`` of:
+
+    - ``message``: ``message_type`` and ``content`` of a new agent message
+    - ``tool_call``: ``name`` and ``args`` of a requested tool call
+    - ``status``: ``agent`` and its new ``status`` (in_progress/completed)
+    - ``report``: ``section`` and its full current ``content``
+    """
+
+    def __init__(self, selected_analysts: List[str]):
+        self.selected_analysts = list(selected_analysts)
+        self._last_message = None
+        self._reports: Dict[str, Any] = {}
+        self._invest_turns = 0
+        self._risk_turns = 0
+        self._latest_debate: Dict[str, str] = {}
+        self._invest_judged = False
+        self._risk_judged = False
+
+    def update(self, chunk: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return the events for one streamed state."""
+        events: List[Dict[str, Any]] = []
+        self._messages(chunk, events)
+        self._analyst_reports(chunk, events)
+        self._investment_debate(chunk, events)
+        self._trader(chunk, events)
+        self._risk_debate(chunk, events)
+        return events
+
+    @staticmethod
+    def _status(events, agents, status):
+        for agent in agents:
+            events.append({"type": "status", "agent": agent, "status": status})
+
+    @staticmethod
+    def _report(events, section, content):
+        events.append({"type": "report", "section": section, "content": content})
+
+    @staticmethod
+    def _message(events, message_type, content):
+        events.append(
+            {"type": "message", "message_type": message_type, "content": content}
+        )
+
+    def _changed(self, chunk, key) -> bool:
+        value = chunk.get(key)
+        if not value or value == self._reports.get(key):
+            return False
+        self._reports[key] = value
+        return True
+
+    def _messages(self, chunk, events):
+        messages = chunk.get("messages") or []
+        if not messages:
+            return
+        last_message = messages[-1]
+        key = getattr(last_message, "id", None) or id(last_message)
+        if key == self._last_message:
+            return
+        self._last_message = key
+
+        if hasattr(last_message, "content"):
+            self._message(
+                events, "Reasoning", extract_content_string(last_message.content)
+            )
+        else:
+            self._message(events, "System", str(last_message))
+
+        for tool_call in getattr(last_message, "tool_calls", None) or []:
+            # Handle both dictionary and object tool calls
+            if isinstance(tool_call, dict):
+                name, args = tool_call["name"], tool_call["args"]
+            else:
+                name, args = tool_call.name, tool_call.args
+            events.append({"type": "tool_call", "name": name, "args": args})
+
+    def _analyst_reports(self, chunk, events):
+        for i, analyst in enumerate(self.selected_analysts):
+            section, agent = ANALYST_REPORTS[analyst]
+            if not self._changed(chunk, section):
+                continue
+            self._report(events, section, chunk[section])
+            self._status(events, [agent], "completed")
+            # Hand over to the next analyst, or to the research team
+            if i < len(self.selected_analysts) - 1:
+                next_analyst = self.selected_analysts[i + 1]
+                self._status(events, [ANALYST_REPORTS[next_analyst][1]], "in_progress")
+            else:
+                self._status(events, RESEARCH_TEAM, "in_progress")
+
+    def _investment_debate(self, chunk, events):
+        debate_state = chunk.get("investment_debate_state") or {}
+        turns = chunk.get("investment_debate_history") or []
+
+        new_turns = turns[self._invest_turns:]
+        self._invest_turns = len(turns)
+        for turn in new_turns:
+            self._latest_debate[turn["speaker"]] = render_history([turn])
+            self._message(events, "Reasoning", self._latest_debate[turn["speaker"]])
+        if new_turns:
+            self._status(events, RESEARCH_TEAM, "in_progress")
+            self._report(events, "investment_plan", self._research_section())
+
+        if debate_state.get("judge_decision") and not self._invest_judged:
+            self._invest_judged = True
+            self._message(
+                events,
+                "Reasoning",
+                f"Research Manager: {debate_state['judge_decision']}",
+            )
+            self._report(
+                events,
+                "investment_plan",
+                self._research_section(debate_state["judge_decision"]),
+            )
+            self._status(events, RESEARCH_TEAM, "completed")
+            self._status(events, ["Risky Analyst"], "in_progress")
+
+    def _research_section(self, judge_decision: str = "") -> str:
+        parts = []
+        if "Bull" in self._latest_debate:
+            parts.append(f"### Bull Researcher Analysis\n{self._latest_debate['Bull']}")
+        if "Bear" in self._latest_debate:
+            parts.append(f"### Bear Researcher Analysis\n{self._latest_debate['Bear']}")
+        if judge_decision:
+            parts.append(f"### Research Manager Decision\n{judge_decision}")
+        return "\n\n".join(parts)
+
+    def _trader(self, chunk, events):
+        if self._changed(chunk, "trader_investment_plan"):
+            self._report(
+                events, "trader_investment_plan", chunk["trader_investment_plan"]
+            )
+            self._status(events, ["Risky Analyst"], "in_progress")
+
+    def _risk_debate(self, chunk, events):
+        risk_state = chunk.get("risk_debate_state") or {}
+        turns = chunk.get("risk_debate_history") or []
+
+        new_turns = turns[self._risk_turns:]
+        self._risk_turns = len(turns)
+        for turn in new_turns:
+            agent = f"{turn['speaker']} Analyst"
+            self._status(events, [agent], "in_progress")
+            self._message(events, "Reasoning", f"{agent}: {turn['content']}")
+            # The risk section only shows the latest analysis
+            self._report(
+                events,
+                "final_trade_decision",
+                f"### {agent} Analysis\n{turn['content']}",
+            )
+
+        if risk_state.get("judge_decision") and not self._risk_judged:
+            self._risk_judged = True
+            self._status(events, ["Portfolio Manager"], "in_progress")
+            self._message(
+                events, "Reasoning", f"Portfolio Manager: {risk_state['judge_decision']}"
+            )
+            self._report(
+                events,
+                "final_trade_decision",
+                f"### Portfolio Manager Decision\n{risk_state['judge_decision']}",
+            )
+            self._status(events, RISK_TEAM + ["Portfolio Manager"], "completed")
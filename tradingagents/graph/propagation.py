@@ -24,21 +24,24 @@ class Propagator:
             "company_of_interest": company_name,
             "trade_date": str(trade_date),
             "investment_debate_state": InvestDebateState(
-                {"history": "", "current_response": "", "count": 0}
+                {"current_response": "", "count": 0}
             ),
             "risk_debate_state": RiskDebateState(
                 {
-                    "history": "",
                     "current_risky_response": "",
                     "current_safe_response": "",
                     "current_neutral_response": "",
                     "count": 0,
                 }
             ),
+            "investment_debate_history": [],
+            "risk_debate_history": [],
             "market_report": "",
             "fundamentals_report": "",
             "sentiment_report": "",
             "news_report": "",
+            "compressed_reports": {},
+            "analyst_consensus": {},
         }
 
     def get_graph_args(self) -> Dict[str, Any]:
@@ -1,13 +1,17 @@
 # TradingAgents/graph/reflection.py
 
-from typing import Dict, Any
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, TYPE_CHECKING
+
+from tradingagents.agents.utils.agent_states import render_history
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
 
 
 class Reflector:
     """Handles reflection on decisions and updating memory."""
 
-    def __init__(self, quick_thinking_llm: ChatOpenAI):
+    def __init__(self, quick_thinking_llm: "ChatOpenAI"):
         """Initialize the reflector with an LLM."""
         self.quick_thinking_llm = quick_thinking_llm
         self.reflection_system_prompt = self._get_reflection_prompt()
@@ -73,7 +77,9 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
     def reflect_bull_researcher(self, current_state, returns_losses, bull_memory):
         """Reflect on bull researcher's analysis and update memory."""
         situation = self._extract_current_situation(current_state)
-        bull_debate_history = current_state["investment_debate_state"]["bull_history"]
+        bull_debate_history = render_history(
+            current_state["investment_debate_history"], "Bull"
+        )
 
         result = self._reflect_on_component(
             "BULL", bull_debate_history, situation, returns_losses
@@ -83,7 +89,9 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
     def reflect_bear_researcher(self, current_state, returns_losses, bear_memory):
         """Reflect on bear researcher's analysis and update memory."""
         situation = self._extract_current_situation(current_state)
-        bear_debate_history = current_state["investment_debate_state"]["bear_history"]
+        bear_debate_history = render_history(
+            current_state["investment_debate_history"], "Bear"
+        )
 
         result = self._reflect_on_component(
             "BEAR", bear_debate_history, situation, returns_losses
@@ -1,23 +1,27 @@
 # TradingAgents/graph/setup.py
 
-from typing import Dict, Any
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, TYPE_CHECKING
 from langgraph.graph import END, StateGraph, START
 from langgraph.prebuilt import ToolNode
 
 from tradingagents.agents import *
 from tradingagents.agents.utils.agent_states import AgentState
+from tradingagents.observability.profiling import profile_node
+from tradingagents.observability.tracing import trace_node
 
 from .conditional_logic import ConditionalLogic
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
 
 class GraphSetup:
     """Handles the setup and configuration of the agent graph."""
 
     def __init__(
         self,
-        quick_thinking_llm: ChatOpenAI,
-        deep_thinking_llm: ChatOpenAI,
+        quick_thinking_llm: "ChatOpenAI",
+        deep_thinking_llm: "ChatOpenAI",
         tool_nodes: Dict[str, ToolNode],
         bull_memory,
         bear_memory,
@@ -25,8 +29,16 @@ class GraphSetup:
         invest_judge_memory,
         risk_manager_memory,
         conditional_logic: ConditionalLogic,
+        quick_context_budget=None,
+        deep_context_budget=None,
+        fast_path_threshold=None,
+        node_llms=None,
     ):
-        """Initialize with required components."""
+        """Initialize with required components.
+
+        ``node_llms`` maps node names to the chat model they should use in
+        place of the quick or deep one (see model_routing.py).
+        """
         self.quick_thinking_llm = quick_thinking_llm
         self.deep_thinking_llm = deep_thinking_llm
         self.tool_nodes = tool_nodes
@@ -36,6 +48,14 @@ class GraphSetup:
         self.invest_judge_memory = invest_judge_memory
         self.risk_manager_memory = risk_manager_memory
         self.conditional_logic = conditional_logic
+        self.quick_context_budget = quick_context_budget
+        self.deep_context_budget = deep_context_budget
+        self.fast_path_threshold = fast_path_threshold
+        self.node_llms = node_llms or {}
+
+    def _llm(self, node: str, default):
+        """Chat model of a node: its routed model, else the given default."""
+        return self.node_llms.get(node, default)
 
     def setup_graph(
         self, selected_analysts=["market", "social", "news", "fundamentals"]
@@ -59,72 +79,123 @@ class GraphSetup:
 
         if "market" in selected_analysts:
             analyst_nodes["market"] = create_market_analyst(
-                self.quick_thinking_llm
+                self._llm("Market Analyst", self.quick_thinking_llm)
             )
             delete_nodes["market"] = create_msg_delete()
             tool_nodes["market"] = self.tool_nodes["market"]
 
         if "social" in selected_analysts:
             analyst_nodes["social"] = create_social_media_analyst(
-                self.quick_thinking_llm
+                self._llm("Social Analyst", self.quick_thinking_llm)
             )
             delete_nodes["social"] = create_msg_delete()
             tool_nodes["social"] = self.tool_nodes["social"]
 
         if "news" in selected_analysts:
             analyst_nodes["news"] = create_news_analyst(
-                self.quick_thinking_llm
+                self._llm("News Analyst", self.quick_thinking_llm)
             )
             delete_nodes["news"] = create_msg_delete()
             tool_nodes["news"] = self.tool_nodes["news"]
 
         if "fundamentals" in selected_analysts:
             analyst_nodes["fundamentals"] = create_fundamentals_analyst(
-                self.quick_thinking_llm
+                self._llm("Fundamentals Analyst", self.quick_thinking_llm)
             )
             delete_nodes["fundamentals"] = create_msg_delete()
             tool_nodes["fundamentals"] = self.tool_nodes["fundamentals"]
 
         # Create researcher and manager nodes
         bull_researcher_node = create_bull_researcher(
-            self.quick_thinking_llm, self.bull_memory
+            self._llm("Bull Researcher", self.quick_thinking_llm), self.bull_memory, self.quick_context_budget
         )
         bear_researcher_node = create_bear_researcher(
-            self.quick_thinking_llm, self.bear_memory
+            self._llm("Bear Researcher", self.quick_thinking_llm), self.bear_memory, self.quick_context_budget
         )
         research_manager_node = create_research_manager(
-            self.deep_thinking_llm, self.invest_judge_memory
+            self._llm("Research Manager", self.deep_thinking_llm), self.invest_judge_memory, self.deep_context_budget
+        )
+        trader_node = create_trader(
+            self._llm("Trader", self.quick_thinking_llm), self.trader_memory
         )
-        trader_node = create_trader(self.quick_thinking_llm, self.trader_memory)
 
         # Create risk analysis nodes
-        risky_analyst = create_risky_debator(self.quick_thinking_llm)
-        neutral_analyst = create_neutral_debator(self.quick_thinking_llm)
-        safe_analyst = create_safe_debator(self.quick_thinking_llm)
+        risky_analyst = create_risky_debator(
+            self._llm("Risky Analyst", self.quick_thinking_llm), self.quick_context_budget
+        )
+        neutral_analyst = create_neutral_debator(
+            self._llm("Neutral Analyst", self.quick_thinking_llm), self.quick_context_budget
+        )
+        safe_analyst = create_safe_debator(
+            self._llm("Safe Analyst", self.quick_thinking_llm), self.quick_context_budget
+        )
         risk_manager_node = create_risk_manager(
-            self.deep_thinking_llm, self.risk_manager_memory
+            self._llm("Risk Judge", self.deep_thinking_llm), self.risk_manager_memory, self.deep_context_budget
         )
 
         # Create workflow
         workflow = StateGraph(AgentState)
 
+        # Every node and tool node records its wall time in profiled runs and
+        # gets a span in traced runs
+        def add_node(name, node):
+            workflow.add_node(name, trace_node(name, profile_node(name, node)))
+
         # Add analyst nodes to the graph
         for analyst_type, node in analyst_nodes.items():
-            workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
-            workflow.add_node(
+            add_node(f"{analyst_type.capitalize()} Analyst", node)
+            add_node(
                 f"Msg Clear {analyst_type.capitalize()}", delete_nodes[analyst_type]
             )
-            workflow.add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
+            add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
 
         # Add other nodes
-        workflow.add_node("Bull Researcher", bull_researcher_node)
-        workflow.add_node("Bear Researcher", bear_researcher_node)
-        workflow.add_node("Research Manager", research_manager_node)
-        workflow.add_node("Trader", trader_node)
-        workflow.add_node("Risky Analyst", risky_analyst)
-        workflow.add_node("Neutral Analyst", neutral_analyst)
-        workflow.add_node("Safe Analyst", safe_analyst)
-        workflow.add_node("Risk Judge", risk_manager_node)
+        add_node("Bull Researcher", bull_researcher_node)
+        add_node("Bear Researcher", bear_researcher_node)
+        add_node("Research Manager", research_manager_node)
+        add_node("Trader", trader_node)
+        add_node("Risky Analyst", risky_analyst)
+        add_node("Neutral Analyst", neutral_analyst)
+        add_node("Safe Analyst", safe_analyst)
+        add_node("Risk Judge", risk_manager_node)
+
+        # Condense oversized reports once before the debate starts
+        debate_entry = "Bull Researcher"
+        if self.quick_context_budget is not None:
+            add_node(
+                "Context Budget",
+                create_context_budgeter(
+                    self._llm("Context Budget", self.quick_thinking_llm),
+                    self.quick_context_budget,
+                ),
+            )
+            workflow.add_edge("Context Budget", "Bull Researcher")
+            debate_entry = "Context Budget"
+
+        # Optionally let a unanimous analyst team skip the debates entirely
+        analysts_exit = debate_entry
+        if self.fast_path_threshold is not None:
+            add_node(
+                "Consensus Gate", create_consensus_gate(self.fast_path_threshold)
+            )
+            add_node(
+                "Fast Decision",
+                create_fast_decider(
+                    self._llm("Fast Decision", self.deep_thinking_llm),
+                    self.risk_manager_memory,
+                    self.deep_context_budget,
+                ),
+            )
+            workflow.add_conditional_edges(
+                "Consensus Gate",
+                self.conditional_logic.should_fast_path,
+                {
+                    "Fast Decision": "Fast Decision",
+                    "Debate": debate_entry,
+                },
+            )
+            workflow.add_edge("Fast Decision", END)
+            analysts_exit = "Consensus Gate"
 
         # Define edges
         # Start with the first analyst
@@ -145,12 +216,12 @@ class GraphSetup:
             )
             workflow.add_edge(current_tools, current_analyst)
 
-            # Connect to next analyst or to Bull Researcher if this is the last analyst
+            # Connect to next analyst or to the debate stage if this is the last analyst
             if i < len(selected_analysts) - 1:
                 next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
                 workflow.add_edge(current_clear, next_analyst)
             else:
-                workflow.add_edge(current_clear, "Bull Researcher")
+                workflow.add_edge(current_clear, analysts_exit)
 
         # Add remaining edges
         workflow.add_conditional_edges(
@@ -0,0 +1,164 @@
+# TradingAgents/graph/state_log.py
+
+import atexit
+import json
+import logging
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LOG_FILENAME = "full_states_log.jsonl"
+INDEX_FILENAME = "full_states_log.index.jsonl"
+
+_STOP = object()
+
+
+class StateLogWriter:
+    """Append-only JSONL log of final run states with a (ticker, date) index.
+
+    Each ticker gets one ``full_states_log.jsonl`` with one record per run,
+    plus a sidecar index of byte offsets so a single run can be read back
+    without parsing the whole file. Writes happen on a background thread.
+    If a date is logged again, the newest record wins.
+    """
+
+    def __init__(self, root: str = "eval_results"):
+        self.root = Path(root)
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict[str, Tuple[int, int]]] = {}
+
+    def log_dir(self, ticker: str) -> Path:
+        return self.root / ticker / "TradingAgentsStrategy_logs"
+
+    def log_path(self, ticker: str) -> Path:
+        """Path of the JSONL state log for a ticker."""
+        return self.log_dir(ticker) / LOG_FILENAME
+
+    def append(self, ticker: str, trade_date: str, record: Dict[str, Any]):
+        """Queue a record for writing and return immediately."""
+        self._ensure_thread()
+        self._queue.put((ticker, str(trade_date), record))
+
+    def flush(self):
+        """Block until every queued record has been written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self):
+        """Flush pending records and stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+    def get(self, ticker: str, trade_date: str) -> Optional[Dict[str, Any]]:
+        """Read back the latest record logged for a ticker and date."""
+        self.flush()
+        with self._lock:
+            entry = self._load_index(ticker).get(str(trade_date))
+        if entry is None:
+            return None
+        offset, length = entry
+        with open(self.log_path(ticker), "rb") as f:
+            f.seek(offset)
+            return json.loads(f.read(length))
+
+    def _ensure_thread(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="state-log-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                self._write(*item)
+            except Exception:
+                logger.exception("Failed to write state log record")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, ticker: str, trade_date: str, record: Dict[str, Any]):
+        line = (json.dumps(record, default=str) + "\n").encode("utf-8")
+        directory = self.log_dir(ticker)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        with self._lock:
+            index = self._load_index(ticker)
+            with open(directory / LOG_FILENAME, "ab") as f:
+                offset = f.tell()
+                f.write(line)
+            with open(directory / INDEX_FILENAME, "a", encoding="utf-8") as f:
+                f.write(
+                    json.dumps(
+                        {"trade_date": trade_date, "offset": offset, "length": len(line)}
+                    )
+                    + "\n"
+                )
+            index[trade_date] = (offset, len(line))
+
+    def _load_index(self, ticker: str) -> Dict[str, Tuple[int, int]]:
+        """Load (or rebuild) the offset index for a ticker. Caller holds the lock."""
+        if ticker in self._index:
+            return self._index[ticker]
+
+        index: Dict[str, Tuple[int, int]] = {}
+        end = 0
+        index_path = self.log_dir(ticker) / INDEX_FILENAME
+        if index_path.exists():
+            with open(index_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    index[entry["trade_date"]] = (entry["offset"], entry["length"])
+                    end = max(end, entry["offset"] + entry["length"])
+
+        # Pick up records written before the index was (e.g. after a crash)
+        log_path = self.log_path(ticker)
+        if log_path.exists() and log_path.stat().st_size > end:
+            with open(log_path, "rb") as f:
+                f.seek(end)
+                offset = end
+                for line in f:
+                    try:
+                        trade_date = str(json.loads(line)["trade_date"])
+                    except (ValueError, KeyError):
+                        trade_date = None
+                    if trade_date is not None:
+                        index[trade_date] = (offset, len(line))
+                    offset += len(line)
+
+        self._index[ticker] = index
+        return index
+
+
+_writers: Dict[str, StateLogWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_state_log_writer(root: str = "eval_results") -> StateLogWriter:
+    """Return the shared writer for a log root, so graphs never race on a file."""
+    key = str(Path(root).resolve())
+    with _writers_lock:
+        if key not in _writers:
+            _writers[key] = StateLogWriter(root)
+        return _writers[key]
+
+
+@atexit.register
+def _close_writers():
+    for writer in list(_writers.values()):
+        writer.close()
@@ -1,15 +1,14 @@
 # TradingAgents/graph/trading_graph.py
 
+import contextlib
+import copy
+import importlib
 import os
 from pathlib import Path
 import json
 from datetime import date
 from typing import Dict, Any, Tuple, List, Optional
 
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
-
 from langgraph.prebuilt import ToolNode
 
 from tradingagents.agents import *
@@ -20,7 +19,8 @@ from tradingagents.agents.utils.agent_states import (
     InvestDebateState,
     RiskDebateState,
 )
-from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.config import use_config
+from tradingagents.dataflows.prefetch import prefetch_run
 
 # Import the new abstract tool methods from agent_utils
 from tradingagents.agents.utils.agent_utils import (
@@ -35,13 +35,39 @@ from tradingagents.agents.utils.agent_utils import (
     get_insider_transactions,
     get_global_news
 )
-from tradingagents.execution import AlpacaPaperClient
+from tradingagents.execution import AlpacaPaperClient, ExecutionPlanner, OrderQueue
+from tradingagents.observability.profiling import RunProfile
+from tradingagents.observability.tracing import TraceCallbackHandler, Tracer
 
+from .budget import BudgetedChatModel, BudgetExceededError, BudgetManager
 from .conditional_logic import ConditionalLogic
+from .model_routing import build_tier_llms, route_nodes
 from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .state_log import get_state_log_writer
+from .progress import ProgressTracker
+
+
+# Chat model class per provider as (module, class); each provider's SDK is
+# only imported when a graph actually uses it
+CHAT_MODEL_PROVIDERS = {
+    "openai": ("langchain_openai", "ChatOpenAI"),
+    "ollama": ("langchain_openai", "ChatOpenAI"),
+    "openrouter": ("langchain_openai", "ChatOpenAI"),
+    "deepseek": ("langchain_openai", "ChatOpenAI"),
+    "anthropic": ("langchain_anthropic", "ChatAnthropic"),
+    "google": ("langchain_google_genai", "ChatGoogleGenerativeAI"),
+}
+
+
+def _load_chat_model_class(provider: str):
+    """Import and return the chat model class for a provider."""
+    if provider not in CHAT_MODEL_PROVIDERS:
+        raise ValueError(f"Unsupported LLM provider: {provider}")
+    module_name, class_name = CHAT_MODEL_PROVIDERS[provider]
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 def _get_provider_api_key(provider: str) -> Optional[str]:
@@ -96,6 +122,8 @@ class TradingAgentsGraph:
         selected_analysts=["market", "social", "news", "fundamentals"],
         debug=False,
         config: Dict[str, Any] = None,
+        budget_manager: Optional[BudgetManager] = None,
+        order_queue: Optional[OrderQueue] = None,
     ):
         """Initialize the trading agents graph and components.
 
@@ -103,9 +131,16 @@ class TradingAgentsGraph:
             selected_analysts: List of analyst types to include
             debug: Whether to run in debug mode
             config: Configuration dictionary. If None, uses default config
+            budget_manager: Token and cost limits shared with other graphs
+                (e.g. a backtest's). If None, one is created from config["budget"]
+            order_queue: Queue collecting the BUY/SELL orders of this and other
+                graphs, submitted together later. If None, each run posts its
+                order right away (when paper trading is enabled)
         """
         self.debug = debug
-        self.config = config or DEFAULT_CONFIG
+        self.selected_analysts = list(selected_analysts)
+        # Work on a private copy so neither the caller's dict nor DEFAULT_CONFIG is mutated
+        self.config = copy.deepcopy(config or DEFAULT_CONFIG)
         self.config["llm_provider"] = self.config["llm_provider"].lower()
 
         provider = self.config["llm_provider"]
@@ -119,9 +154,13 @@ class TradingAgentsGraph:
         self.alpaca_client = AlpacaPaperClient(
             self.config.get("alpaca_paper_trading", {})
         )
-
-        # Update the interface's config
-        set_config(self.config)
+        self.order_queue = order_queue
+        # Sizes orders against the account's positions (fetched before each order)
+        self.execution_planner = (
+            ExecutionPlanner.from_config(self.alpaca_client, self.config)
+            if self.config.get("alpaca_paper_trading", {}).get("position_aware", True)
+            else None
+        )
 
         # Create necessary directories
         os.makedirs(
@@ -131,25 +170,42 @@ class TradingAgentsGraph:
 
         # Initialize LLMs
         provider = self.config["llm_provider"]
+        chat_model = _load_chat_model_class(provider)
         if provider in ("openai", "ollama", "openrouter", "deepseek"):
-            self.deep_thinking_llm = ChatOpenAI(
-                model=self.config["deep_think_llm"],
-                base_url=self.config["backend_url"],
-                api_key=self.config.get("llm_api_key"),
-            )
-            self.quick_thinking_llm = ChatOpenAI(
-                model=self.config["quick_think_llm"],
-                base_url=self.config["backend_url"],
-                api_key=self.config.get("llm_api_key"),
-            )
+            llm_kwargs = {
+                "base_url": self.config["backend_url"],
+                "api_key": self.config.get("llm_api_key"),
+            }
         elif provider == "anthropic":
-            self.deep_thinking_llm = ChatAnthropic(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
-            self.quick_thinking_llm = ChatAnthropic(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
-        elif provider == "google":
-            self.deep_thinking_llm = ChatGoogleGenerativeAI(model=self.config["deep_think_llm"])
-            self.quick_thinking_llm = ChatGoogleGenerativeAI(model=self.config["quick_think_llm"])
+            llm_kwargs = {"base_url": self.config["backend_url"]}
         else:
-            raise ValueError(f"Unsupported LLM provider: {self.config['llm_provider']}")
+            llm_kwargs = {}
+        self.deep_thinking_llm = chat_model(model=self.config["deep_think_llm"], **llm_kwargs)
+        self.quick_thinking_llm = chat_model(model=self.config["quick_think_llm"], **llm_kwargs)
+
+
+        def make_llm(model, max_tokens=None):
+            kwargs = dict(llm_kwargs)
+            if max_tokens is not None:
+                kwargs["max_tokens"] = max_tokens
+            return chat_model(model=model, **kwargs)
+
+        # Fast/mid/deep model tiers (None unless model routing is enabled)
+        tier_llms = build_tier_llms(
+            self.config, make_llm, self.quick_thinking_llm, self.deep_thinking_llm
+        )
+        graph_deep_llm = tier_llms["deep"] if tier_llms else self.deep_thinking_llm
+
+        # Per-run and per-batch token and cost limits (None when disabled)
+        self.budget_manager = budget_manager or BudgetManager.from_config(self.config)
+        if self.budget_manager is not None:
+            # Near the limit, deep-thinking calls fall back to a cheaper model
+            graph_deep_llm = BudgetedChatModel(
+                graph_deep_llm, tier_llms["mid"] if tier_llms else self.quick_thinking_llm
+            )
+        node_llms = {}
+        if tier_llms:
+            node_llms = route_nodes(self.config, {**tier_llms, "deep": graph_deep_llm})
         
         # Initialize memories
         self.bull_memory = FinancialSituationMemory("bull_memory", self.config)
@@ -161,11 +217,27 @@ class TradingAgentsGraph:
         # Create tool nodes
         self.tool_nodes = self._create_tool_nodes()
 
+        # Prompt budgets for the debate stage (None disables budgeting)
+        quick_context_budget = None
+        deep_context_budget = None
+        if self.config.get("context_budget", {}).get("enabled"):
+            quick_context_budget = ContextBudget(self.config["quick_think_llm"], self.config)
+            deep_context_budget = ContextBudget(self.config["deep_think_llm"], self.config)
+
+        fast_path = self.config.get("fast_path", {})
+        fast_path_threshold = (
+            fast_path.get("agreement_threshold", 0.6) if fast_path.get("enabled") else None
+        )
+
         # Initialize components
-        self.conditional_logic = ConditionalLogic()
+        self.conditional_logic = ConditionalLogic(
+            max_debate_rounds=self.config["max_debate_rounds"],
+            max_risk_discuss_rounds=self.config["max_risk_discuss_rounds"],
+            convergence_threshold=self.config.get("debate_convergence_threshold"),
+        )
         self.graph_setup = GraphSetup(
             self.quick_thinking_llm,
-            self.deep_thinking_llm,
+            graph_deep_llm,
             self.tool_nodes,
             self.bull_memory,
             self.bear_memory,
@@ -173,16 +245,23 @@ class TradingAgentsGraph:
             self.invest_judge_memory,
             self.risk_manager_memory,
             self.conditional_logic,
+            quick_context_budget,
+            deep_context_budget,
+            fast_path_threshold,
+            node_llms,
         )
 
-        self.propagator = Propagator()
-        self.reflector = Reflector(self.quick_thinking_llm)
-        self.signal_processor = SignalProcessor(self.quick_thinking_llm)
+        self.propagator = Propagator(self.config["max_recur_limit"])
+        self.reflector = Reflector(node_llms.get("Reflector", self.quick_thinking_llm))
+        self.signal_processor = SignalProcessor(
+            node_llms.get("Signal Processor", self.quick_thinking_llm)
+        )
 
         # State tracking
         self.curr_state = None
         self.ticker = None
-        self.log_states_dict = {}  # date to full state dict
+        self.state_log = get_state_log_writer()
+        self.tracer = Tracer.from_config(self.config)
 
         # Set up the graph
         self.graph = self.graph_setup.setup_graph(selected_analysts)
@@ -224,8 +303,13 @@ class TradingAgentsGraph:
             ),
         }
 
-    def propagate(self, company_name, trade_date):
-        """Run the trading agents graph for a company on a specific date."""
+    def propagate(self, company_name, trade_date, on_progress=None):
+        """Run the trading agents graph for a company on a specific date.
+
+        Args:
+            on_progress: Optional callable that receives progress events
+                (see ProgressTracker) while the graph runs
+        """
 
         self.ticker = company_name
 
@@ -235,39 +319,93 @@ class TradingAgentsGraph:
         )
         args = self.propagator.get_graph_args()
 
-        if self.debug:
-            # Debug mode with tracing
-            trace = []
-            for chunk in self.graph.stream(init_agent_state, **args):
-                if len(chunk["messages"]) == 0:
-                    pass
+        profile = RunProfile() if self.config.get("profile_runs", True) else None
+        callbacks = [profile] if profile is not None else []
+        if self.tracer is not None:
+            callbacks.append(TraceCallbackHandler())
+        budget = self.budget_manager.start_run() if self.budget_manager is not None else None
+        if budget is not None:
+            callbacks.append(budget)
+        if callbacks:
+            args["config"] = {**args["config"], "callbacks": callbacks}
+
+        final_state = None
+        with contextlib.ExitStack() as stack:
+            # Scope the dataflows config to this run so concurrent graphs stay isolated
+            stack.enter_context(use_config(self.config))
+            if profile is not None:
+                stack.enter_context(profile.activate())
+            if budget is not None:
+                stack.enter_context(budget.activate())
+            if self.tracer is not None:
+                stack.enter_context(
+                    self.tracer.trace(
+                        "propagate", ticker=company_name, trade_date=str(trade_date)
+                    )
+                )
+            # Warm the analysts' predictable tool calls while their first LLM turns run
+            stack.enter_context(
+                prefetch_run(company_name, trade_date, self.selected_analysts, self.config)
+            )
+            try:
+                if self.debug or on_progress is not None or budget is not None:
+                    # Stream so progress can be traced and reported as it happens
+                    # (and the reports so far survive a budget abort)
+                    tracker = ProgressTracker(self.selected_analysts)
+                    for chunk in self.graph.stream(init_agent_state, **args):
+                        if self.debug and len(chunk["messages"]) > 0:
+                            chunk["messages"][-1].pretty_print()
+                        if on_progress is not None:
+                            for event in tracker.update(chunk):
+                                on_progress(event)
+                        final_state = chunk
                 else:
-                    chunk["messages"][-1].pretty_print()
-                    trace.append(chunk)
+                    # Standard mode without progress reporting
+                    final_state = self.graph.invoke(init_agent_state, **args)
+            except BudgetExceededError as e:
+                # Abort cleanly: keep what was produced and hold the position
+                final_state = self._aborted_state(init_agent_state, final_state, str(e))
 
-            final_state = trace[-1]
-        else:
-            # Standard mode without tracing
-            final_state = self.graph.invoke(init_agent_state, **args)
+        if profile is not None:
+            final_state["run_profile"] = profile.to_dict()
+        if budget is not None:
+            final_state["budget"] = budget.to_dict()
 
         # Store current state for reflection
         self.curr_state = final_state
 
-        # Log state
-        self._log_state(trade_date, final_state)
-
         # Return decision and processed signal
-        decision = self.process_signal(final_state["final_trade_decision"])
-        order_result = self._maybe_execute_paper_trade(company_name, decision)
+        if budget is not None and budget.aborted:
+            decision = "HOLD"
+        else:
+            decision = self.process_signal(final_state["final_trade_decision"])
+        order_result = self._maybe_execute_paper_trade(company_name, decision, trade_date)
         if order_result:
             final_state["paper_trade_order"] = order_result
-            # Update log with order result
-            self._log_state(trade_date, final_state)
+
+        # Log state (written in the background)
+        self._log_state(trade_date, final_state)
         return final_state, decision
 
+    @staticmethod
+    def _aborted_state(init_state, partial_state, reason):
+        """Final state of a run stopped early, with a HOLD decision."""
+        state = {
+            **init_state,
+            "investment_plan": "",
+            "trader_investment_plan": "",
+            **(partial_state or {}),
+        }
+        for debate in ("investment_debate_state", "risk_debate_state"):
+            state[debate] = {"judge_decision": "", **state[debate]}
+        state["final_trade_decision"] = (
+            f"Run aborted: {reason}.\n\nFINAL TRANSACTION PROPOSAL: **HOLD**"
+        )
+        return state
+
     def _log_state(self, trade_date, final_state):
-        """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+        """Append the final state to the ticker's JSONL state log."""
+        record = {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -275,9 +413,7 @@ class TradingAgentsGraph:
             "news_report": final_state["news_report"],
             "fundamentals_report": final_state["fundamentals_report"],
             "investment_debate_state": {
-                "bull_history": final_state["investment_debate_state"]["bull_history"],
-                "bear_history": final_state["investment_debate_state"]["bear_history"],
-                "history": final_state["investment_debate_state"]["history"],
+                "history": final_state["investment_debate_history"],
                 "current_response": final_state["investment_debate_state"][
                     "current_response"
                 ],
@@ -287,51 +423,60 @@ class TradingAgentsGraph:
             },
             "trader_investment_decision": final_state["trader_investment_plan"],
             "risk_debate_state": {
-                "risky_history": final_state["risk_debate_state"]["risky_history"],
-                "safe_history": final_state["risk_debate_state"]["safe_history"],
-                "neutral_history": final_state["risk_debate_state"]["neutral_history"],
-                "history": final_state["risk_debate_state"]["history"],
+                "history": final_state["risk_debate_history"],
                 "judge_decision": final_state["risk_debate_state"]["judge_decision"],
             },
             "investment_plan": final_state["investment_plan"],
             "final_trade_decision": final_state["final_trade_decision"],
             "paper_trade_order": final_state.get("paper_trade_order"),
+            "run_profile": final_state.get("run_profile"),
+            "budget": final_state.get("budget"),
         }
 
-        # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/")
-        directory.mkdir(parents=True, exist_ok=True)
+        self.state_log.append(self.ticker, str(trade_date), record)
 
-        with open(
-            f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
-            "w",
-        ) as f:
-            json.dump(self.log_states_dict, f, indent=4)
+    def reflect_and_remember(self, returns_losses, state=None):
+        """Reflect on decisions and update memory based on returns.
 
-    def reflect_and_remember(self, returns_losses):
-        """Reflect on decisions and update memory based on returns."""
+        ``state`` is the final state of the run to reflect on, by default the
+        last one propagated.
+        """
+        state = self.curr_state if state is None else state
         self.reflector.reflect_bull_researcher(
-            self.curr_state, returns_losses, self.bull_memory
+            state, returns_losses, self.bull_memory
         )
         self.reflector.reflect_bear_researcher(
-            self.curr_state, returns_losses, self.bear_memory
+            state, returns_losses, self.bear_memory
         )
         self.reflector.reflect_trader(
-            self.curr_state, returns_losses, self.trader_memory
+            state, returns_losses, self.trader_memory
         )
         self.reflector.reflect_invest_judge(
-            self.curr_state, returns_losses, self.invest_judge_memory
+            state, returns_losses, self.invest_judge_memory
         )
         self.reflector.reflect_risk_manager(
-            self.curr_state, returns_losses, self.risk_manager_memory
+            state, returns_losses, self.risk_manager_memory
         )
 
     def process_signal(self, full_signal):
         """Process a signal to extract the core decision."""
         return self.signal_processor.process_signal(full_signal)
 
-    def _maybe_execute_paper_trade(self, symbol: str, decision: str):
-        """Send a paper order to Alpaca if enabled and decision is actionable."""
+    def _maybe_execute_paper_trade(self, symbol: str, decision: str, trade_date=None):
+        """Send a paper order to Alpaca if enabled and decision is actionable.
+
+        With an order queue, the order is queued for a later batch submission.
+        """
+        if self.order_queue is not None:
+            order = self.order_queue.add(
+                symbol, decision, qty=self._order_qty(), trade_date=trade_date
+            )
+            if order is None:
+                return {"status": "skipped", "reason": f"Non-actionable decision: {decision}"}
+            if order.status == "skipped":
+                return {"status": "skipped", "reason": order.error}
+            return {"status": "queued", "client_order_id": order.client_order_id}
+
         if not self.alpaca_client or not self.alpaca_client.is_ready():
             return {"status": "skipped", "reason": "Alpaca paper trading disabled or missing keys"}
 
@@ -339,10 +484,21 @@ class TradingAgentsGraph:
         if side not in ("buy", "sell"):
             return {"status": "skipped", "reason": f"Non-actionable decision: {decision}"}
 
-        qty = None
+        if self.execution_planner is None:
+            return self.alpaca_client.submit_order(symbol, side, qty=self._order_qty(), order_type="market")
+
         try:
-            qty = float(self.config.get("alpaca_paper_trading", {}).get("order_qty") or 1)
+            orders = self.execution_planner.plan([(symbol, decision, trade_date)])
+        except Exception as e:
+            return {"status": "error", "error": f"Could not plan the order: {e}"}
+        if not orders:
+            return {"status": "skipped", "reason": f"Position in {symbol} already at its {decision} target"}
+        order = orders[0]
+        result = self.alpaca_client.submit_order(symbol, order.side, qty=order.qty, order_type="market")
+        return {**result, "plan": order.to_dict()}
+
+    def _order_qty(self) -> float:
+        try:
+            return float(self.config.get("alpaca_paper_trading", {}).get("order_qty") or 1)
         except Exception:
-            qty = 1
-
-        return self.alpaca_client.submit_order(symbol, side, qty=qty, order_type="market")
+            return 1
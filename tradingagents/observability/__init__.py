@@ -0,0 +1,12 @@
+from .profiling import RunProfile, aggregate_profiles, format_profile, record_cache_hit
+from .tracing import Span, Tracer, span
+
+__all__ = [
+    "RunProfile",
+    "aggregate_profiles",
+    "format_profile",
+    "record_cache_hit",
+    "Span",
+    "Tracer",
+    "span",
+]
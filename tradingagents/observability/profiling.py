@@ -0,0 +1,220 @@
+# TradingAgents/observability/profiling.py
+
+import contextlib
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+# Per-node counters, in report order
+STAT_FIELDS = ["calls", "wall_s", "llm_calls", "prompt_tokens", "completion_tokens", "tool_calls", "cache_hits"]
+# Per-model counters (wall_s is the summed latency of the model's calls)
+MODEL_FIELDS = ["llm_calls", "wall_s", "prompt_tokens", "completion_tokens"]
+
+_current_profile: ContextVar[Optional["RunProfile"]] = ContextVar("run_profile", default=None)
+_current_node: ContextVar[Optional[str]] = ContextVar("profiled_node", default=None)
+
+
+def _new_stats() -> Dict[str, Any]:
+    return {field: 0 for field in STAT_FIELDS}
+
+
+def token_usage(response) -> Dict[str, int]:
+    """Prompt and completion tokens of an LLM response, from its metadata."""
+    prompt = completion = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                prompt += usage.get("input_tokens", 0)
+                completion += usage.get("output_tokens", 0)
+    if not prompt and not completion:
+        # Providers that only report usage in llm_output (OpenAI style)
+        usage = (response.llm_output or {}).get("token_usage") or {}
+        prompt = usage.get("prompt_tokens", 0)
+        completion = usage.get("completion_tokens", 0)
+    return {"prompt_tokens": prompt, "completion_tokens": completion}
+
+
+def model_name(metadata: Optional[Dict[str, Any]], invocation_params: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Model of an LLM call, from its callback arguments."""
+    params = invocation_params or {}
+    return params.get("model") or params.get("model_name") or (metadata or {}).get("ls_model_name")
+
+
+class RunProfile(BaseCallbackHandler):
+    """Wall time, LLM calls, tokens, tool calls and cache hits of one run, per
+    node, plus LLM calls, latency and tokens per model.
+
+    Pass it as a callback of the graph run to count LLM and tool calls, and
+    activate it with ``profile.activate()`` so the nodes wrapped by
+    ``profile_node`` record their wall time and cache hits against it.
+    """
+
+    def __init__(self):
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.models: Dict[str, Dict[str, Any]] = {}
+        self.wall_s = 0.0
+        self._llm_runs: Dict[Any, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, node: Optional[str]) -> Dict[str, Any]:
+        return self.nodes.setdefault(node or "(outside nodes)", _new_stats())
+
+    @contextlib.contextmanager
+    def activate(self):
+        """Record the enclosed run against this profile."""
+        token = _current_profile.set(self)
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.wall_s += time.perf_counter() - start
+            _current_profile.reset(token)
+
+    def record_node(self, node: str, wall_s: float):
+        with self._lock:
+            stats = self._stats(node)
+            stats["calls"] += 1
+            stats["wall_s"] += wall_s
+
+    def record_cache_hit(self, node: Optional[str]):
+        with self._lock:
+            self._stats(node)["cache_hits"] += 1
+
+    @staticmethod
+    def _node(metadata: Optional[Dict[str, Any]]) -> Optional[str]:
+        return (metadata or {}).get("langgraph_node") or _current_node.get()
+
+    def _start_llm(self, run_id, metadata, invocation_params):
+        model = model_name(metadata, invocation_params) or "unknown"
+        with self._lock:
+            self._llm_runs[run_id] = (self._node(metadata), model, time.perf_counter())
+
+    def _end_llm(self, run_id, prompt_tokens: int = 0, completion_tokens: int = 0):
+        with self._lock:
+            node, model, start = self._llm_runs.pop(run_id, (None, "unknown", None))
+            for stats in (self._stats(node), self.models.setdefault(model, {field: 0 for field in MODEL_FIELDS})):
+                stats["llm_calls"] += 1
+                stats["prompt_tokens"] += prompt_tokens
+                stats["completion_tokens"] += completion_tokens
+            if start is not None:
+                self.models[model]["wall_s"] += time.perf_counter() - start
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, metadata=None, invocation_params=None, **kwargs):
+        self._start_llm(run_id, metadata, invocation_params)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, metadata=None, invocation_params=None, **kwargs):
+        self._start_llm(run_id, metadata, invocation_params)
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        usage = token_usage(response)
+        self._end_llm(run_id, usage["prompt_tokens"], usage["completion_tokens"])
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._end_llm(run_id)
+
+    def on_tool_start(self, serialized, input_str, *, run_id, metadata=None, **kwargs):
+        with self._lock:
+            self._stats(self._node(metadata))["tool_calls"] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Totals and per-node counters, with wall times rounded to microseconds."""
+        with self._lock:
+            nodes = {name: dict(stats) for name, stats in self.nodes.items()}
+            models = {name: dict(stats) for name, stats in self.models.items()}
+        for stats in list(nodes.values()) + list(models.values()):
+            stats["wall_s"] = round(stats["wall_s"], 6)
+        totals = {field: sum(stats[field] for stats in nodes.values()) for field in STAT_FIELDS[2:]}
+        return {"wall_s": round(self.wall_s, 6), **totals, "nodes": nodes, "models": models}
+
+
+def profile_node(name: str, node: Any) -> Callable:
+    """Wrap a graph node (a function of the state or a runnable such as a
+    ToolNode) so it records its wall time in the active RunProfile."""
+    invoke = node.invoke if hasattr(node, "invoke") else None
+
+    def profiled(state, config):
+        profile = _current_profile.get()
+        if profile is None:
+            return invoke(state, config) if invoke else node(state)
+        token = _current_node.set(name)
+        start = time.perf_counter()
+        try:
+            return invoke(state, config) if invoke else node(state)
+        finally:
+            profile.record_node(name, time.perf_counter() - start)
+            _current_node.reset(token)
+
+    profiled.__name__ = getattr(node, "__name__", name)
+    return profiled
+
+
+def record_cache_hit():
+    """Count a data cache hit against the running node, if a run is profiled."""
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.record_cache_hit(_current_node.get())
+
+
+def aggregate_profiles(profiles: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Sum the profiles (``RunProfile.to_dict()``) of a batch of runs.
+
+    Adds the number of runs and, per node, its share of the total node wall
+    time and its mean wall time and tokens per run; per model, the mean
+    latency of its calls.
+    """
+    profiles = [profile for profile in profiles if profile]
+    nodes: Dict[str, Dict[str, Any]] = {}
+    models: Dict[str, Dict[str, Any]] = {}
+    for profile in profiles:
+        for name, stats in profile.get("nodes", {}).items():
+            total = nodes.setdefault(name, _new_stats())
+            for field in STAT_FIELDS:
+                total[field] += stats.get(field, 0)
+        for name, stats in profile.get("models", {}).items():
+            total = models.setdefault(name, {field: 0 for field in MODEL_FIELDS})
+            for field in MODEL_FIELDS:
+                total[field] += stats.get(field, 0)
+
+    runs = len(profiles)
+    node_wall = sum(stats["wall_s"] for stats in nodes.values())
+    for stats in nodes.values():
+        stats["wall_share"] = stats["wall_s"] / node_wall if node_wall else 0.0
+        stats["wall_s_per_run"] = stats["wall_s"] / runs
+        stats["tokens_per_run"] = (stats["prompt_tokens"] + stats["completion_tokens"]) / runs
+    for stats in models.values():
+        stats["latency_s_per_call"] = stats["wall_s"] / stats["llm_calls"] if stats["llm_calls"] else 0.0
+    totals = {field: sum(stats[field] for stats in nodes.values()) for field in STAT_FIELDS[2:]}
+    return {
+        "runs": runs,
+        "wall_s": sum(profile.get("wall_s", 0.0) for profile in profiles),
+        **totals,
+        "nodes": dict(sorted(nodes.items(), key=lambda item: -item[1]["wall_s"])),
+        "models": models,
+    }
+
+
+def format_profile(profile: Dict[str, Any]) -> str:
+    """Per-node table of a run profile or of an aggregate, slowest node first."""
+    lines = [f"{'node':24} {'calls':>6} {'wall s':>9} {'llm':>5} {'prompt tok':>11} {'compl tok':>10} {'tools':>6} {'cache':>6}"]
+    nodes = sorted(profile.get("nodes", {}).items(), key=lambda item: -item[1]["wall_s"])
+    for name, stats in nodes + [("TOTAL", {**profile, "calls": sum(s["calls"] for _, s in nodes)})]:
+        lines.append(
+            f"{name[:24]:24} {stats['calls']:>6} {stats['wall_s']:>9.3f} {stats['llm_calls']:>5} "
+            f"{stats['prompt_tokens']:>11} {stats['completion_tokens']:>10} {stats['tool_calls']:>6} "
+            f"{stats['cache_hits']:>6}"
+        )
+    if profile.get("models"):
+        lines += ["", f"{'model':32} {'llm':>5} {'latency s':>10} {'s/call':>7} {'prompt tok':>11} {'compl tok':>10}"]
+        for name, stats in sorted(profile["models"].items(), key=lambda item: -item[1]["wall_s"]):
+            per_call = stats["wall_s"] / stats["llm_calls"] if stats["llm_calls"] else 0.0
+            lines.append(
+                f"{name[:32]:32} {stats['llm_calls']:>5} {stats['wall_s']:>10.3f} {per_call:>7.3f} "
+                f"{stats['prompt_tokens']:>11} {stats['completion_tokens']:>10}"
+            )
+    if "runs" in profile:
+        lines.append(f"Runs: {profile['runs']}")
+    return "\n".join(lines)
@@ -0,0 +1,268 @@
+# TradingAgents/observability/tracing.py
+
+import contextlib
+import json
+import os
+import secrets
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from .profiling import model_name, token_usage
+
+# OTLP span kinds and status codes
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+# Longest string attribute value kept (tool inputs can be long)
+MAX_ATTRIBUTE_LENGTH = 1000
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("trace_span", default=None)
+
+
+def _attribute_value(value: Any) -> Dict[str, Any]:
+    """A value in OTLP JSON's AnyValue encoding."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # 64-bit integers are strings in OTLP JSON
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_attribute_value(item) for item in value]}}
+    return {"stringValue": str(value)[:MAX_ATTRIBUTE_LENGTH]}
+
+
+def _attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {"key": key, "value": _attribute_value(value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+
+class Span:
+    """One timed operation of a trace, with attributes and a status."""
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        parent: Optional["Span"] = None,
+        kind: int = SPAN_KIND_INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.trace_id = parent.trace_id if parent is not None else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent = parent
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.status = STATUS_OK
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def set_error(self, error: BaseException):
+        self.status = STATUS_ERROR
+        self.status_message = f"{type(error).__name__}: {error}"
+
+    def end(self):
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            self.tracer._finish(self)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": _attributes(self.attributes),
+            "status": {"code": self.status},
+        }
+        if self.parent is not None:
+            span["parentSpanId"] = self.parent.span_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+
+class Tracer:
+    """Collects the spans of each trace and appends finished traces to a file.
+
+    Every trace is written as one line of OTLP JSON (an
+    ExportTraceServiceRequest, as the OpenTelemetry file exporter writes), so
+    the file can be loaded by OTLP-aware tools without running a collector.
+    """
+
+    def __init__(self, path: str, service_name: str = "tradingagents"):
+        self.path = path
+        self.service_name = service_name
+        self._spans: Dict[str, List[Span]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["Tracer"]:
+        """The tracer configured by ``config["tracing"]``, or None when disabled."""
+        settings = config.get("tracing") or {}
+        if not settings.get("enabled"):
+            return None
+        path = settings.get("path") or os.path.join(config.get("results_dir", "."), "traces.jsonl")
+        return cls(path, settings.get("service_name", "tradingagents"))
+
+    @contextlib.contextmanager
+    def trace(self, name: str, **attributes):
+        """Start a new trace whose root span encloses the block."""
+        root = Span(self, name, attributes=attributes)
+        token = _current_span.set(root)
+        try:
+            yield root
+        except BaseException as e:
+            root.set_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            root.end()
+            self.export(root.trace_id)
+
+    def _finish(self, span: Span):
+        with self._lock:
+            self._spans.setdefault(span.trace_id, []).append(span)
+
+    def export(self, trace_id: str):
+        """Append the finished spans of a trace to the file."""
+        with self._lock:
+            spans = self._spans.pop(trace_id, [])
+            if not spans:
+                return
+            request = {
+                "resourceSpans": [
+                    {
+                        "resource": {"attributes": _attributes({"service.name": self.service_name})},
+                        "scopeSpans": [
+                            {
+                                "scope": {"name": "tradingagents"},
+                                "spans": [span.to_otlp() for span in sorted(spans, key=lambda s: s.start_ns)],
+                            }
+                        ],
+                    }
+                ]
+            }
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(json.dumps(request) + "\n")
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+@contextlib.contextmanager
+def span(name: str, kind: int = SPAN_KIND_INTERNAL, **attributes):
+    """Child span of the current span for the block; a no-op outside a trace.
+
+    Yields the span (None when not tracing) so attributes can be added.
+    """
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+    child = Span(parent.tracer, name, parent, kind, attributes)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.set_error(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        child.end()
+
+
+def trace_node(name: str, node: Callable) -> Callable:
+    """Wrap a graph node function of (state, config) in a span."""
+
+    def traced(state, config):
+        if _current_span.get() is None:
+            return node(state, config)
+        with span(f"node {name}", **{"langgraph.node": name}):
+            return node(state, config)
+
+    traced.__name__ = getattr(node, "__name__", name)
+    return traced
+
+
+class TraceCallbackHandler(BaseCallbackHandler):
+    """Records LLM and tool calls as spans under the node that made them.
+
+    Tool spans become the current span while the tool runs, so vendor
+    routing inside the tool nests under it.
+    """
+
+    def __init__(self):
+        self._spans: Dict[Any, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _start(self, run_id, name: str, kind: int, attributes: Dict[str, Any], activate: bool = False):
+        parent = _current_span.get()
+        if parent is None:
+            return
+        child = Span(parent.tracer, name, parent, kind, attributes)
+        if activate:
+            _current_span.set(child)
+        with self._lock:
+            self._spans[run_id] = (child, parent if activate else None)
+
+    def _end(self, run_id, error: Optional[BaseException] = None, **attributes):
+        with self._lock:
+            entry = self._spans.pop(run_id, None)
+        if entry is None:
+            return
+        child, restore = entry
+        for key, value in attributes.items():
+            child.set_attribute(key, value)
+        if error is not None:
+            child.set_error(error)
+        if restore is not None and _current_span.get() is child:
+            _current_span.set(restore)
+        child.end()
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, metadata=None, invocation_params=None, **kwargs):
+        model = model_name(metadata, invocation_params)
+        self._start(run_id, "llm", SPAN_KIND_CLIENT, {"llm.model": model, "llm.messages": len(messages[0]) if messages else 0})
+
+    def on_llm_start(self, serialized, prompts, *, run_id, metadata=None, **kwargs):
+        self._start(run_id, "llm", SPAN_KIND_CLIENT, {"llm.model": (metadata or {}).get("ls_model_name")})
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        usage = token_usage(response)
+        self._end(
+            run_id,
+            **{"llm.prompt_tokens": usage["prompt_tokens"], "llm.completion_tokens": usage["completion_tokens"]},
+        )
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._end(run_id, error)
+
+    def on_tool_start(self, serialized, input_str, *, run_id, **kwargs):
+        name = (serialized or {}).get("name") or kwargs.get("name") or "tool"
+        self._start(run_id, f"tool {name}", SPAN_KIND_INTERNAL, {"tool.name": name, "tool.input": input_str}, activate=True)
+
+    def on_tool_end(self, output, *, run_id, **kwargs):
+        self._end(run_id)
+
+    def on_tool_error(self, error, *, run_id, **kwargs):
+        self._end(run_id, error)
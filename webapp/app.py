@@ -1,13 +1,19 @@
+import copy
+import json
 import os
+import threading
 from pathlib import Path
 from typing import Dict, Any, List
 
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, jsonify, request, send_from_directory, stream_with_context
 from dotenv import load_dotenv
 
 from tradingagents.default_config import DEFAULT_CONFIG
 from tradingagents.graph.trading_graph import TradingAgentsGraph
 
+from .graph_pool import GraphPool
+from .jobs import JobQueue, QueueFullError
+
 # Load environment keys (OPENAI_API_KEY, DEEPSEEK_API_KEY, etc.)
 load_dotenv()
 
@@ -109,7 +115,7 @@ DEEP_AGENT_OPTIONS = {
 
 def _build_config(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Create a config dict compatible with TradingAgentsGraph from the web payload."""
-    config = DEFAULT_CONFIG.copy()
+    config = copy.deepcopy(DEFAULT_CONFIG)
     research_depth = int(payload.get("research_depth", config["max_debate_rounds"]))
     config["max_debate_rounds"] = research_depth
     config["max_risk_discuss_rounds"] = research_depth
@@ -142,9 +148,72 @@ def _extract_reports(state: Dict[str, Any]) -> Dict[str, Any]:
     return {k: state.get(k) for k in keys if k in state}
 
 
+def _run_job(payload: Dict[str, Any], emit) -> Dict[str, Any]:
+    """Run one analysis job on a worker thread, emitting its progress events."""
+    analysts: List[str] = payload.get("analysts") or [
+        option["value"] for option in ANALYST_OPTIONS
+    ]
+
+    config = _build_config(payload)
+    debug = bool(payload.get("debug", False))
+
+    # Graphs only depend on these settings, so equal keys share built graphs
+    key = (
+        config["llm_provider"],
+        config["backend_url"],
+        config["quick_think_llm"],
+        config["deep_think_llm"],
+        tuple(analysts),
+        config["max_debate_rounds"],
+        debug,
+    )
+    with _graph_pool.checkout(
+        key, selected_analysts=analysts, config=config, debug=debug
+    ) as graph:
+        final_state, decision = graph.propagate(
+            payload["ticker"], payload["analysis_date"], on_progress=emit
+        )
+        log_file = graph.state_log.log_path(payload["ticker"])
+
+    return {
+        "decision": decision,
+        "reports": _extract_reports(final_state),
+        "log_file": str(log_file),
+    }
+
+
+_graph_pool = GraphPool(
+    TradingAgentsGraph, max_idle=int(os.getenv("TRADINGAGENTS_GRAPH_POOL_SIZE", "4"))
+)
+
+_job_queue = None
+_job_queue_lock = threading.Lock()
+
+
+def _get_job_queue() -> JobQueue:
+    """Create the job queue on first use (workers start with the first job)."""
+    global _job_queue
+    with _job_queue_lock:
+        if _job_queue is None:
+            db_path = Path(
+                os.getenv(
+                    "TRADINGAGENTS_JOBS_DB",
+                    os.path.join(DEFAULT_CONFIG["results_dir"], "webapp_jobs.sqlite3"),
+                )
+            )
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            _job_queue = JobQueue(
+                _run_job,
+                str(db_path),
+                workers=int(os.getenv("TRADINGAGENTS_WEB_WORKERS", "2")),
+                max_queued=int(os.getenv("TRADINGAGENTS_WEB_QUEUE_SIZE", "16")),
+            )
+        return _job_queue
+
+
 @app.get("/health")
 def health():
-    return jsonify({"status": "ok"})
+    return jsonify({"status": "ok", "graph_pool": _graph_pool.stats()})
 
 
 @app.get("/")
@@ -169,9 +238,8 @@ def metadata():
     )
 
 
-@app.post("/run")
-def run_analysis():
-    payload = request.get_json(silent=True) or {}
+def _validate_payload(payload: Dict[str, Any]):
+    """Return an error response for a /run payload, or None when it is valid."""
     required = [
         "ticker",
         "analysis_date",
@@ -188,37 +256,76 @@ def run_analysis():
             ),
             400,
         )
+    return None
 
-    analysts: List[str] = payload.get("analysts") or [
-        option["value"] for option in ANALYST_OPTIONS
-    ]
 
-    config = _build_config(payload)
+def _queue_full_response(exc: QueueFullError):
+    response = jsonify({"error": str(exc)})
+    response.headers["Retry-After"] = "30"
+    return response, 429
+
+
+@app.post("/run")
+def run_analysis():
+    payload = request.get_json(silent=True) or {}
+    error = _validate_payload(payload)
+    if error is not None:
+        return error
 
     try:
-        graph = TradingAgentsGraph(
-            selected_analysts=analysts,
-            config=config,
-            debug=bool(payload.get("debug", False)),
-        )
-        final_state, decision = graph.propagate(
-            payload["ticker"], payload["analysis_date"]
-        )
-    except Exception as exc:  # pragma: no cover - surfaced to the client
-        return jsonify({"error": str(exc)}), 500
+        job_id = _get_job_queue().submit(payload)
+    except QueueFullError as exc:
+        return _queue_full_response(exc)
 
-    log_file = Path(
-        f"eval_results/{payload['ticker']}/TradingAgentsStrategy_logs/full_states_log_{payload['analysis_date']}.json"
+    return (
+        jsonify(
+            {"job_id": job_id, "status": "queued", "status_url": f"/jobs/{job_id}"}
+        ),
+        202,
     )
 
-    return jsonify(
-        {
-            "decision": decision,
-            "reports": _extract_reports(final_state),
-            "log_file": str(log_file),
-        }
+
+@app.post("/run/stream")
+def run_analysis_stream():
+    """Queue an analysis and stream its progress as server-sent events."""
+    payload = request.get_json(silent=True) or {}
+    error = _validate_payload(payload)
+    if error is not None:
+        return error
+
+    jobs = _get_job_queue()
+    try:
+        job_id = jobs.submit(payload, stream=True)
+    except QueueFullError as exc:
+        return _queue_full_response(exc)
+
+    def generate():
+        yield _sse({"type": "job", "job_id": job_id, "status": "queued"})
+        for event in jobs.events(job_id):
+            if event["type"] == "heartbeat":
+                yield ": heartbeat\n\n"
+            else:
+                yield _sse(event)
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
+def _sse(event: Dict[str, Any]) -> str:
+    """Format an event as a server-sent event message."""
+    return f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+
+
+@app.get("/jobs/<job_id>")
+def job_status(job_id: str):
+    job = _get_job_queue().get(job_id)
+    if job is None:
+        return jsonify({"error": f"Unknown job: {job_id}"}), 404
+    return jsonify(job)
+
+
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=int(os.getenv("PORT", 8000)), debug=True)
@@ -0,0 +1,62 @@
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, List
+
+
+class GraphPool:
+    """Thread-safe LRU pool of built graphs, keyed by their configuration.
+
+    A checked-out graph is used by one job at a time. Once released, it goes
+    back to the pool and is reused by the next job with the same key. When
+    more than ``max_idle`` graphs sit idle, the least recently used are
+    dropped.
+    """
+
+    def __init__(self, factory: Callable[..., Any], max_idle: int = 4):
+        self.factory = factory
+        self.max_idle = max(0, max_idle)
+        self._idle: "OrderedDict[Hashable, List[Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @contextmanager
+    def checkout(self, key: Hashable, **factory_kwargs) -> Iterator[Any]:
+        """Borrow a graph for ``key``, building one with the factory if none is idle."""
+        graph = None
+        with self._lock:
+            graphs = self._idle.get(key)
+            if graphs:
+                graph = graphs.pop()
+                if not graphs:
+                    del self._idle[key]
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if graph is None:
+            # Build outside the lock so other keys are not blocked
+            graph = self.factory(**factory_kwargs)
+
+        yield graph
+        # Only reached when the job succeeded; a graph whose run failed
+        # half-way is dropped rather than returned to the pool
+        self._release(key, graph)
+
+    def _release(self, key: Hashable, graph: Any):
+        with self._lock:
+            self._idle.setdefault(key, []).append(graph)
+            self._idle.move_to_end(key)
+            while self.idle_count() > self.max_idle:
+                oldest_key, graphs = next(iter(self._idle.items()))
+                graphs.pop(0)
+                if not graphs:
+                    del self._idle[oldest_key]
+
+    def idle_count(self) -> int:
+        return sum(len(graphs) for graphs in self._idle.values())
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"idle": self.idle_count(), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,200 @@
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+)
+"""
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+class JobQueue:
+    """Bounded job queue with a worker thread pool and SQLite-persisted status.
+
+    Jobs move through queued -> running -> succeeded/failed. Jobs that were
+    still queued or running when the process died are marked interrupted on
+    the next start.
+
+    The runner is called as ``runner(payload, emit)``; ``emit(event)`` forwards
+    progress events to a subscriber when the job was submitted with
+    ``stream=True`` and is a no-op otherwise.
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[Dict[str, Any], Callable[[Dict[str, Any]], None]], Dict[str, Any]],
+        db_path: str,
+        workers: int = 2,
+        max_queued: int = 16,
+    ):
+        self.runner = runner
+        self.db_path = db_path
+        self.workers = max(1, workers)
+        self._queue: "queue.Queue[str]" = queue.Queue(maxsize=max(1, max_queued))
+        self._db_lock = threading.Lock()
+        self._threads = []
+        self._started = False
+        self._start_lock = threading.Lock()
+        self._channels: Dict[str, "queue.Queue[Dict[str, Any]]"] = {}
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._db_lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.execute(
+                "UPDATE jobs SET status = 'interrupted', finished_at = ? "
+                "WHERE status IN ('queued', 'running')",
+                (time.time(),),
+            )
+
+    def submit(self, payload: Dict[str, Any], stream: bool = False) -> str:
+        """Persist and enqueue a job, raising QueueFullError when at capacity.
+
+        With stream=True the job's progress events can be read with events().
+        """
+        self._ensure_workers()
+        job_id = uuid.uuid4().hex
+        with self._db_lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (id, status, payload, created_at) VALUES (?, 'queued', ?, ?)",
+                (job_id, json.dumps(payload), time.time()),
+            )
+        if stream:
+            # Open the channel before the job can start so no event is lost
+            self._channels[job_id] = queue.Queue()
+        try:
+            self._queue.put_nowait(job_id)
+        except queue.Full:
+            self._channels.pop(job_id, None)
+            with self._db_lock, self._conn:
+                self._conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+            raise QueueFullError(
+                f"Job queue is full ({self._queue.maxsize} pending); retry later"
+            )
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return a job's status (and result or error once finished)."""
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT * FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        job = {
+            "job_id": row["id"],
+            "status": row["status"],
+            "created_at": row["created_at"],
+            "started_at": row["started_at"],
+            "finished_at": row["finished_at"],
+        }
+        if row["result"] is not None:
+            job["result"] = json.loads(row["result"])
+        if row["error"] is not None:
+            job["error"] = row["error"]
+        return job
+
+    def events(self, job_id: str, heartbeat: float = 15.0) -> Iterator[Dict[str, Any]]:
+        """Yield a streamed job's events until it finishes.
+
+        A ``heartbeat`` event is yielded whenever nothing happened for
+        ``heartbeat`` seconds. Closing the iterator stops event delivery.
+        """
+        channel = self._channels.get(job_id)
+        if channel is None:
+            return
+        try:
+            while True:
+                try:
+                    event = channel.get(timeout=heartbeat)
+                except queue.Empty:
+                    yield {"type": "heartbeat"}
+                    continue
+                yield event
+                if event["type"] in ("done", "error"):
+                    return
+        finally:
+            self._channels.pop(job_id, None)
+
+    def _emit(self, job_id: str, event: Dict[str, Any]):
+        channel = self._channels.get(job_id)
+        if channel is not None:
+            channel.put(event)
+
+    def pending(self) -> int:
+        """Number of jobs waiting for a worker."""
+        return self._queue.qsize()
+
+    def _ensure_workers(self):
+        with self._start_lock:
+            if self._started:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(
+                    target=self._work, name=f"job-worker-{i}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+            self._started = True
+
+    def _update(self, job_id: str, **fields):
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._db_lock, self._conn:
+            self._conn.execute(
+                f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id)
+            )
+
+    def _work(self):
+        while True:
+            job_id = self._queue.get()
+            try:
+                with self._db_lock:
+                    row = self._conn.execute(
+                        "SELECT payload FROM jobs WHERE id = ?", (job_id,)
+                    ).fetchone()
+                if row is None:
+                    continue
+                self._update(job_id, status="running", started_at=time.time())
+                self._emit(job_id, {"type": "job", "job_id": job_id, "status": "running"})
+                try:
+                    result = self.runner(
+                        json.loads(row["payload"]),
+                        lambda event: self._emit(job_id, event),
+                    )
+                except Exception as exc:
+                    logger.exception("Job %s failed", job_id)
+                    self._update(
+                        job_id, status="failed", error=str(exc), finished_at=time.time()
+                    )
+                    self._emit(job_id, {"type": "error", "error": str(exc)})
+                else:
+                    self._update(
+                        job_id,
+                        status="succeeded",
+                        result=json.dumps(result, default=str),
+                        finished_at=time.time(),
+                    )
+                    self._emit(job_id, {"type": "done", "result": result})
+            finally:
+                self._queue.task_done()